@@ -1,6 +1,19 @@
 """The cosmic boundary ring: a deformable closed loop of radii. All per-vertex state is numpy;
 per-cloud interactions (deformation accumulation, containment) are vectorized over the
 universe's CloudField, while the handful of compact objects (holes, neutron stars) stay scalar.
+
+Every ring has the same BARRIER_POINT_COUNT vertices, so the multiverse keeps them stacked: a
+BarrierBank holds radii, radii_vel, flash, the deformation accumulator and the centers of
+every live ring as (U x points) / (U x 2) arrays, and each Barrier is a row of it — its
+`radii`, `radii_vel` and `flash` are views onto the bank. The per-universe passes (what dents
+a given wall) fill their own row; the wall's own dynamics — damping, the Laplacian membrane
+tension and the flash decay — run once, vectorized, for the whole multiverse
+(BarrierBank.integrate). Multiverse-level readers (contact resolution, culling) take centers
+and mean/max radii straight off the bank.
+
+A ring's center is its universe's origin in the multiverse: everything inside the universe
+(cloud rows, compact objects, pulse origins) is stored relative to it, so the per-universe
+passes here never subtract a center, and moving a universe is just moving its center.
 """
 import math
 import random
@@ -10,41 +23,205 @@ import numpy as np
 from sim.config import *
 
 
-class Barrier:
-    def __init__(self, center, screen_size, num_points):
-        self.center = center
+# The row-parallel bank arrays: four (U x points) per-vertex columns, then the (U x 2) centers.
+_COLUMNS = ('radii', 'radii_vel', 'flash', 'accum', 'centers')
+
+
+class BarrierBank:
+    """Stacked per-vertex state for every live ring of one multiverse. Rows are packed
+    [0, n): releasing a ring moves the last row into its slot (the moved Barrier's `row` is
+    updated), so whole-bank passes are plain slices."""
+
+    def __init__(self, num_points=BARRIER_POINT_COUNT, cap=4):
         self.num_points = num_points
         self.angles = (2 * math.pi / num_points) * np.arange(num_points)
         self.cos_a = np.cos(self.angles)
         self.sin_a = np.sin(self.angles)
+        self.n = 0
+        self.cap = cap
+        self.owners = []  # Barrier per row
+        self.radii = np.zeros((cap, num_points))
+        self.radii_vel = np.zeros((cap, num_points))
+        self.flash = np.zeros((cap, num_points))  # per-vertex impact glow, 1 -> 0
+        self.accum = np.zeros((cap, num_points))  # dents accumulated this frame, spent by integrate()
+        self.centers = np.zeros((cap, 2))  # each universe's origin in the multiverse
+
+    def _resize(self, new_cap):
+        """Reallocate every bank array at new_cap, keeping rows [0, n)."""
+        n = self.n
+        for name in _COLUMNS:
+            old = getattr(self, name)
+            fresh = np.zeros((new_cap,) + old.shape[1:])
+            fresh[:n] = old[:n]
+            setattr(self, name, fresh)
+        self.cap = new_cap
+
+    def add(self, barrier):
+        if self.n == self.cap:
+            self._resize(self.cap * 2)
+        row = self.n
+        self.n += 1
+        self.owners.append(barrier)
+        for name in _COLUMNS:
+            getattr(self, name)[row] = 0.0
+        return row
+
+    def release(self, barrier):
+        """Free a ring's row (its universe is gone)."""
+        row, last = barrier.row, self.n - 1
+        assert row is not None and self.owners[row] is barrier, "ring is not in this bank"
+        if row != last:
+            for name in _COLUMNS:
+                arr = getattr(self, name)
+                arr[row] = arr[last]
+            moved = self.owners[last]
+            assert moved.row == last
+            moved.row = row
+            self.owners[row] = moved
+            # The moved ring now reads its new row: the state it had in the (not yet reused)
+            # last row, untouched.
+            assert (np.array_equal(moved.radii, self.radii[last])
+                    and np.array_equal(moved.radii_vel, self.radii_vel[last])
+                    and np.array_equal(moved.flash, self.flash[last])
+                    and moved.center == tuple(self.centers[last]))
+        self.owners.pop()
+        self.n -= 1
+        barrier.row = None
+
+    def radius_at(self, rows, angles):
+        """Ring radius of ring `rows[k]` at `angles[k]`, for paired arrays (the bank-wide twin
+        of Barrier.radius_at: same linear interpolation between vertices)."""
+        step = 2 * math.pi / self.num_points
+        idx = (np.asarray(angles) % (2 * math.pi)) / step
+        i0 = idx.astype(np.int64) % self.num_points
+        i1 = (i0 + 1) % self.num_points
+        t = idx - np.floor(idx)
+        return self.radii[rows, i0] * (1 - t) + self.radii[rows, i1] * t
+
+    def mean_radii(self):
+        return self.radii[:self.n].mean(axis=1)
+
+    def max_radii(self):
+        return self.radii[:self.n].max(axis=1)
+
+    def integrate(self, delta_time):
+        """The walls' own dynamics for every live ring at once: spend the dents accumulated
+        this frame, damp, move, flash the vertices that jumped, relax toward neighbours
+        (membrane tension), fade the flashes — the old per-Barrier tail of update_deformation,
+        row for row."""
+        n = self.n
+        if not n:
+            return
+        radii, vel, flash, accum = self.radii[:n], self.radii_vel[:n], self.flash[:n], self.accum[:n]
+        damping = BARRIER_DAMPING ** delta_time
+        accum *= 2.0 * delta_time
+        vel -= accum
+        vel *= damping
+        old_radii = radii.copy()
+        radii += vel * delta_time
+        np.maximum(radii, 1.0, out=radii)
+        flash[np.abs(radii - old_radii) > BARRIER_DEFORM_THRESHOLD] = 1.0
+
+        # Membrane tension: relax each vertex toward its neighbours (Laplacian smoothing on the
+        # closed loop) so the barrier deforms as a smooth elastic curve instead of a spiky web.
+        smooth = min(0.9, BARRIER_TENSION * delta_time)
+        neighbor_avg = 0.5 * (np.roll(radii, 1, axis=1) + np.roll(radii, -1, axis=1))
+        radii += (neighbor_avg - radii) * smooth
+
+        flash *= math.exp(-BARRIER_FLASH_DECAY * delta_time)
+        accum[:] = 0.0
+
+
+class Barrier:
+    def __init__(self, center, screen_size, num_points, bank=None):
+        # A ring made without a bank gets a private one (a bank of one row).
+        self.bank = bank if bank is not None else BarrierBank(num_points)
+        if self.bank.num_points != num_points:
+            raise ValueError(f"bank rings have {self.bank.num_points} points, not {num_points}")
+        self.row = self.bank.add(self)
+        self.center = center
+        self.num_points = num_points
 
         r = max(screen_size[0], screen_size[1]) / 2.0
         self.rest_radius = r
 
-        # CMB perturbations. Scalar math.sin on purpose: bit-identical to the historical init
-        # (np.sin differs in the last ulp, which is enough to flip knife-edge merge decisions
-        # and break seeded A/B comparisons). One-time cost, ~4k sin calls.
-        perturbation = [0.0] * num_points
+        # CMB perturbations: one vectorized sine per mode over every vertex (this used to be
+        # ~4k scalar math.sin calls per ring, paid at every Big Bang and rip). Same draws, same
+        # mode-by-mode accumulation order; np.sin may differ from math.sin in the last ulp.
+        perturbation = np.zeros(num_points)
         for mode in range(1, CMB_PERTURBATION_MODES + 1):
             amplitude = random.gauss(0, CMB_PERTURBATION_SCALE / mode)
             phase = random.uniform(0, 2 * math.pi)
-            for i in range(num_points):
-                perturbation[i] += amplitude * math.sin(mode * float(self.angles[i]) + phase)
-        self.perturbation = np.array(perturbation)
+            perturbation += amplitude * np.sin(mode * self.angles + phase)
+        self.perturbation = perturbation
 
-        self.radii = np.array([r * (1.0 + perturbation[i]) for i in range(num_points)])
-        self.radii_vel = np.zeros(num_points)
-        self.flash = np.zeros(num_points)
+        self.radii[:] = r * (1.0 + perturbation)
+
+    # ── bank row views ──
+    def _live_row(self):
+        # A released ring has no row; indexing the bank with None would view (or overwrite)
+        # every live ring instead of failing.
+        if self.row is None:
+            raise RuntimeError("barrier was released from its bank")
+        return self.row
+
+    @property
+    def radii(self): return self.bank.radii[self._live_row()]
+    @radii.setter
+    def radii(self, v): self.bank.radii[self._live_row()] = v
+    @property
+    def radii_vel(self): return self.bank.radii_vel[self._live_row()]
+    @radii_vel.setter
+    def radii_vel(self, v): self.bank.radii_vel[self._live_row()] = v
+    @property
+    def flash(self): return self.bank.flash[self._live_row()]
+    @flash.setter
+    def flash(self, v): self.bank.flash[self._live_row()] = v
+    @property
+    def center(self):
+        c = self.bank.centers[self._live_row()]
+        return (float(c[0]), float(c[1]))
+    @center.setter
+    def center(self, v): self.bank.centers[self._live_row()] = v
+    @property
+    def angles(self): return self.bank.angles
+    @property
+    def cos_a(self): return self.bank.cos_a
+    @property
+    def sin_a(self): return self.bank.sin_a
+
+    def release(self):
+        self.bank.release(self)
 
     # ── radius lookup ──
-    def radius_at(self, angles):
-        """Vectorized linear interpolation of the ring radius at the given angles (array)."""
+    def radius_at(self, angles, scratch=None):
+        """Vectorized linear interpolation of the ring radius at the given angles (array).
+        With a ScratchArena the work (and the result) lives in its 'ring_*' buffers — same
+        arithmetic, no fresh temporaries; the result is valid until the next such call."""
         step = 2 * math.pi / self.num_points
-        idx = (np.asarray(angles) % (2 * math.pi)) / step
-        i0 = idx.astype(np.int64) % self.num_points
-        i1 = (i0 + 1) % self.num_points
-        t = idx - np.floor(idx)
-        return self.radii[i0] * (1 - t) + self.radii[i1] * t
+        if scratch is None:
+            idx = (np.asarray(angles) % (2 * math.pi)) / step
+            i0 = idx.astype(np.int64) % self.num_points
+            i1 = (i0 + 1) % self.num_points
+            t = idx - np.floor(idx)
+            return self.radii[i0] * (1 - t) + self.radii[i1] * t
+        n = len(angles)
+        idx = np.remainder(angles, 2 * math.pi, out=scratch.get('ring_idx', n))
+        idx /= step
+        i0 = scratch.get('ring_i0', n, np.int64)
+        np.copyto(i0, idx, casting='unsafe')  # truncates, as astype does
+        i0 %= self.num_points
+        i1 = np.add(i0, 1, out=scratch.get('ring_i1', n, np.int64))
+        i1 %= self.num_points
+        t = np.floor(idx, out=scratch.get('ring_t', n))
+        np.subtract(idx, t, out=t)
+        w0 = np.subtract(1, t, out=idx)
+        r = np.take(self.radii, i0, out=scratch.get('ring_r', n))
+        r *= w0
+        r1 = np.take(self.radii, i1, out=scratch.get('ring_r1', n))
+        r1 *= t
+        r += r1
+        return r
 
     def get_radius_at_angle(self, angle):
         """Scalar variant, kept for the sparse callers (overlap resolution, pulse clipping)."""
@@ -57,8 +234,8 @@ class Barrier:
         return self.radii[i0] * (1 - t) + self.radii[i1] * t
 
     def _entity_angle_and_dist(self, entity):
-        dx = entity.x - self.center[0]
-        dy = entity.y - self.center[1]
+        dx = entity.x
+        dy = entity.y
         dist = math.hypot(dx, dy)
         angle = math.atan2(dy, dx) % (2 * math.pi)
         return angle, dist, dx, dy
@@ -68,7 +245,7 @@ class Barrier:
         # The barrier no longer pulls on anything. Black holes are pure rotational anchors —
         # organizing their universe's orbit/swirl without being tugged by the wall — while
         # expansion comes from pulses (BARRIER_WAVE_PUSH) and contraction comes from stars and
-        # magnetars denting the wall inward (see update_deformation). This used to pull black
+        # magnetars denting the wall inward (see accumulate_deformation). This used to pull black
         # holes outward toward the wall (a deliberately weak "losing battle" nudge), but that
         # pull fed back with the hole's own denting of the same stretch of wall it was aiming
         # at, producing erratic drift instead of a stable anchor.
@@ -86,9 +263,12 @@ class Barrier:
             mass_accum[i0] += effective_mass * (1 - t)
             mass_accum[i1] += effective_mass * t
 
-    def update_deformation(self, universe, delta_time):
+    def accumulate_deformation(self, universe, delta_time):
+        """What dents this wall this frame: heavy clouds, stars and neutron stars near it add
+        to the row's deformation accumulator, magnetars grip it directly. The wall then moves
+        in BarrierBank.integrate, with every other ring."""
         n = self.num_points
-        mass_accum = np.zeros(n)
+        mass_accum = self.bank.accum[self.row]
         step = 2 * math.pi / n
         proximity_threshold = self.rest_radius * BARRIER_DEFORMATION_PROXIMITY_FACTOR
 
@@ -99,8 +279,8 @@ class Barrier:
             # factor unreachable — any cloud that heavy ignites into a star on the next refresh.
             heavy = clouds.M >= BARRIER_DEFORM_CLOUD_MASS
             if heavy.any():
-                dx = clouds.X[heavy] - self.center[0]
-                dy = clouds.Y[heavy] - self.center[1]
+                dx = clouds.X[heavy]
+                dy = clouds.Y[heavy]
                 dist = np.hypot(dx, dy)
                 angle = np.arctan2(dy, dx) % (2 * math.pi)
                 barrier_r = self.radius_at(angle)
@@ -133,12 +313,12 @@ class Barrier:
         # not crush it.
         natal_radius = BARRIER_INITIAL_SIZE / 2
         for m in universe.magnetars:
-            bx = self.center[0] + self.radii * self.cos_a
-            by = self.center[1] + self.radii * self.sin_a
+            bx = self.radii * self.cos_a
+            by = self.radii * self.sin_a
             vdist = np.hypot(bx - m.x, by - m.y)
             infield = vdist < MAGNETAR_FIELD_RADIUS
             if infield.any():
-                m_dist = math.hypot(m.x - self.center[0], m.y - self.center[1])
+                m_dist = math.hypot(m.x, m.y)
                 target = max(m_dist, natal_radius)
                 falloff = 1.0 - vdist[infield] / MAGNETAR_FIELD_RADIUS
                 self.radii_vel[infield] += ((target - self.radii[infield])
@@ -156,50 +336,40 @@ class Barrier:
                 above_floor = self.radii > natal_radius
                 self.radii_vel[above_floor] -= math.sqrt(m.mass) * MAGNETAR_BARRIER_CONTRACT_FACTOR * delta_time
 
-        damping = BARRIER_DAMPING ** delta_time
-        self.radii_vel -= mass_accum * 2.0 * delta_time
-        self.radii_vel *= damping
-        old_radii = self.radii.copy()
-        self.radii = np.maximum(self.radii + self.radii_vel * delta_time, 1.0)
-        self.flash[np.abs(self.radii - old_radii) > BARRIER_DEFORM_THRESHOLD] = 1.0
-
-        # Membrane tension: relax each vertex toward its neighbours (Laplacian smoothing on the
-        # closed loop) so the barrier deforms as a smooth elastic curve instead of a spiky web.
-        smooth = min(0.9, BARRIER_TENSION * delta_time)
-        neighbor_avg = 0.5 * (np.roll(self.radii, 1) + np.roll(self.radii, -1))
-        self.radii += (neighbor_avg - self.radii) * smooth
-
-        self.flash *= math.exp(-BARRIER_FLASH_DECAY * delta_time)
+    def contain_clouds(self, clouds):
+        """Pin every cloud row outside the ring to just inside it and cancel its outward radial
+        velocity — the numpy twin of fastphysics.integrate_and_contain's containment half,
+        run by physics.step after integration when the extension isn't built."""
+        if not clouds.n:
+            return
+        X, Y, VX, VY = clouds.X, clouds.Y, clouds.VX, clouds.VY
+        tmp = clouds.tmp
+        # Positions are relative to the ring's center already, so X/Y are the offsets.
+        dist = np.hypot(X, Y, out=tmp('wall_dist'))
+        angle = np.arctan2(Y, X, out=tmp('wall_angle'))
+        angle %= 2 * math.pi
+        barrier_r = self.radius_at(angle, clouds.scratch)
+        out = np.greater_equal(dist, barrier_r, out=tmp('wall_out', bool))
+        if out.any():
+            # (dist >= barrier_r >= 1 here — the radii floor in BarrierBank.integrate — so
+            # the division below is always safe.)
+            oi = np.nonzero(out)[0]
+            dxo, dyo, do = X[oi], Y[oi], dist[oi]
+            X[oi] = barrier_r[oi] * 0.99 * np.cos(angle[oi])
+            Y[oi] = barrier_r[oi] * 0.99 * np.sin(angle[oi])
+            radial = (VX[oi] * dxo + VY[oi] * dyo) / do
+            outward = radial > 0
+            oi = oi[outward]
+            if len(oi):
+                dxo, dyo, do, radial = dxo[outward], dyo[outward], do[outward], radial[outward]
+                VX[oi] -= (dxo / do) * radial
+                VY[oi] -= (dyo / do) * radial
 
     def enforce(self, universe, delta_time):
-        cx, cy = self.center
+        """Containment for the compact objects. Cloud rows are contained at the end of the
+        step, fused with integration (see physics.step / contain_clouds)."""
         step = 2 * math.pi / self.num_points
 
-        clouds = universe.clouds
-        if clouds.n:
-            X, Y, VX, VY = clouds.X, clouds.Y, clouds.VX, clouds.VY
-            dx = X - cx
-            dy = Y - cy
-            dist = np.hypot(dx, dy)
-            angle = np.arctan2(dy, dx) % (2 * math.pi)
-            barrier_r = self.radius_at(angle)
-            out = dist >= barrier_r
-            if out.any():
-                # Pin to just inside the ring and cancel any outward radial velocity component.
-                # (dist >= barrier_r >= 1 here — the radii floor in update_deformation — so
-                # the division below is always safe.)
-                X[out] = cx + barrier_r[out] * 0.99 * np.cos(angle[out])
-                Y[out] = cy + barrier_r[out] * 0.99 * np.sin(angle[out])
-                oi = np.nonzero(out)[0]
-                dxo, dyo, do = dx[oi], dy[oi], dist[oi]
-                radial = (VX[oi] * dxo + VY[oi] * dyo) / do
-                outward = radial > 0
-                oi = oi[outward]
-                if len(oi):
-                    dxo, dyo, do, radial = dxo[outward], dyo[outward], do[outward], radial[outward]
-                    VX[oi] -= (dxo / do) * radial
-                    VY[oi] -= (dyo / do) * radial
-
         compact_angles_masses = []
         for bh in universe.black_holes:
             a, _, _, _ = self._entity_angle_and_dist(bh)
@@ -218,8 +388,8 @@ class Barrier:
             angle, dist, dx, dy = self._entity_angle_and_dist(ns)
             barrier_r = self.get_radius_at_angle(angle)
             if dist >= barrier_r:
-                ns.x = cx + barrier_r * 0.99 * math.cos(angle)
-                ns.y = cy + barrier_r * 0.99 * math.sin(angle)
+                ns.x = barrier_r * 0.99 * math.cos(angle)
+                ns.y = barrier_r * 0.99 * math.sin(angle)
                 if dist > 0:
                     radial_vx = (dx / dist) * ((ns.vx * dx + ns.vy * dy) / dist)
                     radial_vy = (dy / dist) * ((ns.vx * dx + ns.vy * dy) / dist)
@@ -23,8 +23,12 @@ UI_STATS_CELL_PAD_Y = 6         # Vertical padding inside the stats table row.
 # Styling (font, colors, padding) comes from the UI_STATS_* constants above so the two rows
 # read as one table. The panel spans from UI_TICKER_TOP_MARGIN down to the stats row, so how
 # many lines actually fit is computed from screen height, not fixed.
-UI_TICKER_TOP_MARGIN = 24       # Gap (pixels) between the top of the screen and the panel.
+UI_TICKER_TOP_MARGIN = 24       # Gap (pixels) above the panel: from the top of the screen, or from the perf overlay's bottom edge while [P] is up.
 UI_TICKER_LIFETIME = 7.0        # Seconds an event entry stays visible before it fades out and is dropped for good (no scrollback).
+EVENT_LOG_CAPACITY = 256        # Event records a universe's ring buffer holds between drains (sim.events); a burst past this overwrites its oldest records.
+EVENT_STREAM_PATH = None        # File the outcome events (collapses, mergers, rips, civ births, universe deaths) are appended to as fixed-width binary records, for offline analysis across runs (sim/eventstream.py). None = off.
+EVENT_STREAM_QUEUE_FRAMES = 256  # Frames of records the stream's writer thread may fall behind by before whole frames are dropped (the frame never waits on disk).
+EVENT_STREAM_CLOSE_TIMEOUT = 2.0  # Seconds close() waits on exit for the writer thread to take the last batches; past it (writer dead or stuck) what's still queued is dropped.
 
 # ── Element inventory row (one block per element currently present, drawn above the ticker) ──
 UI_ELEMENTS_FONT_SIZE = 14      # Point size for the element symbol drawn on each block.
@@ -44,6 +48,27 @@ UI_HOTKEYS_TEXT_COLOR = (140, 150, 190)  # Description text color — dimmer tha
 UI_HOTKEYS_HOLD_SECONDS = 20.0  # Seconds the panel stays fully opaque before it starts fading.
 UI_HOTKEYS_FADE_SECONDS = 10.0  # Seconds the fade-to-transparent takes once it starts (20 + 10 = 30s total).
 
+# ── Performance overlay (top-left corner, toggled with [P]) ──
+# Drawn from the frame profiler's ring (sim/profiler.py), which [P] switches on while the
+# overlay is up. Panel background, padding and fonts come from the UI_HOTKEYS_* constants above.
+UI_PERF_WIDTH = 320             # Width (pixels) of the sparkline, stacked bar and gauges; the panel widens if a text row needs more.
+UI_PERF_SPARK_FRAMES = 240      # Frames of history in the frame-time sparkline (newest at the right). Bounded by PROFILE_RING_FRAMES.
+UI_PERF_SPARK_HEIGHT = 48       # Height (pixels) of the sparkline. Its scale is at least twice the 1/TARGET_FPS budget, so a steady frame sits mid-height.
+UI_PERF_BAR_HEIGHT = 12         # Height (pixels) of the last frame's stacked phase bar. Full width = the frame budget, or the frame itself if it ran over.
+UI_PERF_GAUGE_HEIGHT = 5        # Height (pixels) of each gauge's fill bar.
+UI_PERF_SPARK_COLOR = (110, 110, 245)  # Sparkline color.
+UI_PERF_BUDGET_COLOR = (200, 90, 90)   # The 1/TARGET_FPS budget line on the sparkline and its tick on the bar.
+UI_PERF_UNIVERSE_COLORS = [(90, 120, 230), (70, 160, 200), (120, 100, 210), (60, 140, 160), (150, 130, 240)]  # Bar segments for each universe's physics step, picked by uid so a universe keeps its color.
+UI_PERF_MULTIVERSE_COLOR = (170, 140, 90)  # Bar segment for the multiverse passes (barriers, spawns, dark flow, overlaps, reaping).
+UI_PERF_RENDER_COLOR = (90, 180, 120)      # Bar segment for the world render.
+UI_PERF_HUD_COLOR = (200, 200, 110)        # Bar segment for the HUD (event drain + drawing, this overlay included).
+UI_PERF_ENTROPY_COLOR = (200, 120, 170)    # Bar segment for the entropy pool fold and RNG draw.
+UI_PERF_OTHER_COLOR = (70, 75, 95)         # Bar segment for frame time outside every span (input, display flip).
+UI_PERF_GAUGE_COLOR = (110, 150, 230)      # Gauge fill while comfortably below its limit.
+UI_PERF_GAUGE_HOT_COLOR = (230, 100, 90)   # Gauge fill as it nears its limit (blended in over the last 30%).
+UI_PERF_ALLOC_FULL_SCALE = 64 * 1024 * 1024  # Bytes/second of physics scratch allocation that fills the allocation gauge.
+UI_PERF_ALLOC_SMOOTH_SECONDS = 0.5  # Time constant (seconds) of the allocation rate's exponential smoothing — per-frame bytes are bursty.
+
 # ── Zoom ──
 ZOOM_MIN = 0.5                 # Minimum zoom level (zoomed out). Lower = can see more.
 ZOOM_MAX = 2.0                 # Maximum zoom level (zoomed in). Higher = can zoom in more.
@@ -52,11 +77,14 @@ ZOOM_SMOOTH_RATE = 10.0        # Per-second exponential ease of the displayed zo
 
 # ── Simulation ──
 SPATIAL_HASH_CELL_SIZE = 40     # Cell size (pixels) for the local-gravity neighborhood grid. Should match typical entity interaction radius.
+PULSE_GRID_MIN_RINGS = 2        # Pushing wave rings in a step at which their band lookups switch from full-field distances to annulus queries on the bucket grid (sim/pulses.py). The grid build is shared by every ring, so it pays off from the second ring at any field size up to the cloud cap; a lone ring is cheaper with one numpy distance pass.
+PHYSICS_SEED = None             # None = every physics stream seeded from OS entropy (normal, unrepeatable runs). An int = seeded mode: Python, numpy and compiled-kernel rolls all derive from it (sim/streams.py), so two runs on the same machine/build are bit-comparable — for performance A/B benchmarks.
 
 # ── Cloud/star gravity backends ──
 # All backends compute the SAME force formula (tiered grav_mass, softening); they differ only in
 # speed and (for Barnes-Hut) approximation. Dispatch: GPU if available → Barnes-Hut → numpy brute.
 GPU_GRAVITY_ENABLED = True      # Use the Taichi GPU kernel for cloud/star gravity when available (all-pairs, float32 — ~1e-7 error vs the f64 CPU paths). Falls back to Barnes-Hut/brute on CPU if Taichi/GPU is unavailable.
+GPU_GRAVITY_CACHE_DIR = None    # Where Taichi's offline kernel cache lives (compiled kernels reused across runs, so only the first run on a machine pays the JIT). None = Taichi's default (~/.cache/taichi/ticache).
 BARNES_HUT_ENABLED = True       # Toggle the Barnes-Hut CPU backend (compiled quadtree, approximate long-range). False = numpy brute-force fallback.
 BARNES_HUT_THETA = 0.7          # Opening angle. Lower = more accurate & slower (0 = brute force O(N^2)).
 BARNES_HUT_SOFTENING = 2.0      # Softening length (pixels) added to the force denominator to prevent close-range spikes.
@@ -79,6 +107,12 @@ MAX_DELTA_TIME = 0.05          # Maximum physics time step per frame (seconds).
 HEAT_DEATH_LINGER_DURATION = 12.0  # Seconds to display the empty ring after all matter is gone before starting a new universe.
 TARGET_FPS = 60                    # Target frame rate cap for the simulation loop.
 
+# ── Frame profiler (sim/profiler.py) ──
+PROFILE_ENABLED = False         # Time every frame phase (gravity, collisions, fates, barrier, BH spin, pulses, BH/NS passes, removals/spawns, integrate, multiverse, events, render, RNG, HUD, entropy) per universe into a ring buffer. Off = one flag check per phase.
+PROFILE_RING_FRAMES = 600       # Frames of phase timings kept in the ring (the Chrome trace covers this window).
+PROFILE_TRACE_PATH = 'simcraft_trace.json'  # Chrome trace-event JSON written on exit when PROFILE_ENABLED (open in chrome://tracing or Perfetto); the [P] overlay alone doesn't write one. None = don't write.
+PROFILE_CSV_PATH = None         # CSV each profiled frame's phase rows are appended to as it ends (frame, universe, phase, start/duration ms, clouds). None = off.
+
 # ── Physics ──
 GRAVITY_SCALE = 1.0  # Master gravity multiplier applied to all gravitational constants. Increase for stronger gravity everywhere.
 VELOCITY_DAMPING = 0.999        # Per-frame velocity multiplier for all entities. Below 1.0 = energy dissipation. 1.0 = no damping.
@@ -120,7 +154,7 @@ BARRIER_LINE_WIDTH = 3          # Line width (pixels) for drawing the barrier ri
 
 # ── Barrier Interaction (how different entities interact with the barrier) ──
 # Black holes are pure rotational anchors — no barrier gravity pull, no wall denting (see
-# Barrier.apply_gravity / update_deformation). Expansion comes from merger pulses
+# Barrier.apply_gravity / accumulate_deformation). Expansion comes from merger pulses
 # (BARRIER_WAVE_PUSH); contraction comes from stars, clouds, and magnetars/neutron stars
 # denting the wall inward below. Everything still interacts through containment (enforce()).
 MOLECULAR_CLOUD_BARRIER_DEFORM_FACTOR = 0.08   # How strongly massive clouds dent the barrier on approach. Was tuned for the recollapse era at 0.3 (a dead universe packed with evaporation clouds grinds down to its Big Crunch in ~6-7 minutes, at 6 it imploded in seconds) — lowered alongside the other deform factors, so watch Big Crunch pacing if it comes up.
@@ -179,6 +213,9 @@ MOLECULAR_CLOUD_END_COLOR = (225, 255, 255)  # Color clouds fade toward as they
 MOLECULAR_CLOUD_OPACITY = 128   # Maximum opacity for clouds below protostar mass (0-255).
 MOLECULAR_CLOUD_MIN_OPACITY = 64  # Minimum opacity for the lightest clouds (0-255).
 
+CLOUD_FIELD_MIN_CAPACITY = 256  # Starting (and floor) row capacity of a universe's cloud arrays. Grows by doubling on demand.
+CLOUD_FIELD_SHRINK_STEPS = 600  # Consecutive steps (~10 s at 60 fps) a cloud field must sit under a quarter full before its capacity halves back. The wait is the hysteresis that keeps a storm-and-settle population from thrashing between sizes.
+
 # ── Molecular Cloud Emission (clouds shed daughter clouds) ──
 MOLECULAR_CLOUD_EMISSION_CHANCE = 0.2         # Per-frame chance for eligible clouds to emit
 MOLECULAR_CLOUD_EMISSION_MIN_PARENT_MASS = 1     # Minimum parent mass to emit
@@ -228,17 +265,26 @@ STAR_CLASSES = [
 ]
 
 
-def star_class_name(mass, elem=None):
-    """Ticker display name (with article) for a star of the given mass. Pass the star's
-    element too and enriched top-band stars die under the Wolf-Rayet name — massive stars
-    pass through a WR phase before core collapse, so the obituary is earned even when the
-    star wasn't in the (rarer) shell-rendered subset."""
+STAR_CLASS_WOLF_RAYET = len(STAR_CLASSES)  # class index past the table: the Wolf-Rayet obituary name
+STAR_CLASS_NAMES = [name for _m, name, _c, _s in STAR_CLASSES] + ["a Wolf-Rayet star"]
+
+
+def star_class_index(mass, elem=None):
+    """Row of STAR_CLASSES for a star of the given mass (STAR_CLASS_WOLF_RAYET past the end).
+    Pass the star's element too and enriched top-band stars die under the Wolf-Rayet name —
+    massive stars pass through a WR phase before core collapse, so the obituary is earned
+    even when the star wasn't in the (rarer) shell-rendered subset."""
     if elem is not None and mass >= WOLF_RAYET_MASS and elem >= STAR_ENRICHED_ELEMENT_MIN:
-        return "a Wolf-Rayet star"
-    for mass_min, name, _color, _size in STAR_CLASSES:
+        return STAR_CLASS_WOLF_RAYET
+    for i, (mass_min, _name, _color, _size) in enumerate(STAR_CLASSES):
         if mass >= mass_min:
-            return name
-    return STAR_CLASSES[-1][1]
+            return i
+    return len(STAR_CLASSES) - 1
+
+
+def star_class_name(mass, elem=None):
+    """Ticker display name (with article) for a star of the given mass (see star_class_index)."""
+    return STAR_CLASS_NAMES[star_class_index(mass, elem)]
 
 
 # ── Star flavor variants (all render-only, gated on state that already exists) ──
@@ -8,6 +8,7 @@ import random
 import numpy as np
 
 from sim.config import *
+from sim import events as E
 
 entity_id_counter = 0
 
@@ -86,8 +87,8 @@ class BlackHole:
                     # Cosmetic: the flare glow points where the meal came from.
                     self.flare_dir_x += (-dx / distance) * black_hole.mass
                     self.flare_dir_y += (-dy / distance) * black_hole.mass
-                    universe.black_hole_pulses.append([self.x, self.y, 0, black_hole.mass])
-                    universe.event_log.append("BLACK HOLE MERGER — gravitational waves ripple out")
+                    universe.pulses.emit_merger(self.x, self.y, black_hole.mass)
+                    universe.event_log.emit(E.BLACK_HOLE_MERGER)
                 else:
                     soft_dist = math.sqrt(distance * distance + BLACK_HOLE_GRAVITY_SOFTENING * BLACK_HOLE_GRAVITY_SOFTENING)
                     # Acceleration on black_hole, independent of its own mass (equivalence
@@ -145,28 +146,43 @@ class BlackHole:
         if clouds.n == 0:
             return
         X, Y, VX, VY, M = clouds.X, clouds.Y, clouds.VX, clouds.VY, clouds.M
-        dx = self.x - X
-        dy = self.y - Y
-        dist = np.maximum(np.hypot(dx, dy), 1.0)
-        # Swept-trajectory capture (tunneling prevention), vectorized
-        mvx = VX * delta_time
-        mvy = VY * delta_time
-        move2 = mvx * mvx + mvy * mvy
-        t = np.clip((dx * mvx + dy * mvy) / np.where(move2 > 0.0, move2, 1.0), 0.0, 1.0)
-        closest2 = (dx - t * mvx) ** 2 + (dy - t * mvy) ** 2
-        swept = (move2 >= 0.01) & (closest2 < capture_radius * capture_radius)
-        captured = alive & ((dist < capture_radius) | swept)
+        # Whole-field work runs in a few scratch-arena buffers, each reused as the pass goes on
+        # (bh_dx/bh_dy become the unit vector toward the hole, bh_accel the kick). The swept
+        # capture test and the disk swirl only concern the rows near the hole, so they run on
+        # those rows alone, as ordinary numpy expressions.
+        tmp = clouds.tmp
+        dx = np.subtract(self.x, X, out=tmp('bh_dx'))
+        dy = np.subtract(self.y, Y, out=tmp('bh_dy'))
+        dist = np.hypot(dx, dy, out=tmp('bh_dist'))
+        np.maximum(dist, 1.0, out=dist)
+        captured = np.less(dist, capture_radius, out=tmp('bh_mask', bool))
+        # Swept-trajectory capture (tunneling prevention): a cloud whose move this step
+        # (mv = V * dt) passes within capture_radius of the hole is captured too. Only a cloud
+        # within capture_radius + |mv| can (+1 covers dist's floor), so only those are tested.
+        reach = np.hypot(VX, VY, out=tmp('bh_work'))
+        reach *= delta_time
+        reach += capture_radius + 1.0
+        near = np.flatnonzero(np.less(dist, reach, out=tmp('bh_near', bool)))
+        if len(near):
+            mvx = VX[near] * delta_time
+            mvy = VY[near] * delta_time
+            move2 = mvx * mvx + mvy * mvy
+            moving = move2 >= 0.01
+            t = np.clip((dx[near] * mvx + dy[near] * mvy) / np.where(moving, move2, 1.0), 0.0, 1.0)
+            closest2 = (dx[near] - t * mvx) ** 2 + (dy[near] - t * mvy) ** 2
+            captured[near[moving & (closest2 < capture_radius * capture_radius)]] = True
+        captured &= alive
         for k in np.nonzero(captured)[0]:
             alive[k] = False
             if self.child_universe is not None and random.random() < UNIVERSE_STREAM_FRACTION:
                 # Wormhole: matter falling in emerges in the child universe instead of being
-                # consumed. Position is rewritten now (the row moves to the child after the pass).
-                ccx, ccy = self.child_universe.barrier.center
+                # consumed. Position is rewritten now (the row moves to the child after the pass),
+                # in the child's frame — relative to the child's ring center.
                 rr = self.child_universe.barrier.rest_radius
                 ang = random.uniform(0, 2 * math.pi)
                 rad = math.sqrt(random.random()) * rr
-                X[k] = ccx + rad * math.cos(ang)
-                Y[k] = ccy + rad * math.sin(ang)
+                X[k] = rad * math.cos(ang)
+                Y[k] = rad * math.sin(ang)
                 VX[k] = 0.0
                 VY[k] = 0.0
                 stream_moves.append((int(k), self.child_universe))
@@ -186,51 +202,68 @@ class BlackHole:
                 self.flare_dir_y += (-dy[k] / dist[k]) * M[k]
         if not alive.any():
             return
-        soft_dist = np.sqrt(dist * dist + BLACK_HOLE_GRAVITY_SOFTENING * BLACK_HOLE_GRAVITY_SOFTENING)
         # Acceleration on each cloud, independent of its own mass (equivalence principle) —
-        # self.mass cancels out of F/M, so this is just G*self.mass/d^2. `impulse` (the raw
-        # mutual force*dt, proportional to both masses) is kept separately for the hole's own
-        # recoil below.
-        accel = BLACK_HOLE_GRAVITY_CONSTANT * self.mass / (soft_dist * soft_dist)
-        ux = dx / soft_dist
-        uy = dy / soft_dist
-        kick = np.where(alive, accel * delta_time, 0.0)
-        impulse = kick * M
+        # self.mass cancels out of F/M, so this is just G*self.mass/soft_dist^2. `impulse` (the
+        # raw mutual force*dt, proportional to both masses) is kept separately for the hole's
+        # own recoil below.
+        soft_dist = np.multiply(dist, dist, out=tmp('bh_work'))
+        soft_dist += BLACK_HOLE_GRAVITY_SOFTENING * BLACK_HOLE_GRAVITY_SOFTENING
+        np.sqrt(soft_dist, out=soft_dist)
+        accel = np.multiply(soft_dist, soft_dist, out=tmp('bh_accel'))
+        np.divide(BLACK_HOLE_GRAVITY_CONSTANT * self.mass, accel, out=accel)
+        ux = np.divide(dx, soft_dist, out=dx)
+        uy = np.divide(dy, soft_dist, out=dy)
+        disk = np.less(dist, swirl_radius, out=tmp('bh_mask', bool))
+        disk &= alive
+        disk = np.flatnonzero(disk)  # the swirl's rows
+        disk_accel = accel[disk]
+        kick = np.multiply(accel, delta_time, out=accel)
+        np.copyto(kick, 0.0, where=np.logical_not(alive, out=tmp('bh_mask', bool)))
+        impulse = np.multiply(kick, M, out=tmp('bh_work'))
         # Newton's 3rd law recoil, per cloud; the exclusive prefix sum gives each cloud the same
-        # sequentially-drifting hole velocity the old loop produced.
-        rec_x = ux * impulse / self.mass
-        rec_y = uy * impulse / self.mass
-        frame_vx = self.vx - (np.cumsum(rec_x) - rec_x)
-        frame_vy = self.vy - (np.cumsum(rec_y) - rec_y)
-        VX += ux * kick
-        VY += uy * kick
+        # sequentially-drifting hole velocity the old loop produced:
+        #   rec = u * impulse / self.mass,  frame_v = self.v - (cumsum(rec) - rec)
+        # Only the disk rows need frame_v (the swirl is relative to the drifting hole).
+        rec, prefix = tmp('bh_rec'), tmp('bh_prefix')
+        recoil, frame_v = [], []
+        for u, hole_v in ((ux, self.vx), (uy, self.vy)):
+            np.multiply(u, impulse, out=rec)
+            rec /= self.mass
+            np.cumsum(rec, out=prefix)
+            prefix -= rec
+            frame_v.append(hole_v - prefix[disk])
+            recoil.append(float(rec.sum()))
+        VX += np.multiply(ux, kick, out=rec)
+        VY += np.multiply(uy, kick, out=rec)
+
         # Frame-dragging swirl: drive tangential velocity toward circular-orbit speed inside the disk.
-        in_swirl = alive & (dist < swirl_radius)
-        if in_swirl.any():
+        if len(disk):
+            frame_vx, frame_vy = frame_v
+            d, ex, ey = dist[disk], ux[disk], uy[disk]
+            tx, ty = -ey, ex
             swirl_dir = 1.0 if self.angular_momentum >= 0 else -1.0
-            tx, ty = -uy, ux
-            cur_t = (VX - frame_vx) * tx + (VY - frame_vy) * ty
-            target_t = swirl_dir * np.sqrt(accel * dist)
+            cur_t = (VX[disk] - frame_vx) * tx + (VY[disk] - frame_vy) * ty
+            target_t = np.sqrt(disk_accel * d) * swirl_dir
             # Falloff shaped to stay near full strength across most of the disk and only taper
             # sharply in the last stretch before the boundary (exponent < 1 bows the curve up),
             # instead of the old linear ramp that was ~0 right where infalling clouds first
             # cross in — that let them fall in almost radially and only orbit once already deep.
-            falloff = np.clip(1.0 - dist / swirl_radius, 0.0, 1.0) ** BLACK_HOLE_SWIRL_FALLOFF_EXPONENT
+            falloff = np.clip(1.0 - d / swirl_radius, 0.0, 1.0) ** BLACK_HOLE_SWIRL_FALLOFF_EXPONENT
             blend = np.minimum(1.0, BLACK_HOLE_SWIRL_RATE * falloff * delta_time)
-            dvt = np.where(in_swirl, (target_t - cur_t) * blend, 0.0)
-            VX += dvt * tx
-            VY += dvt * ty
+            dvt = (target_t - cur_t) * blend
+            VX[disk] += dvt * tx
+            VY[disk] += dvt * ty
             # Disk circularization: viscously damp the RADIAL component so disk clouds settle
             # into persistent orbits instead of plunging through in one pass — swirl sets the
             # rotation, this makes it last. Damping is partial: the residual inward drift is
             # the viscous accretion that keeps the hole fed.
-            cur_r = (VX - frame_vx) * ux + (VY - frame_vy) * uy
+            cur_r = (VX[disk] - frame_vx) * ex + (VY[disk] - frame_vy) * ey
             circ = np.minimum(1.0, BLACK_HOLE_DISK_CIRCULARIZATION * falloff * delta_time)
-            dvr = np.where(in_swirl, -cur_r * circ, 0.0)
-            VX += dvr * ux
-            VY += dvr * uy
-        self.vx -= float(rec_x.sum())
-        self.vy -= float(rec_y.sum())
+            dvr = -cur_r * circ
+            VX[disk] += dvr * ex
+            VY[disk] += dvr * ey
+        self.vx -= recoil[0]
+        self.vy -= recoil[1]
 
     def decay(self, delta_time, universe):
         # Eddington-style throttle: accretion chokes as the hole nears the mass cap (radiation
@@ -255,7 +288,7 @@ class BlackHole:
         was_flaring = self.is_flaring
         self.is_flaring = self.flare_length >= BLACK_HOLE_FLARE_THRESHOLD
         if self.is_flaring and not was_flaring:
-            universe.event_log.append("QUASAR FLARE — Eddington-choked accretion lights the disk")
+            universe.event_log.emit(E.QUASAR_FLARE)
 
         if self.accretion_mass > 0:
             growth = min(BLACK_HOLE_GROWTH_RATE * throttle * delta_time, self.accretion_mass)
@@ -286,7 +319,7 @@ class NeutronStar:
         self.pulse_rate = NEUTRON_STAR_PULSE_RATE
         self.pulse_strength = NEUTRON_STAR_PULSE_STRENGTH
         self.time_since_last_pulse = 0
-        self.active_pulses = []
+        self.pulse_count = 0  # live rings of this star's train in universe.pulses (sim.pulses)
         self.pulse_color_state = 0  # 0: normal color, 1: white during pulse
         self.pulse_color_duration = NEUTRON_STAR_PULSE_COLOR_DURATION  # Duration of white color in seconds
         # Nutation strobe: the upright jet cross tilts NEUTRON_STAR_JET_WOBBLE degrees off
@@ -354,7 +387,7 @@ class NeutronStar:
         self.pulse_rate = NEUTRON_STAR_PULSE_RATE * (1.0 + self.age * NEUTRON_STAR_SPINDOWN_RATE)
         if not self.is_dead and self.pulse_rate >= NEUTRON_STAR_DEATH_LINE_PERIOD:
             self.is_dead = True
-            universe.event_log.append("PULSAR DEATH LINE — spin-down silences the beacon")
+            universe.event_log.emit(E.PULSAR_DEATH_LINE)
 
         if self.pulse_color_state == 1:
             self.pulse_color_duration -= delta_time
@@ -362,75 +395,11 @@ class NeutronStar:
                 self.pulse_color_state = 0
                 self.pulse_color_duration = NEUTRON_STAR_PULSE_COLOR_DURATION
 
-        clouds = universe.clouds
-        pulses_to_remove = []
-        # active_pulses holds one radius per ring: pulses stay fully visible all the way to
-        # the barrier (only their physical effect fades, below), so there is no per-pulse
-        # fade or age state to carry.
-        for i, radius in enumerate(self.active_pulses):
-            new_radius = radius + (NEUTRON_STAR_RIPPLE_SPEED * delta_time)
-            effect_fade_start = ring.rest_radius * 0.75
-            effect_fade = max(0.0, 1.0 - max(0.0, new_radius - effect_fade_start) / (ring.rest_radius * 0.25))
-
-            self.active_pulses[i] = new_radius
-
-            # Barrier ring: flash and push the vertices the wavefront is crossing.
-            cx, cy = ring.center
-            bx = cx + ring.radii * ring.cos_a
-            by = cy + ring.radii * ring.sin_a
-            dist_to_star = np.hypot(bx - self.x, by - self.y)
-            hit = np.abs(dist_to_star - new_radius) < NEUTRON_STAR_RIPPLE_EFFECT_WIDTH * 2
-            if hit.any():
-                ring.flash[hit] = np.maximum(ring.flash[hit], effect_fade * 0.4)
-                ring.radii_vel[hit] += BARRIER_WAVE_PUSH * 0.3 * effect_fade * delta_time
-
-            # Clouds in the ripple band get pushed outward.
-            if clouds.n:
-                dx = clouds.X - self.x
-                dy = clouds.Y - self.y
-                dist_sq = dx * dx + dy * dy
-                r_inner = max(0, new_radius - NEUTRON_STAR_RIPPLE_EFFECT_WIDTH)
-                r_outer = new_radius + NEUTRON_STAR_RIPPLE_EFFECT_WIDTH
-                in_annulus = (dist_sq >= r_inner * r_inner) & (dist_sq <= r_outer * r_outer)
-                if in_annulus.any():
-                    distance = np.sqrt(np.where(in_annulus, dist_sq, 1.0))
-                    ripple = np.abs(distance - new_radius)
-                    apply = in_annulus & (ripple < NEUTRON_STAR_RIPPLE_EFFECT_WIDTH) & (distance > 0)
-                    if apply.any():
-                        effect = 1.0 - ripple / NEUTRON_STAR_RIPPLE_EFFECT_WIDTH
-                        force = np.where(apply, self.pulse_strength * effect / ((ripple + 1) ** 0.8), 0.0)
-                        clouds.VX += (dx / distance) * force * delta_time
-                        clouds.VY += (dy / distance) * force * delta_time
-                        # The wavefront also compresses what it passes: mark these clouds
-                        # shocked so they merge readily (triggered star formation).
-                        clouds.SHOCK = np.where(apply, SHOCK_DURATION, clouds.SHOCK)
-
-            for black_hole in universe.black_holes:
-                dx = black_hole.x - self.x
-                dy = black_hole.y - self.y
-                distance = math.hypot(dx, dy)
-
-                ripple_dist = abs(distance - new_radius)
-                if ripple_dist < NEUTRON_STAR_RIPPLE_EFFECT_WIDTH:
-                    effect_factor = (1.0 - (ripple_dist / NEUTRON_STAR_RIPPLE_EFFECT_WIDTH)) * 0.3
-                    force = self.pulse_strength * effect_factor / ((ripple_dist + 1) ** 1.2)
-
-                    if distance > 0:
-                        black_hole.vx += (dx / distance) * force * delta_time * 0.2
-                        black_hole.vy += (dy / distance) * force * delta_time * 0.2
-
-            # Pulsar ripples are local: they dissipate at PULSE_RANGE (or at the wall if the
-            # universe is smaller than that). Only BH merger pulses cross the whole universe.
-            if new_radius > float(ring.radii.max()) or new_radius > NEUTRON_STAR_PULSE_RANGE:
-                pulses_to_remove.append(i)
-
-        for i in sorted(pulses_to_remove, reverse=True):
-            if i < len(self.active_pulses):
-                self.active_pulses.pop(i)
-
+        # The rings themselves live in universe.pulses (sim.pulses), which expands them and
+        # applies their pushes together with every other wavefront; this star only emits.
         if (not self.is_dead and self.time_since_last_pulse >= self.pulse_rate
-                and len(self.active_pulses) < NEUTRON_STAR_PULSE_TRAIN):
-            self.active_pulses.append(0.0)
+                and self.pulse_count < NEUTRON_STAR_PULSE_TRAIN):
+            universe.pulses.emit_pulsar(self)
             self.time_since_last_pulse = 0
             self.pulse_color_state = 1  # Set to white during pulse
             self.pulse_color_duration = NEUTRON_STAR_PULSE_COLOR_DURATION  # Reset duration
@@ -454,9 +423,9 @@ class Magnetar(NeutronStar):
     def __init__(self, x, y, mass):
         super().__init__(x, y, mass)
         self.radius = MAGNETAR_RADIUS
-        self.field_time = MAGNETAR_FIELD_LIFETIME
+        self.field_ends = MAGNETAR_FIELD_LIFETIME  # field-death deadline on the universe clock (sim.timers)
         self.color_phase = random.uniform(0, 2 * math.pi)
-        self.latched = False  # gripping the barrier (set each frame by Barrier.update_deformation)
+        self.latched = False  # gripping the barrier (set each frame by Barrier.accumulate_deformation)
 
     def apply_magnetism(self, universe, delta_time):
         clouds = universe.clouds
@@ -486,10 +455,9 @@ class Magnetar(NeutronStar):
         self.vy += float((ky * clouds.M).sum()) / self.mass
 
     def update_field(self, universe, delta_time):
-        """Advance the color oscillation, tick down the field lifetime, and roll for a
-        giant flare: an outward pulse on the shared BH-merger pulse list, paid for in mass."""
+        """Advance the color oscillation and roll for a giant flare: an outward merger-kind
+        ring (sim.pulses), paid for in mass. The field's death is a scheduled deadline."""
         self.color_phase += MAGNETAR_COLOR_CYCLE_RATE * delta_time
-        self.field_time -= delta_time
 
         if self.pulse_color_state == 1:
             self.pulse_color_duration -= delta_time
@@ -504,11 +472,11 @@ class Magnetar(NeutronStar):
         # itself into negative mass.
         if (not self.latched and self.mass > MAGNETAR_FLARE_MASS_COST
                 and random.random() < MAGNETAR_FLARE_CHANCE):
-            universe.black_hole_pulses.append([self.x, self.y, 0, MAGNETAR_FLARE_ENERGY])
+            universe.pulses.emit_merger(self.x, self.y, MAGNETAR_FLARE_ENERGY)
             self.mass -= MAGNETAR_FLARE_MASS_COST
             self.pulse_color_state = 1
             self.pulse_color_duration = NEUTRON_STAR_PULSE_COLOR_DURATION
-            universe.event_log.append("MAGNETAR GIANT FLARE — magnetic field snaps and reconnects")
+            universe.event_log.emit(E.MAGNETAR_FLARE)
 
     def decay(self, delta_time):
         self.mass -= MAGNETAR_DECAY_RATE * delta_time
@@ -520,18 +488,18 @@ class WhiteDwarf:
     invisible (a black dwarf), at which point physics.step removes it. Black holes can still
     eat one, and two colliding white dwarfs detonate as a Type Ia supernova."""
 
-    def __init__(self, x, y, mass):
+    def __init__(self, x, y, mass, born=0.0):
         self.id = generate_unique_id()
         self.x = x
         self.y = y
         self.vx = 0.0
         self.vy = 0.0
         self.mass = mass
-        self.age = 0.0
+        self.born = born  # universe-clock time of birth (sim.timers); cooling runs off the clock
 
-    def cooling(self):
-        """0.0 fresh and white-hot → 1.0 fully cooled (black dwarf)."""
-        return min(self.age / WHITE_DWARF_COOL_TIME, 1.0)
+    def cooling(self, now):
+        """0.0 fresh and white-hot → 1.0 fully cooled (black dwarf), at universe-clock `now`."""
+        return min((now - self.born) / WHITE_DWARF_COOL_TIME, 1.0)
 
     def apply_gravity(self, universe, delta_time):
         clouds = universe.clouds
@@ -0,0 +1,117 @@
+"""Astrophysical event records, formatted only when something reads them.
+
+Every event used to append a freshly built f-string (often via star_class_name) to the
+universe's event log — even with the ticker hidden, where nobody would ever read it — and the
+sim loop then compared those strings to coalesce repeats. Events are now recorded as compact
+tuples in a per-universe ring buffer:
+
+    (code, universe uid, class index, params)
+
+  code        — one of the module constants below; indexes _TEMPLATES
+  uid         — the emitting universe's id (Universe.uid), kept when a dead universe's final
+                records pass to a survivor
+  class index — a row of STAR_CLASSES / STAR_CLASS_WOLF_RAYET for events that name the star
+                (config.star_class_index), NO_CLASS otherwise
+  params      — a tuple of numbers the template needs (rip dials, a dying universe's Z)
+
+A bursty frame costs a tuple per event; text() builds the string only for the ticker lines
+actually drawn. Two records are the "same event" for coalescing when key() matches — the
+same test the old string comparison made, since the universe never appeared in the text.
+"""
+from sim.config import EVENT_LOG_CAPACITY, STAR_CLASS_NAMES
+
+NO_CLASS = -1
+
+(SUPERNOVA_II, SUPERNOVA_IA, COLLAPSE_HOLE, COLLAPSE_PULSAR, COLLAPSE_MAGNETAR,
+ KILONOVA_HOLE, KILONOVA_MAGNETAR, RED_GIANT, PLANETARY_NEBULA, BLACK_DWARF,
+ BLACK_HOLE_MERGER, BLACK_HOLE_EVAPORATED, QUASAR_FLARE, PULSAR_DEATH_LINE, MAGNETAR_FLARE,
+ CIV_EMERGES, CIV_LOST_SUPERNOVA, CIV_LOST_COLLAPSE, CIV_LOST_GIANT,
+ SPACETIME_RIP, BIG_CRUNCH, HEAT_DEATH, UNIVERSE_LOST) = range(23)
+CODE_COUNT = 23
+
+# Ticker text per code: `{cls}` is the star's class name, `{0}`.. the record's params.
+_TEMPLATES = (
+    "SUPERNOVA (TYPE II) — {cls} explodes, seeding metals",
+    "SUPERNOVA (TYPE IA) — white dwarfs detonate, forging iron",
+    "CORE COLLAPSE — {cls} implodes into a black hole",
+    "CORE COLLAPSE — {cls} collapses; a pulsar is born",
+    "CORE COLLAPSE — {cls} collapses; a magnetar is born",
+    "KILONOVA — neutron stars merge; gold forged, black hole left",
+    "KILONOVA — neutron stars merge; gold forged, magnetar left",
+    "RED GIANT — {cls} swells off the main sequence",
+    "PLANETARY NEBULA — the giant sheds its envelope; a white dwarf remains",
+    "BLACK DWARF — a white dwarf finishes cooling, fades from view",
+    "BLACK HOLE MERGER — gravitational waves ripple out",
+    "BLACK HOLE EVAPORATED — Hawking radiation wins in the end",
+    "QUASAR FLARE — Eddington-choked accretion lights the disk",
+    "PULSAR DEATH LINE — spin-down silences the beacon",
+    "MAGNETAR GIANT FLARE — magnetic field snaps and reconnects",
+    "CIVILIZATION EMERGES — a world lights its star's shadow",
+    "CIVILIZATION LOST — vaporized by its star's supernova",
+    "CIVILIZATION LOST — its star collapses in an instant",
+    "CIVILIZATION LOST — engulfed by its swelling star",
+    "SPACETIME RIP — a child universe opens; its constants drift "
+    "(G x{0:.2f}, fusion x{1:.2f}, collapse x{2:.2f})",
+    "BIG CRUNCH — a universe contracts to a point; nothing gets out (Z {0:.2f})",
+    "HEAT DEATH — a universe completes its chemistry (Z {0:.2f}) and goes dark",
+    "UNIVERSE LOST — the last of its matter is gone (Z {0:.2f})",
+)
+
+
+def text(record):
+    """Ticker text for one record."""
+    code, _uid, cls, params = record
+    return _TEMPLATES[code].format(*params, cls=STAR_CLASS_NAMES[cls] if cls != NO_CLASS else "")
+
+
+def key(record):
+    """Coalescing identity: everything the text shows (the universe is not part of it)."""
+    return record[0], record[2], record[3]
+
+
+class EventLog:
+    """One universe's event records since the last drain, in a preallocated ring. emit() is
+    the hot call; a burst past `capacity` overwrites the oldest records (counted in
+    `dropped`) instead of growing."""
+
+    __slots__ = ('uid', 'dropped', '_buf', '_head', '_n')
+
+    def __init__(self, uid, capacity=EVENT_LOG_CAPACITY):
+        self.uid = uid
+        self.dropped = 0
+        self._buf = [None] * capacity
+        self._head = 0  # slot of the oldest record
+        self._n = 0
+
+    def __len__(self):
+        return self._n
+
+    def emit(self, code, cls=NO_CLASS, *params):
+        self._put((code, self.uid, cls, params))
+
+    def _put(self, record):
+        buf = self._buf
+        cap = len(buf)
+        if self._n < cap:
+            buf[(self._head + self._n) % cap] = record
+            self._n += 1
+        else:
+            buf[self._head] = record
+            self._head = (self._head + 1) % cap
+            self.dropped += 1
+
+    def extend(self, other):
+        """Append another log's records (a dead universe's last events passing to a
+        survivor); they keep their own universe id."""
+        for record in other.drain():
+            self._put(record)
+
+    def drain(self):
+        """The records oldest first; the log is empty afterwards."""
+        buf, head, n, cap = self._buf, self._head, self._n, len(self._buf)
+        if head + n <= cap:
+            out = buf[head:head + n]
+        else:
+            out = buf[head:] + buf[:head + n - cap]
+        self._head = self._n = 0
+        return out
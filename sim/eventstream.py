@@ -0,0 +1,185 @@
+"""Append-only binary event stream for offline analysis of long runs.
+
+The ticker forgets an event after UI_TICKER_LIFETIME seconds. With EVENT_STREAM_PATH set,
+the outcome events that cosmological natural selection is measured by (core collapses,
+mergers of black holes, neutron stars and white dwarfs (Type Ia), rips, civilization births,
+universe deaths — STREAMED below) are also appended to a file, one fixed-width record each,
+so many long runs can be pooled and compared later.
+
+File layout (little-endian):
+    header, written once when the file is new:
+        MAGIC (8 bytes), u16 record size, u16 code count, u32 name-table length,
+        then the event code names (CODE_NAMES, by code), '\\n'-joined UTF-8
+    records, RECORD_SIZE bytes each:
+        f64 simulated year, u32 universe uid, u32 parent uid (0 = a Big Bang universe),
+        u16 event code, i16 star class index (-1 = none),
+        f32 x3 the universe's LocalPhysics dials (g, fusion, collapse),
+        f32 x3 the event's own params (zero-padded)
+A record with code RUN_MARK opens every run (and every reset), so runs appended to the same
+file can be told apart.
+
+The frame never touches the disk: sim.py hands each frame's drained records to consume(),
+which keeps only the streamed codes, and end_frame() puts the batch on a bounded queue with
+put_nowait. A daemon writer thread packs and writes the batches; if it falls behind and the
+queue fills, whole batches are dropped (counted in `dropped_batches`) rather than stalling
+the frame. A failed write (full disk, a vanished file) is counted in `write_errors` and its
+batch lost; the writer keeps draining, so neither the frame nor close() can be wedged by it.
+"""
+import os
+import queue
+import struct
+import threading
+
+from sim.config import EVENT_STREAM_QUEUE_FRAMES, EVENT_STREAM_CLOSE_TIMEOUT
+from sim import events as E
+
+MAGIC = b'SIMEVT\x00\x01'
+RUN_MARK = 0xFFFF
+_RECORD = struct.Struct('<dIIHhffffff')
+RECORD_SIZE = _RECORD.size
+
+STREAMED = frozenset((E.COLLAPSE_HOLE, E.COLLAPSE_PULSAR, E.COLLAPSE_MAGNETAR,
+                      E.BLACK_HOLE_MERGER, E.KILONOVA_HOLE, E.KILONOVA_MAGNETAR,
+                      E.SUPERNOVA_IA, E.SPACETIME_RIP, E.CIV_EMERGES,
+                      E.BIG_CRUNCH, E.HEAT_DEATH, E.UNIVERSE_LOST))
+_DEATHS = frozenset((E.BIG_CRUNCH, E.HEAT_DEATH, E.UNIVERSE_LOST))  # a universe's last record
+
+# The header's name table, by code. Spelled out rather than scraped from sim.events, so a new
+# constant there can't silently change the header; a new code must be appended here too.
+CODE_NAMES = (
+    'SUPERNOVA_II', 'SUPERNOVA_IA', 'COLLAPSE_HOLE', 'COLLAPSE_PULSAR', 'COLLAPSE_MAGNETAR',
+    'KILONOVA_HOLE', 'KILONOVA_MAGNETAR', 'RED_GIANT', 'PLANETARY_NEBULA', 'BLACK_DWARF',
+    'BLACK_HOLE_MERGER', 'BLACK_HOLE_EVAPORATED', 'QUASAR_FLARE', 'PULSAR_DEATH_LINE',
+    'MAGNETAR_FLARE', 'CIV_EMERGES', 'CIV_LOST_SUPERNOVA', 'CIV_LOST_COLLAPSE', 'CIV_LOST_GIANT',
+    'SPACETIME_RIP', 'BIG_CRUNCH', 'HEAT_DEATH', 'UNIVERSE_LOST',
+)
+assert len(CODE_NAMES) == E.CODE_COUNT
+assert all(getattr(E, name) == code for code, name in enumerate(CODE_NAMES))
+
+_NO_DIALS = (float('nan'),) * 3
+
+
+def _header():
+    names = '\n'.join(CODE_NAMES).encode('utf-8')
+    return MAGIC + struct.pack('<HHI', RECORD_SIZE, E.CODE_COUNT, len(names)) + names
+
+
+class EventStream:
+    """Background-written sink for one file. consume()/end_frame() run on the frame thread;
+    close() drains the queue and joins the writer."""
+
+    def __init__(self, path, queue_frames=EVENT_STREAM_QUEUE_FRAMES):
+        self.path = path
+        self.dropped_batches = 0
+        self.write_errors = 0
+        self.last_error = None  # the most recent failed write's exception
+        self._lineage = {}  # live uid -> (parent uid, g, fusion, collapse); dials are fixed at birth
+        self._batch = []
+        self._queue = queue.Queue(maxsize=queue_frames)
+        fresh = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, 'ab')
+        if fresh:
+            self._file.write(_header())
+        self._thread = threading.Thread(target=self._run, name='event-stream', daemon=True)
+        self._thread.start()
+        self.mark_run()
+
+    def mark_run(self):
+        """Open a run in the stream (a fresh Big Bang: years restart at 0)."""
+        self._lineage.clear()  # every universe of the previous run is gone
+        self._batch.append((0.0, 0, 0, RUN_MARK, E.NO_CLASS) + _NO_DIALS + ((),))
+
+    def consume(self, universe, records, year):
+        """Keep this universe's streamed records from one drain. A dead universe's last
+        records arrive through a survivor's log, so lineage is looked up by each record's
+        own uid — registered the first time that universe was seen here, and dropped with
+        its death record, so the table only ever holds live universes."""
+        lineage = self._lineage
+        if universe.uid not in lineage:
+            local = universe.local
+            lineage[universe.uid] = (universe.parent_uid, local.g, local.fusion, local.collapse)
+        for code, uid, cls, params in records:
+            if code in STREAMED:
+                if code in _DEATHS:
+                    parent, g, fusion, collapse = lineage.pop(uid, (0,) + _NO_DIALS)
+                else:
+                    parent, g, fusion, collapse = lineage.get(uid, (0,) + _NO_DIALS)
+                self._batch.append((year, uid, parent, code, cls, g, fusion, collapse, params))
+
+    def end_frame(self):
+        if not self._batch:
+            return
+        try:
+            self._queue.put_nowait(self._batch)
+        except queue.Full:
+            self.dropped_batches += 1
+        self._batch = []
+
+    def close(self):
+        """Flush what the writer can take within EVENT_STREAM_CLOSE_TIMEOUT and stop it. If the
+        writer is gone or stuck, the batches still queued are dropped instead of waiting."""
+        self.end_frame()
+        if self._thread.is_alive():
+            try:
+                self._queue.put(None, timeout=EVENT_STREAM_CLOSE_TIMEOUT)
+            except queue.Full:
+                self._drop_pending()
+                self._queue.put_nowait(None)
+            self._thread.join(EVENT_STREAM_CLOSE_TIMEOUT)
+        else:
+            self._drop_pending()
+        try:
+            self._file.close()
+        except (OSError, ValueError) as err:
+            self.write_errors += 1
+            self.last_error = err
+
+    def _drop_pending(self):
+        while True:
+            try:
+                batch = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if batch is not None:
+                self.dropped_batches += 1
+
+    def _run(self):
+        pack = _RECORD.pack
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                break
+            out = []
+            for year, uid, parent, code, cls, g, fusion, collapse, params in batch:
+                p = (tuple(params) + (0.0, 0.0, 0.0))[:3]
+                out.append(pack(year, uid, parent, code, cls, g, fusion, collapse, *p))
+            try:
+                self._file.write(b''.join(out))
+                if self._queue.empty():
+                    self._file.flush()
+            except (OSError, ValueError) as err:  # ValueError: the file was closed under us
+                self.write_errors += 1
+                self.last_error = err
+        try:
+            self._file.flush()
+        except (OSError, ValueError) as err:
+            self.write_errors += 1
+            self.last_error = err
+
+
+def read(path):
+    """Yield (year, uid, parent_uid, code_name, class_index, (g, fusion, collapse), params)
+    for every record in a stream file — the offline side of the format above."""
+    with open(path, 'rb') as f:
+        head = f.read(len(MAGIC) + 8)
+        if head[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path}: not an event stream")
+        size, _count, names_len = struct.unpack('<HHI', head[len(MAGIC):])
+        names = f.read(names_len).decode('utf-8').split('\n')
+        while True:
+            raw = f.read(size)
+            if len(raw) < size:
+                return
+            year, uid, parent, code, cls, g, fusion, collapse, p0, p1, p2 = _RECORD.unpack(raw[:RECORD_SIZE])
+            name = 'RUN' if code == RUN_MARK else names[code]
+            yield year, uid, parent, name, cls, (g, fusion, collapse), (p0, p1, p2)
@@ -7,19 +7,37 @@
              field's max cloud size, so adjacent cells contain every overlapping pair — the
              grid is an exact filter, not an approximation. Falls back to the dense loop when
              the field's extent would make the grid bigger than the pair matrix.
-- collide_shocked: the shock-triggered merge pass over a small index list. Upper-triangle on
-             purpose — one merge roll per pair per pass, matching the historical Python loop
-             (the dense collide rolls each ordered pair, effectively 1-(1-p)^2; routing shocks
-             through it would silently raise the shock merge rate).
+- CollisionGrid: that grid as a reusable per-universe workspace (buffers kept across frames,
+             rebuilt in place), also queryable from Python for other neighborhood lookups
+             (box query, and the annulus query the gravitational-wave rings use).
+- collide_shocked: the shock-triggered merge pass, grid-bucketed like collide but over the
+             shocked rows only. Upper-triangle on purpose — one merge roll per pair per pass,
+             matching the historical Python loop (the dense collide rolls each ordered pair,
+             effectively 1-(1-p)^2; routing shocks through it would silently raise the shock
+             merge rate).
 - bh_forces: Barnes-Hut cloud gravity — flat-array quadtree, nogil. Computes the same force
              formula as the GPU and numpy-brute backends (tiered grav-mass, softening); theta
-             controls the approximation. Returns 0 if the node pool overflows (pathological
-             input), in which case the caller falls back to the exact numpy sum.
+             controls the approximation. Returns the number of tree nodes built (the perf
+             overlay's tree gauge), or -1 if the node pool overflows (pathological input), in
+             which case the caller falls back to the exact numpy sum.
+- integrate_and_contain: the end-of-step tail in one sweep over the rows — velocity damping,
+             drift, shock decay, then barrier containment against the ring's radii (the same
+             interpolation as Barrier.radius_at). Replaces ~ten numpy passes and their temporaries.
+
+Every merge roll draws from a numpy BitGenerator through its C API (bitgen_t) — per-universe,
+Philox streams from sim.streams, so seeded runs cover the compiled passes too.
 """
 
 import numpy as np
-from libc.math cimport sqrt, floor
-from libc.stdlib cimport rand, RAND_MAX
+from libc.math cimport sqrt, floor, hypot, atan2, cos, sin, fmod, M_PI
+from libc.string cimport memset
+from cpython.pycapsule cimport PyCapsule_GetPointer
+from numpy.random cimport bitgen_t
+
+
+cdef bitgen_t* _bitgen(object bit_generator) except NULL:
+    """The C view of a numpy BitGenerator (sim.streams hands out Philox ones)."""
+    return <bitgen_t*>PyCapsule_GetPointer(bit_generator.capsule, "BitGenerator")
 
 
 cdef inline bint _try_merge(double[::1] x, double[::1] y, double[::1] size, double[::1] mass,
@@ -27,9 +45,10 @@ cdef inline bint _try_merge(double[::1] x, double[::1] y, double[::1] size, doub
                             unsigned char[::1] removed, Py_ssize_t i, Py_ssize_t j,
                             double merge_chance, double protostar_threshold, double max_mass,
                             double start_size, double min_size, double start_mass,
-                            double growth_rate) noexcept nogil:
+                            double growth_rate, bitgen_t* rng) noexcept nogil:
     """One candidate pair: compatibility -> AABB overlap -> merge roll -> resolve.
-    Returns True when i was consumed (the caller's outer loop must stop scanning i)."""
+    Returns True when i was consumed (the caller's outer loop must stop scanning i).
+    The roll draws from `rng`, the calling pass's stream."""
     cdef Py_ssize_t surv, cons
     cdef bint is_proto, compat
     cdef double merged, s
@@ -41,7 +60,7 @@ cdef inline bint _try_merge(double[::1] x, double[::1] y, double[::1] size, doub
     if not (x[i] < x[j] + size[j] and x[i] + size[i] > x[j]
             and y[i] < y[j] + size[j] and y[i] + size[i] > y[j]):
         return False
-    if (<double>rand() / RAND_MAX) >= merge_chance:
+    if rng.next_double(rng.state) >= merge_chance:
         return False
     # Higher element index survives (tie -> i).
     if elem[j] > elem[i]:
@@ -61,37 +80,205 @@ cdef inline bint _try_merge(double[::1] x, double[::1] y, double[::1] size, doub
     return cons == i
 
 
+cdef class CollisionGrid:
+    """Reusable counting-sort bucket grid — the enumeration workspace collide and
+    collide_shocked build every call, kept across frames so its buffers are rebuilt in place
+    instead of reallocated. Cell size is the binned entries' max size (floored at 1), so the
+    +-1 neighborhood of an entry's cell holds every entry whose AABB can overlap it.
+
+    Entries are rows 0..n-1, or positions into an index list when build() gets `idx`. A grid
+    describes the rows as they were at its last build(): after the field compacts (merges,
+    captures) rebuild it before querying. One per universe (physics.Universe.collision_grid).
+    """
+    cdef Py_ssize_t[::1] cell
+    cdef Py_ssize_t[::1] cstart
+    cdef Py_ssize_t[::1] order
+    cdef readonly Py_ssize_t count, gw, gh, ncells, allocations
+    cdef readonly double minx, miny, cs
+
+    def __cinit__(self):
+        self.cell = np.empty(0, dtype=np.intp)
+        self.cstart = np.zeros(1, dtype=np.intp)
+        self.order = np.empty(0, dtype=np.intp)
+        self.count = 0
+        self.gw = self.gh = self.ncells = 0
+        self.allocations = 0  # buffer (re)allocations over the grid's life (debug counter)
+
+    cpdef bint build(self, double[::1] x, double[::1] y, double[::1] size, Py_ssize_t n,
+                     long[::1] idx=None):
+        """Bin n entries (entry k is row k, or row idx[k]). Returns False — and leaves the grid
+        empty — when the extent would make the grid bigger than the pair matrix, in which case
+        the caller's dense scan is cheaper."""
+        cdef Py_ssize_t k, i, c
+        cdef double maxx, maxy, smax
+        cdef bint indexed = idx is not None
+        self.count = 0
+        if n < 1:
+            return False
+        i = idx[0] if indexed else 0
+        self.minx = x[i]; maxx = x[i]; self.miny = y[i]; maxy = y[i]; smax = size[i]
+        for k in range(1, n):
+            i = idx[k] if indexed else k
+            if x[i] < self.minx: self.minx = x[i]
+            if x[i] > maxx: maxx = x[i]
+            if y[i] < self.miny: self.miny = y[i]
+            if y[i] > maxy: maxy = y[i]
+            if size[i] > smax: smax = size[i]
+        self.cs = smax if smax > 1.0 else 1.0
+        self.gw = <Py_ssize_t>((maxx - self.minx) / self.cs) + 1
+        self.gh = <Py_ssize_t>((maxy - self.miny) / self.cs) + 1
+        self.ncells = self.gw * self.gh
+        if self.ncells > 4 * n * n or self.ncells > (1 << 22):
+            return False
+
+        # Grow-only entry buffers; the cell table also shrinks back when a sparse frame left it
+        # far oversized (it can reach 4M cells, too much to pin per universe).
+        if self.cell.shape[0] < n:
+            self.cell = np.empty(n, dtype=np.intp)
+            self.order = np.empty(n, dtype=np.intp)
+            self.allocations += 1
+        if self.cstart.shape[0] < self.ncells + 1 or self.cstart.shape[0] > 8 * (self.ncells + 1) + 4096:
+            self.cstart = np.empty(self.ncells + 1, dtype=np.intp)
+            self.allocations += 1
+
+        cdef Py_ssize_t[::1] cell = self.cell
+        cdef Py_ssize_t[::1] cstart = self.cstart
+        cdef Py_ssize_t[::1] order = self.order
+        cdef Py_ssize_t gw = self.gw, ncells = self.ncells
+        cdef double minx = self.minx, miny = self.miny, cs = self.cs
+        with nogil:
+            memset(&cstart[0], 0, (ncells + 1) * sizeof(Py_ssize_t))
+            for k in range(n):
+                i = idx[k] if indexed else k
+                cell[k] = (<Py_ssize_t>((y[i] - miny) / cs)) * gw + <Py_ssize_t>((x[i] - minx) / cs)
+                cstart[cell[k] + 1] += 1
+            for c in range(ncells):
+                cstart[c + 1] += cstart[c]
+            for k in range(n):
+                order[cstart[cell[k]]] = k
+                cstart[cell[k]] += 1
+            for c in range(ncells, 0, -1):   # undo the in-place bump: cstart[c] = first entry of cell c
+                cstart[c] = cstart[c - 1]
+            cstart[0] = 0
+        self.count = n
+        return True
+
+    def query(self, double px, double py, double radius):
+        """Entries binned in the cells overlapping the box [px-radius, px+radius] x
+        [py-radius, py+radius] — a superset of those within `radius`; filter exactly after."""
+        if self.count == 0:
+            return np.empty(0, dtype=np.intp)
+        cdef Py_ssize_t gx0 = <Py_ssize_t>floor((px - radius - self.minx) / self.cs)
+        cdef Py_ssize_t gx1 = <Py_ssize_t>floor((px + radius - self.minx) / self.cs)
+        cdef Py_ssize_t gy0 = <Py_ssize_t>floor((py - radius - self.miny) / self.cs)
+        cdef Py_ssize_t gy1 = <Py_ssize_t>floor((py + radius - self.miny) / self.cs)
+        if gx0 < 0: gx0 = 0
+        if gy0 < 0: gy0 = 0
+        if gx1 > self.gw - 1: gx1 = self.gw - 1
+        if gy1 > self.gh - 1: gy1 = self.gh - 1
+        if gx0 > gx1 or gy0 > gy1:
+            return np.empty(0, dtype=np.intp)
+        order = np.asarray(self.order)
+        cstart = np.asarray(self.cstart)
+        parts = [order[cstart[gj * self.gw + gx0]:cstart[gj * self.gw + gx1 + 1]]
+                 for gj in range(gy0, gy1 + 1)]  # a cell row's span is contiguous in `order`
+        return np.concatenate(parts)
+
+    def annulus(self, double px, double py, double r_inner, double r_outer,
+                double[::1] x=None, double[::1] y=None):
+        """Entries binned in the cells that can hold a point at distance [r_inner, r_outer]
+        from (px, py) — a superset of the annulus. Given the entries' coordinates x, y, only
+        the entries exactly inside (r_inner^2 <= d^2 <= r_outer^2) are kept. Per cell row the
+        intersecting cells are at most two column spans (the cells wholly inside r_inner are
+        skipped), and a row span is contiguous in `order`, so the cost scales with the
+        annulus, not the field. Entries come out grouped by cell, not in row order."""
+        if self.count == 0 or r_outer < 0:
+            return np.empty(0, dtype=np.intp)
+        out = np.empty(self.count, dtype=np.intp)
+        cdef Py_ssize_t[::1] res = out
+        cdef Py_ssize_t[::1] order = self.order
+        cdef Py_ssize_t[::1] cstart = self.cstart
+        cdef Py_ssize_t gw = self.gw, gh = self.gh
+        cdef double minx = self.minx, miny = self.miny, cs = self.cs
+        cdef Py_ssize_t gy0 = <Py_ssize_t>floor((py - r_outer - miny) / cs)
+        cdef Py_ssize_t gy1 = <Py_ssize_t>floor((py + r_outer - miny) / cs)
+        cdef Py_ssize_t gj, g0, g1, i0, i1, k, m = 0
+        cdef double top, bot, dy_near, dy_far, h, ddx, ddy, d2
+        cdef double lo2 = r_inner * r_inner, hi2 = r_outer * r_outer
+        cdef bint exact = x is not None and y is not None
+        if gy0 < 0: gy0 = 0
+        if gy1 > gh - 1: gy1 = gh - 1
+        with nogil:
+            for gj in range(gy0, gy1 + 1):
+                top = miny + gj * cs
+                bot = top + cs
+                if py < top:
+                    dy_near = top - py
+                elif py > bot:
+                    dy_near = py - bot
+                else:
+                    dy_near = 0.0
+                dy_far = py - top if py - top > bot - py else bot - py
+                if dy_near > r_outer:
+                    continue
+                h = sqrt(r_outer * r_outer - dy_near * dy_near)
+                g0 = <Py_ssize_t>floor((px - h - minx) / cs)
+                g1 = <Py_ssize_t>floor((px + h - minx) / cs)
+                if g0 < 0: g0 = 0
+                if g1 > gw - 1: g1 = gw - 1
+                if g0 > g1:
+                    continue
+                # Columns whose whole cell lies strictly within r_inner: [i0, i1].
+                i0 = 1
+                i1 = 0
+                if r_inner > dy_far:
+                    h = sqrt(r_inner * r_inner - dy_far * dy_far)
+                    i0 = <Py_ssize_t>floor((px - h - minx) / cs) + 1
+                    i1 = <Py_ssize_t>floor((px + h - minx) / cs) - 1
+                    if i0 < g0: i0 = g0
+                    if i1 > g1: i1 = g1
+                if i0 > i1:
+                    i0 = g1 + 1
+                    i1 = g1
+                for k in range(cstart[gj * gw + g0], cstart[gj * gw + i0]):
+                    res[m] = order[k]; m += 1
+                for k in range(cstart[gj * gw + i1 + 1], cstart[gj * gw + g1 + 1]):
+                    res[m] = order[k]; m += 1
+            if exact:
+                k = m
+                m = 0
+                for i0 in range(k):
+                    ddx = x[res[i0]] - px
+                    ddy = y[res[i0]] - py
+                    d2 = ddx * ddx + ddy * ddy
+                    if d2 >= lo2 and d2 <= hi2:
+                        res[m] = res[i0]; m += 1
+        return out[:m]
+
+
 cpdef void collide(double[::1] x, double[::1] y, double[::1] size, double[::1] mass,
                    double[::1] vx, double[::1] vy, long[::1] elem, unsigned char[::1] removed,
                    Py_ssize_t n, double merge_chance, double protostar_threshold, double max_mass,
-                   double start_size, double min_size, double start_mass, double growth_rate):
+                   double start_size, double min_size, double start_mass, double growth_rate,
+                   CollisionGrid grid=None, object stream=None):
     """Cloud collision detection + merge. Grid-bucketed candidate enumeration (exact — see
     module docstring); same ordered-pair roll semantics as the historical dense loop, whose
     row-order outer scan is preserved. Only the inner enumeration ORDER differs from the dense
     loop, i.e. the RNG interleaving — statistically identical, bitwise different (by design;
-    runs are unrepeatable anyway). Modifies mass/vx/vy/size and `removed` in place."""
+    runs are unrepeatable anyway). Modifies mass/vx/vy/size and `removed` in place. Pass the
+    universe's CollisionGrid to reuse its buffers; without one a throwaway grid is built.
+    Merge rolls draw from `stream`, a numpy BitGenerator the caller owns for the call (a
+    universe's kernel stream, see sim.streams); None = a fresh OS-seeded Philox."""
     if n < 2:
         return
-    cdef Py_ssize_t i, j, k, gi, gj, gx0, gx1, gy0, gy1, c
-    cdef double minx, maxx, miny, maxy, smax, cs
-    cdef Py_ssize_t gw, gh, ncells
-    cdef bint i_dead
+    cdef Py_ssize_t i, j
+    if grid is None:
+        grid = CollisionGrid()
+    if stream is None:
+        stream = np.random.Philox()
+    cdef bitgen_t* rng = _bitgen(stream)
 
-    # Field extent and max size set the cell: overlap needs |dx| < max(size_i, size_j) <= smax,
-    # so every overlapping partner of i lives within +-1 cell of i's cell.
-    minx = x[0]; maxx = x[0]; miny = y[0]; maxy = y[0]; smax = size[0]
-    for i in range(1, n):
-        if x[i] < minx: minx = x[i]
-        if x[i] > maxx: maxx = x[i]
-        if y[i] < miny: miny = y[i]
-        if y[i] > maxy: maxy = y[i]
-        if size[i] > smax: smax = size[i]
-    cs = smax if smax > 1.0 else 1.0
-    gw = <Py_ssize_t>((maxx - minx) / cs) + 1
-    gh = <Py_ssize_t>((maxy - miny) / cs) + 1
-    ncells = gw * gh
-
-    if ncells > 4 * n * n or ncells > (1 << 22):
+    if not grid.build(x, y, size, n):
         # Pathological spread: grid would dwarf the pair matrix — dense scan is cheaper.
         with nogil:
             for i in range(n):
@@ -102,33 +289,17 @@ cpdef void collide(double[::1] x, double[::1] y, double[::1] size, double[::1] m
                         continue
                     if _try_merge(x, y, size, mass, vx, vy, elem, removed, i, j,
                                   merge_chance, protostar_threshold, max_mass,
-                                  start_size, min_size, start_mass, growth_rate):
+                                  start_size, min_size, start_mass, growth_rate, rng):
                         break
         return
 
-    # Counting sort of bodies into cells (row order preserved within each cell).
-    cell_np = np.empty(n, dtype=np.intp)
-    start_np = np.zeros(ncells + 1, dtype=np.intp)
-    order_np = np.empty(n, dtype=np.intp)
-    cdef Py_ssize_t[::1] cell = cell_np
-    cdef Py_ssize_t[::1] cstart = start_np
-    cdef Py_ssize_t[::1] order = order_np
-
+    cdef Py_ssize_t[::1] cell = grid.cell
+    cdef Py_ssize_t[::1] cstart = grid.cstart
+    cdef Py_ssize_t[::1] order = grid.order
+    cdef Py_ssize_t gw = grid.gw, gh = grid.gh
+    cdef Py_ssize_t k, gi, gj, gx0, gx1, gy0, gy1, c
+    cdef bint i_dead
     with nogil:
-        for i in range(n):
-            gi = <Py_ssize_t>((x[i] - minx) / cs)
-            gj = <Py_ssize_t>((y[i] - miny) / cs)
-            cell[i] = gj * gw + gi
-            cstart[cell[i] + 1] += 1
-        for c in range(ncells):
-            cstart[c + 1] += cstart[c]
-        for i in range(n):
-            order[cstart[cell[i]]] = i
-            cstart[cell[i]] += 1
-        for c in range(ncells, 0, -1):   # undo the in-place bump: cstart[c] = first index of cell c
-            cstart[c] = cstart[c - 1]
-        cstart[0] = 0
-
         for i in range(n):
             if removed[i]:
                 continue
@@ -148,7 +319,7 @@ cpdef void collide(double[::1] x, double[::1] y, double[::1] size, double[::1] m
                             continue
                         if _try_merge(x, y, size, mass, vx, vy, elem, removed, i, j,
                                       merge_chance, protostar_threshold, max_mass,
-                                      start_size, min_size, start_mass, growth_rate):
+                                      start_size, min_size, start_mass, growth_rate, rng):
                             i_dead = True
                             break
                     if i_dead:
@@ -161,33 +332,92 @@ cpdef void collide_shocked(long[::1] idx, double[::1] x, double[::1] y, double[:
                            double[::1] mass, double[::1] vx, double[::1] vy, long[::1] elem,
                            unsigned char[::1] removed, Py_ssize_t m, double merge_chance,
                            double protostar_threshold, double max_mass, double start_size,
-                           double min_size, double start_mass, double growth_rate) nogil:
+                           double min_size, double start_mass, double growth_rate,
+                           CollisionGrid grid=None, object stream=None):
     """Shock-triggered merge pass: upper-triangle over the shocked index list `idx` (length m),
     one roll per pair per pass — the exact statistics of the historical Python loop in
-    physics._triggered_mergers, which stays as the semantic reference/fallback."""
+    physics._triggered_mergers, which stays as the semantic reference/fallback.
+
+    Candidates come from the same counting-sort grid as collide, built over the shocked rows
+    only; position b is a candidate for a only when b > a, so every unordered pair is still
+    rolled at most once and consumed rows still drop out. Only the enumeration ORDER (and so
+    the RNG interleaving) differs from the plain triangle. Merges only ever shrink a survivor's
+    size, so a grid cut at the pass's max size stays an exact filter throughout. `stream`
+    as in collide."""
+    if m < 2:
+        return
     cdef Py_ssize_t a, b, i, j
-    for a in range(m):
-        i = idx[a]
-        if removed[i]:
-            continue
-        for b in range(a + 1, m):
-            j = idx[b]
-            if removed[j]:
+    if grid is None:
+        grid = CollisionGrid()
+    if stream is None:
+        stream = np.random.Philox()
+    cdef bitgen_t* rng = _bitgen(stream)
+
+    if not grid.build(x, y, size, m, idx):
+        # Small or widely spread shock set: the plain triangle is cheaper than the grid.
+        with nogil:
+            for a in range(m):
+                i = idx[a]
+                if removed[i]:
+                    continue
+                for b in range(a + 1, m):
+                    j = idx[b]
+                    if removed[j]:
+                        continue
+                    if _try_merge(x, y, size, mass, vx, vy, elem, removed, i, j,
+                                  merge_chance, protostar_threshold, max_mass,
+                                  start_size, min_size, start_mass, growth_rate, rng):
+                        break
+        return
+
+    cdef Py_ssize_t[::1] cell = grid.cell
+    cdef Py_ssize_t[::1] cstart = grid.cstart
+    cdef Py_ssize_t[::1] order = grid.order
+    cdef Py_ssize_t gw = grid.gw, gh = grid.gh
+    cdef Py_ssize_t k, gi, gj, gx0, gx1, gy0, gy1, c
+    cdef bint a_dead
+    with nogil:
+        for a in range(m):
+            i = idx[a]
+            if removed[i]:
                 continue
-            if _try_merge(x, y, size, mass, vx, vy, elem, removed, i, j,
-                          merge_chance, protostar_threshold, max_mass,
-                          start_size, min_size, start_mass, growth_rate):
-                break
+            gi = cell[a] % gw
+            gj = cell[a] / gw
+            gx0 = gi - 1 if gi > 0 else 0
+            gx1 = gi + 1 if gi + 1 < gw else gw - 1
+            gy0 = gj - 1 if gj > 0 else 0
+            gy1 = gj + 1 if gj + 1 < gh else gh - 1
+            a_dead = False
+            for gj in range(gy0, gy1 + 1):
+                for gi in range(gx0, gx1 + 1):
+                    c = gj * gw + gi
+                    for k in range(cstart[c], cstart[c + 1]):
+                        b = order[k]
+                        if b <= a:
+                            continue
+                        j = idx[b]
+                        if removed[j]:
+                            continue
+                        if _try_merge(x, y, size, mass, vx, vy, elem, removed, i, j,
+                                      merge_chance, protostar_threshold, max_mass,
+                                      start_size, min_size, start_mass, growth_rate, rng):
+                            a_dead = True
+                            break
+                    if a_dead:
+                        break
+                if a_dead:
+                    break
 
 
-cpdef bint bh_forces(double[::1] x, double[::1] y, double[::1] gm,
-                     double[::1] fx, double[::1] fy, Py_ssize_t n,
-                     double G, double soft2, double theta, int max_depth):
+cpdef int bh_forces(double[::1] x, double[::1] y, double[::1] gm,
+                    double[::1] fx, double[::1] fy, Py_ssize_t n,
+                    double G, double soft2, double theta, int max_depth):
     """Barnes-Hut mutual gravity over the whole field. Flat-array quadtree: nodes are rows in
     preallocated arrays, leaf bodies are linked lists. Same physics as forces_brute; theta is
-    the opening angle (0 = exact)."""
+    the opening angle (0 = exact). Returns the number of tree nodes built, or -1 when the node
+    pool (8n + 4*max_depth + 64 rows) overflowed and fx/fy are incomplete."""
     if n < 2:
-        return True
+        return 0
 
     cdef Py_ssize_t cap_nodes = 8 * n + 4 * max_depth + 64
     cdef int[::1] child = np.full(cap_nodes * 4, -1, dtype=np.int32)
@@ -351,4 +581,45 @@ cpdef bint bh_forces(double[::1] x, double[::1] y, double[::1] gm,
                 fx[i] = accx
                 fy[i] = accy
 
-    return ok
+    return node_count if ok else -1
+
+
+cpdef void integrate_and_contain(double[::1] x, double[::1] y, double[::1] vx, double[::1] vy,
+                                 double[::1] shock, Py_ssize_t n, double damping, double dt,
+                                 double cx, double cy, double[::1] radii) noexcept nogil:
+    """Per row: damp velocity, drift with the new velocity (semi-implicit Euler, as
+    physics.step), relax shock toward 0, then contain — a row at or past the ring radius at
+    its angle is pinned to 0.99 of it and loses its outward radial velocity (Barrier.
+    contain_clouds is the numpy reference)."""
+    cdef Py_ssize_t i, i0, i1
+    cdef Py_ssize_t npts = radii.shape[0]
+    cdef double two_pi = 2.0 * M_PI
+    cdef double step = two_pi / npts
+    cdef double dx, dy, dist, angle, idx, t, r, radial, s
+    for i in range(n):
+        vx[i] *= damping
+        vy[i] *= damping
+        x[i] += vx[i] * dt
+        y[i] += vy[i] * dt
+        s = shock[i] - dt
+        shock[i] = s if s > 0.0 else 0.0
+
+        dx = x[i] - cx
+        dy = y[i] - cy
+        dist = hypot(dx, dy)
+        angle = fmod(atan2(dy, dx), two_pi)
+        if angle < 0.0:
+            angle += two_pi
+        idx = angle / step
+        i0 = (<Py_ssize_t>idx) % npts
+        i1 = (i0 + 1) % npts
+        t = idx - floor(idx)
+        r = radii[i0] * (1 - t) + radii[i1] * t
+        if dist >= r:
+            # dist >= r >= 1 (the radii floor in BarrierBank.integrate): division is safe.
+            x[i] = cx + r * 0.99 * cos(angle)
+            y[i] = cy + r * 0.99 * sin(angle)
+            radial = (vx[i] * dx + vy[i] * dy) / dist
+            if radial > 0.0:
+                vx[i] -= (dx / dist) * radial
+                vy[i] -= (dy / dist) * radial
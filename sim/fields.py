@@ -4,6 +4,10 @@ The arrays ARE the simulation state — gravity, integration, containment, and c
 operate on them directly with no per-frame gather/scatter. A cloud is a row index; rare,
 branchy logic (supernovae, streaming, rips) addresses rows by index. Draw-only per-cloud data
 (block offsets, cached sprites) lives in parallel storage compacted in lockstep.
+
+Rows move on every compaction, so each cloud also carries a stable int64 `id`, unique across
+the multiverse and kept when the row moves between universes. State that must follow a cloud
+across frames (timers, render tags) keys on the id and finds the row with CloudField.rows_of.
 """
 import math
 import random
@@ -23,6 +27,16 @@ def pick_element(abundance=None):
     return len(MOLECULAR_CLOUD_START_COLORS) - 1
 
 
+def pick_elements(n, abundance=None):
+    """pick_element for n clouds at once: the same scan of the cumulative abundance table
+    (first bin holding the draw, else the heaviest element), with the n draws taken from
+    numpy's stream in one call."""
+    table = np.asarray(abundance or ELEMENTAL_ABUNDANCE, dtype=np.float64)
+    rand = np.random.random(n)[:, None]
+    hit = (table[:, 0] <= rand) & (rand < table[:, 1])
+    return np.where(hit.any(axis=1), hit.argmax(axis=1), len(MOLECULAR_CLOUD_START_COLORS) - 1)
+
+
 def _random_offsets():
     """Block-cluster offsets, one cloud's worth — same distribution as the original __init__
     (radius ~ U[0.05, 0.22], angle ~ U[0, 2pi] per block), drawn vectorized from numpy's
@@ -32,6 +46,16 @@ def _random_offsets():
     return np.stack((r * np.cos(th), r * np.sin(th)), axis=1)
 
 
+_id_counter = [0]  # next cloud id (ids are never reused, so a stale one can't alias a newcomer)
+
+
+def _issue_ids(m):
+    """The next m cloud ids, ascending."""
+    start = _id_counter[0]
+    _id_counter[0] = start + m
+    return np.arange(start, start + m, dtype=np.int64)
+
+
 def blend_abundance(base, enriched, z):
     """Interpolate two cumulative abundance tables (same element order) by metallicity z in
     [0, 1] — how a universe's ejecta composition drifts metal-rich as it chemically ages."""
@@ -42,17 +66,81 @@ def blend_abundance(base, enriched, z):
             for (b0, b1), (e0, e1) in zip(base, enriched)]
 
 
+def heaviest(mass, k):
+    """Mask of the k heaviest entries of `mass`, ties at the cutoff going to the earliest —
+    the same set a stable descending argsort's first k would pick. Only the cutoff is found
+    (np.argpartition, O(n)); nothing is sorted, so callers can compact with the mask and keep
+    their rows in the order they were."""
+    n = len(mass)
+    if k >= n:
+        return np.ones(n, dtype=bool)
+    if k <= 0:
+        return np.zeros(n, dtype=bool)
+    cutoff = mass[np.argpartition(mass, n - k)[n - k]]  # the k-th largest value
+    keep = mass > cutoff
+    ties = np.flatnonzero(mass == cutoff)
+    keep[ties[:k - int(np.count_nonzero(keep))]] = True
+    return keep
+
+
+class ScratchArena:
+    """Reusable work buffers for the per-step vector passes over one universe's cloud field.
+
+    The hot passes (pulse wavefronts, containment, hole attraction, integration) used to build
+    a dozen fresh n-length temporaries each per frame; they now borrow named buffers from here
+    via numpy `out=` arguments. Buffers are allocated at the field's capacity, so they survive
+    population churn, and are dropped whenever the field reallocates (grows or shrinks).
+    A borrowed view is valid until the same name is borrowed again — names are namespaced per
+    pass so passes never hand each other live data."""
+
+    __slots__ = ('cap', 'allocated', '_bufs')
+
+    def __init__(self, cap):
+        self.cap = cap
+        self.allocated = 0  # bytes this arena has allocated over its lifetime (debug counter)
+        self._bufs = {}
+
+    def get(self, name, n, dtype=np.float64):
+        """Uninitialized length-n view of the named buffer."""
+        buf = self._bufs.get(name)
+        if buf is None or len(buf) < n or buf.dtype != dtype:
+            buf = np.empty(max(self.cap, n), dtype=dtype)
+            self._bufs[name] = buf
+            self.allocated += buf.nbytes
+        return buf[:n]
+
+    def resize(self, cap):
+        self.cap = cap
+        self._bufs.clear()
+
+    def nbytes(self):
+        return sum(buf.nbytes for buf in self._bufs.values())
+
+
+# The 1-D per-row columns (offsets, sprite keys and sprites are handled alongside them).
+_COLUMNS = ('id', 'x', 'y', 'vx', 'vy', 'mass', 'elem', 'emission_count', 'is_star', 'has_civ',
+            'size', 'shock', 'giant')
+
+
 class CloudField:
     """Dense arrays of the live clouds in one universe. Rows [0, n) are alive; capacity grows
-    by doubling. Compaction (`keep`) preserves order, matching the list-filter semantics the
-    object version had."""
+    by doubling and halves back (with hysteresis, see maybe_shrink) once a burst has passed.
+    Compaction (`keep`) preserves order, matching the list-filter semantics the object
+    version had."""
 
-    __slots__ = ('n', 'cap', 'x', 'y', 'vx', 'vy', 'mass', 'elem', 'emission_count',
-                 'is_star', 'has_civ', 'size', 'shock', 'giant', 'offsets', 'sprites', 'sprite_keys')
+    __slots__ = ('n', 'cap', 'id', 'x', 'y', 'vx', 'vy', 'mass', 'elem', 'emission_count',
+                 'is_star', 'has_civ', 'size', 'shock', 'giant', 'offsets', 'sprites', 'sprite_keys',
+                 'scratch', '_low_steps', '_id_index')
 
-    def __init__(self, cap=256):
+    def __init__(self, cap=CLOUD_FIELD_MIN_CAPACITY):
         self.n = 0
         self.cap = cap
+        self._low_steps = 0  # consecutive maybe_shrink() calls with n under cap/4
+        self.scratch = ScratchArena(cap)  # per-step temporaries for the vector passes
+        # id -> row lookup as (ids ascending, their rows), built by rows_of() and dropped by
+        # anything that adds, moves or removes rows; None = rebuild on the next lookup.
+        self._id_index = None
+        self.id = np.zeros(cap, dtype=np.int64)  # stable cloud identity (see module docstring)
         self.x = np.zeros(cap)
         self.y = np.zeros(cap)
         self.vx = np.zeros(cap)
@@ -64,7 +152,7 @@ class CloudField:
         self.has_civ = np.zeros(cap, dtype=bool)  # rare Dyson-swarm civilization on this star
         self.size = np.zeros(cap)
         self.shock = np.zeros(cap)   # seconds of "compressed by a wavefront" remaining (triggered star formation)
-        self.giant = np.zeros(cap)   # seconds of red-giant phase remaining; 0 = main sequence (set when the WD retirement roll hits)
+        self.giant = np.zeros(cap)   # red-giant phase deadline on the universe clock (sim.timers); 0 = main sequence (set when the WD retirement roll hits)
         self.offsets = np.zeros((cap, 7, 2))
         self.sprites = [None] * cap      # cached pygame sprites, draw-only
         # Visual cache key per row: (size, r, g, b, opacity) as int64, -1 = stale/no sprite.
@@ -73,6 +161,8 @@ class CloudField:
 
     # ── views over the alive rows (setters allow `field.VX += ...` on the view) ──
     @property
+    def ID(self): return self.id[:self.n]
+    @property
     def X(self): return self.x[:self.n]
     @X.setter
     def X(self, v): self.x[:self.n] = v
@@ -107,6 +197,10 @@ class CloudField:
     @GIANT.setter
     def GIANT(self, v): self.giant[:self.n] = v
 
+    def tmp(self, name, dtype=np.float64):
+        """Uninitialized length-n scratch buffer (see ScratchArena)."""
+        return self.scratch.get(name, self.n, dtype)
+
     def _ensure(self, extra):
         need = self.n + extra
         if need <= self.cap:
@@ -114,19 +208,56 @@ class CloudField:
         new_cap = self.cap
         while new_cap < need:
             new_cap *= 2
-        for name in ('x', 'y', 'vx', 'vy', 'mass', 'elem', 'emission_count', 'is_star', 'has_civ', 'size', 'shock', 'giant'):
+        self._resize(new_cap)
+
+    def _resize(self, new_cap):
+        """Reallocate every row-parallel array at new_cap, keeping rows [0, n). Fresh arrays
+        (not ndarray.resize) so a shrink actually hands the old pages back to the allocator."""
+        n = self.n
+        for name in _COLUMNS:
             old = getattr(self, name)
-            grown = np.zeros(new_cap, dtype=old.dtype)
-            grown[:self.n] = old[:self.n]
-            setattr(self, name, grown)
-        grown_off = np.zeros((new_cap, 7, 2))
-        grown_off[:self.n] = self.offsets[:self.n]
-        self.offsets = grown_off
-        self.sprites += [None] * (new_cap - self.cap)
-        grown_keys = np.full((new_cap, 5), -1, dtype=np.int64)
-        grown_keys[:self.n] = self.sprite_keys[:self.n]
-        self.sprite_keys = grown_keys
+            fresh = np.zeros(new_cap, dtype=old.dtype)
+            fresh[:n] = old[:n]
+            setattr(self, name, fresh)
+        fresh_off = np.zeros((new_cap, 7, 2))
+        fresh_off[:n] = self.offsets[:n]
+        self.offsets = fresh_off
+        if new_cap > self.cap:
+            self.sprites += [None] * (new_cap - self.cap)
+        else:
+            del self.sprites[new_cap:]
+        fresh_keys = np.full((new_cap, 5), -1, dtype=np.int64)
+        fresh_keys[:n] = self.sprite_keys[:n]
+        self.sprite_keys = fresh_keys
         self.cap = new_cap
+        self.scratch.resize(new_cap)
+
+    def maybe_shrink(self):
+        """Give back capacity left over from a burst (a supernova storm, a rip's inflow).
+        Called once per step: only after n has stayed under cap/4 for CLOUD_FIELD_SHRINK_STEPS
+        consecutive steps does the field halve — down to the smallest power-of-two step that
+        still leaves 2x headroom over n, floored at CLOUD_FIELD_MIN_CAPACITY. The gap between
+        the grow trigger (full) and the shrink trigger (quarter full) is the hysteresis: a
+        population hovering near a boundary can't thrash between sizes."""
+        if self.cap <= CLOUD_FIELD_MIN_CAPACITY or self.n * 4 >= self.cap:
+            self._low_steps = 0
+            return
+        self._low_steps += 1
+        if self._low_steps < CLOUD_FIELD_SHRINK_STEPS:
+            return
+        self._low_steps = 0
+        new_cap = self.cap
+        floor_cap = max(CLOUD_FIELD_MIN_CAPACITY, 2 * self.n)
+        while new_cap // 2 >= floor_cap:
+            new_cap //= 2
+        self._resize(new_cap)
+
+    def nbytes(self):
+        """Bytes held by this field's storage at its current capacity: every array, the scratch
+        arena, and the sprites list's pointer slots (the surfaces themselves are pygame's, and star sprites
+        are shared across rows)."""
+        total = sum(getattr(self, name).nbytes for name in _COLUMNS) + self.scratch.nbytes()
+        return total + self.offsets.nbytes + self.sprite_keys.nbytes + 8 * len(self.sprites)
 
     def spawn(self, x, y, mass, abundance=None, elem=None, vx=0.0, vy=0.0, offsets=None):
         """Add one cloud; returns its row index.
@@ -146,6 +277,7 @@ class CloudField:
         else:
             offs = offsets
             el = elem
+        self.id[k] = _issue_ids(1)[0]
         self.x[k] = x
         self.y[k] = y
         self.vx[k] = vx
@@ -161,6 +293,7 @@ class CloudField:
         self.offsets[k] = offs
         self.sprites[k] = None
         self.sprite_keys[k] = -1
+        self._id_index = None
         return k
 
     def spawn_batch(self, items):
@@ -170,14 +303,24 @@ class CloudField:
         _random_offsets, different draw stream — statistics, not bits, as ever).
 
         items: sequence of (x, y, mass, elem, vx, vy)."""
-        m = len(items)
+        if len(items) == 0:
+            return
+        self.spawn_columns(*(np.asarray(col, dtype=float) for col in zip(*items)))
+
+    def spawn_columns(self, xs, ys, ms, els, vxs=0.0, vys=0.0):
+        """spawn_batch for callers that already hold the batch as columns (the Big-Bang seeding
+        draws every position and element as arrays): no per-row tuples in between. Scalars
+        broadcast (vxs/vys default to rest)."""
+        m = len(xs)
         if m == 0:
             return
         self._ensure(m)
         k0 = self.n
         k1 = k0 + m
         self.n = k1
-        xs, ys, ms, els, vxs, vys = (np.asarray(col, dtype=float) for col in zip(*items))
+        ms = np.broadcast_to(np.asarray(ms, dtype=float), (m,))
+        els = np.asarray(els)
+        self.id[k0:k1] = _issue_ids(m)
         self.x[k0:k1] = xs
         self.y[k0:k1] = ys
         self.vx[k0:k1] = vxs
@@ -201,8 +344,23 @@ class CloudField:
         self.offsets[k0:k1, :, 0] = r * np.cos(th)
         self.offsets[k0:k1, :, 1] = r * np.sin(th)
         self.sprite_keys[k0:k1] = -1
-        for k in range(k0, k1):
-            self.sprites[k] = None
+        self.sprites[k0:k1] = [None] * m
+        self._id_index = None
+
+    def rows_of(self, ids):
+        """Current rows of the given cloud ids (-1 where the cloud is gone from this field).
+        The index is built lazily by one argsort and kept until the rows next change: lookups
+        are rare (a red-giant timer coming due), row changes happen every step, so the index is
+        not maintained through spawns and compaction, only rebuilt when asked for."""
+        ids = np.asarray(ids, dtype=np.int64)
+        if self._id_index is None:
+            order = np.argsort(self.ID, kind='stable')
+            self._id_index = (self.ID[order], order)
+        sorted_ids, rows = self._id_index
+        if not len(sorted_ids):
+            return np.full(ids.shape, -1, dtype=np.int64)
+        pos = np.minimum(np.searchsorted(sorted_ids, ids), len(sorted_ids) - 1)
+        return np.where(sorted_ids[pos] == ids, rows[pos], -1)
 
     @staticmethod
     def _size_for(mass, is_star):
@@ -254,7 +412,7 @@ class CloudField:
         n = self.n
         idx = np.asarray(idx, dtype=np.int64)
         m = len(idx)
-        for name in ('x', 'y', 'vx', 'vy', 'mass', 'elem', 'emission_count', 'is_star', 'has_civ', 'size', 'shock', 'giant'):
+        for name in _COLUMNS:
             arr = getattr(self, name)
             arr[:m] = arr[:n][idx]
         self.offsets[:m] = self.offsets[:n][idx]
@@ -266,6 +424,7 @@ class CloudField:
         self.sprites[:m] = [self.sprites[old_k] for old_k in idx]
         for k in range(m, n):
             self.sprites[k] = None
+        self._id_index = None
         self.n = m
 
     def move_rows(self, dst, rows):
@@ -286,6 +445,7 @@ class CloudField:
         for r in rows:
             k = dst.n
             dst.n += 1
+            dst.id[k] = self.id[r]
             dst.x[k] = self.x[r]
             dst.y[k] = self.y[r]
             dst.vx[k] = self.vx[r]
@@ -302,4 +462,5 @@ class CloudField:
             dst.sprites[k] = self.sprites[r]
             dst.sprite_keys[k] = self.sprite_keys[r]
             out.append(k)
+        dst._id_index = None
         return out
@@ -10,13 +10,17 @@ against each other statistically (ensemble behavior), never trajectory-by-trajec
 
 Dispatch order (config-gated):
   1. Taichi GPU, all-pairs in float32   — primary; ~0.3 ms per 500-cloud universe
-     (~1e-7 relative error vs the float64 CPU paths — all-pairs, but not "exact")
-  2. Cython Barnes-Hut quadtree         — approximate long-range, the CPU workhorse
+     (~1e-7 relative error vs the float64 CPU paths — all-pairs, but not "exact"); takes
+     over once its background warm-up compile has finished, the CPU paths serve until then
+  2. Cython Barnes-Hut quadtree         — approximate long-range, the CPU workhorse (or its
+     numba twin, sim.jitphysics, when the extension isn't built)
   3. numpy brute-force, all-pairs f64  — reference implementation & last-resort fallback
      ("exact" below means unapproximated — every pair summed, no multipole — not bitwise-stable)
   4. local cell-neighborhood model      — only when BOTH flags are off: the original cheap
      short-range physics (a deliberately different, local-clumping universe)
 """
+import threading
+
 import numpy as np
 
 from sim.config import *
@@ -24,7 +28,10 @@ from sim.config import *
 try:
     from sim import fastphysics as _fastphysics
 except Exception:
-    _fastphysics = None
+    try:
+        from sim import jitphysics as _fastphysics  # numba twin (bh_forces), if numba is installed
+    except Exception:
+        _fastphysics = None
 
 
 def grav_masses(mass, is_star):
@@ -33,48 +40,99 @@ def grav_masses(mass, is_star):
 
 
 # ── Taichi GPU backend ─────────────────────────────────────────────────────────────────────
-_ti_state = {"ready": False, "ok": False, "kernel": None}
-
-
-def _init_gpu():
-    if _ti_state["ready"]:
-        return _ti_state["ok"]
-    _ti_state["ready"] = True
+# Probing Taichi (the import, ti.init, the kernel's JIT compile on first launch) takes seconds,
+# and used to happen synchronously inside the first physics frame — a multi-second stall even
+# on hosts without a GPU, just to learn it wasn't there. start_gpu_init now runs at launch,
+# before the window opens: the import and ti.init happen there, on the main thread — the
+# thread every later kernel launch comes from, so the GPU context is created where it is used —
+# and only the kernel's warm-up compile goes to a background thread. cloud_forces serves from
+# the CPU backends until that thread reports the kernel compiled, then switches over. Taichi's
+# offline cache (on by default) keeps the compiled kernel on disk, so later runs skip the JIT.
+_ti_state = {"ready": False, "ok": False, "kernel": None, "thread": None}
+
+
+def start_gpu_init():
+    """Import and initialize Taichi on the calling (main) thread, then compile the kernel in
+    the background (idempotent). Call early — sim.main does, before the window opens — so the
+    compile overlaps startup instead of the first frames."""
+    if _ti_state["ready"] or _ti_state["thread"] is not None or not GPU_GRAVITY_ENABLED:
+        return
     try:
         import taichi as ti
-        ti.init(arch=ti.gpu)
-
-        @ti.kernel
-        def grav_kernel(pos: ti.types.ndarray(dtype=ti.f32, ndim=2),
-                        gm: ti.types.ndarray(dtype=ti.f32, ndim=1),
-                        force: ti.types.ndarray(dtype=ti.f32, ndim=2),
-                        n: ti.i32, G: ti.f32, soft2: ti.f32):
-            for i in range(n):
-                fx = 0.0
-                fy = 0.0
-                xi = pos[i, 0]
-                yi = pos[i, 1]
-                mi = gm[i]
-                for j in range(n):
-                    if j != i:
-                        dx = pos[j, 0] - xi
-                        dy = pos[j, 1] - yi
-                        d2 = dx * dx + dy * dy + soft2
-                        inv = 1.0 / ti.sqrt(d2)
-                        f = G * mi * gm[j] / d2
-                        fx += dx * inv * f
-                        fy += dy * inv * f
-                force[i, 0] = fx
-                force[i, 1] = fy
-
-        _ti_state["kernel"] = grav_kernel
-        _ti_state["ok"] = True
+        if GPU_GRAVITY_CACHE_DIR is None:
+            ti.init(arch=ti.gpu)
+        else:
+            ti.init(arch=ti.gpu, offline_cache_file_path=GPU_GRAVITY_CACHE_DIR)
+        kernel = _build_kernel(ti)
     except Exception as e:
-        print("GPU gravity unavailable, falling back to CPU:", e)
-        _ti_state["ok"] = False
+        _gpu_unavailable(e)
+        return
+    thread = threading.Thread(target=_warm_up, args=(ti, kernel), name='taichi-warmup', daemon=True)
+    _ti_state["thread"] = thread
+    thread.start()
+
+
+def gpu_ready():
+    """True once the Taichi kernel is compiled and usable. Never blocks in normal runs (it
+    starts the probe if nothing has yet). Seeded runs (PHYSICS_SEED) wait for the warm-up
+    instead: a backend switch at whatever frame the thread happens to finish would make two
+    seeded runs diverge."""
+    if not _ti_state["ready"]:
+        start_gpu_init()
+        if PHYSICS_SEED is None or _ti_state["thread"] is None:
+            return _ti_state["ok"]
+        _ti_state["thread"].join()
     return _ti_state["ok"]
 
 
+def _build_kernel(ti):
+    @ti.kernel
+    def grav_kernel(pos: ti.types.ndarray(dtype=ti.f32, ndim=2),
+                    gm: ti.types.ndarray(dtype=ti.f32, ndim=1),
+                    force: ti.types.ndarray(dtype=ti.f32, ndim=2),
+                    n: ti.i32, G: ti.f32, soft2: ti.f32):
+        for i in range(n):
+            fx = 0.0
+            fy = 0.0
+            xi = pos[i, 0]
+            yi = pos[i, 1]
+            mi = gm[i]
+            for j in range(n):
+                if j != i:
+                    dx = pos[j, 0] - xi
+                    dy = pos[j, 1] - yi
+                    d2 = dx * dx + dy * dy + soft2
+                    inv = 1.0 / ti.sqrt(d2)
+                    f = G * mi * gm[j] / d2
+                    fx += dx * inv * f
+                    fy += dy * inv * f
+            force[i, 0] = fx
+            force[i, 1] = fy
+
+    return grav_kernel
+
+
+def _warm_up(ti, kernel):
+    try:
+        # Warm-up launch: compiles (or loads from the offline cache) the kernel for the exact
+        # argument types forces_gpu passes, so the first real frame on the GPU doesn't JIT.
+        kernel(np.zeros((2, 2), np.float32), np.ones(2, np.float32),
+               np.zeros((2, 2), np.float32), 2, 1.0, 1.0)
+        ti.sync()
+    except Exception as e:
+        _gpu_unavailable(e)
+        return
+    _ti_state["kernel"] = kernel
+    _ti_state["ok"] = True
+    _ti_state["ready"] = True  # published last: `ok` and `kernel` are set by now
+
+
+def _gpu_unavailable(err):
+    print("GPU gravity unavailable, falling back to CPU:", err)
+    _ti_state["ok"] = False
+    _ti_state["ready"] = True
+
+
 def forces_gpu(x, y, gm):
     n = len(x)
     pos = np.empty((n, 2), np.float32)
@@ -100,17 +158,33 @@ def forces_brute(x, y, gm):
 
 
 # ── Cython Barnes-Hut ──────────────────────────────────────────────────────────────────────
+# Quadtree nodes built vs node-pool rows allocated, summed over every bh_forces call since the
+# last take_tree_usage() — the perf overlay's tree gauge (the sim loop takes it once a frame).
+_tree_usage = [0, 0]
+
+
+def take_tree_usage():
+    """(nodes built, pool rows) over the Barnes-Hut calls since the last take; resets both."""
+    nodes, cap = _tree_usage
+    _tree_usage[0] = _tree_usage[1] = 0
+    return nodes, cap
+
+
 def forces_barnes_hut(x, y, gm):
     n = len(x)
     fx = np.zeros(n)
     fy = np.zeros(n)
-    ok = _fastphysics.bh_forces(
+    nodes = _fastphysics.bh_forces(
         np.ascontiguousarray(x), np.ascontiguousarray(y), np.ascontiguousarray(gm),
         fx, fy, n,
         MOLECULAR_CLOUD_GRAVITY_CONSTANT, BARNES_HUT_SOFTENING ** 2,
         BARNES_HUT_THETA, BARNES_HUT_MAX_DEPTH)
-    if not ok:  # tree overflow (pathological input) — fall back to the exact sum
+    cap = 8 * n + 4 * BARNES_HUT_MAX_DEPTH + 64 if n >= 2 else 0  # bh_forces' node pool
+    _tree_usage[1] += cap
+    if nodes < 0:  # tree overflow (pathological input) — fall back to the exact sum
+        _tree_usage[0] += cap
         return forces_brute(x, y, gm)
+    _tree_usage[0] += nodes
     return fx, fy
 
 
@@ -145,7 +219,7 @@ def cloud_forces(x, y, mass, is_star):
     accelerate through every close encounter).
     """
     gm = grav_masses(mass, is_star)
-    if GPU_GRAVITY_ENABLED and _init_gpu():
+    if GPU_GRAVITY_ENABLED and gpu_ready():
         fx, fy = forces_gpu(x, y, gm)
     elif BARNES_HUT_ENABLED:
         if _fastphysics is not None and hasattr(_fastphysics, 'bh_forces'):
@@ -0,0 +1,369 @@
+"""Numba twins of the compiled hot loops, for when sim.fastphysics isn't built.
+
+Editable and dev installs often skip `python setup_fastphysics.py build_ext --inplace`, and
+without the extension the merge pass fell back to a pure-Python O(n^2) pair loop (~800k
+iterations per universe per frame at the cloud cap) and gravity skipped Barnes-Hut for the
+numpy all-pairs sum. With numba installed, physics.py and gravity.py import this module in the
+extension's place: the same names, signatures and algorithms, JIT-compiled on first use (and
+cached next to the module, so only the first run pays the compile).
+
+- collide / collide_shocked: the same counting-sort bucket grid (cell = the binned rows' max
+  size, so the +-1 neighborhood is an exact AABB filter), the same dense fallback when the
+  grid would dwarf the pair matrix, and the same row-order outer scans — fastphysics.pyx is
+  the reference. The grid is rebuilt in per-call buffers: `grid` is accepted for signature
+  parity (it is None here — there is no CollisionGrid without the extension). Merge rolls draw
+  from `stream`, the caller's Philox, through a Generator over it — Generator.random() is
+  the bit generator's own next_double, so a roll here is the roll the extension would make.
+- bh_forces: the flat-array Barnes-Hut quadtree, line for line.
+
+CollisionGrid and integrate_and_contain have no twin; their callers already
+check for them and take their numpy paths.
+"""
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _try_merge(x, y, size, mass, vx, vy, elem, removed, i, j, merge_chance,
+               protostar_threshold, max_mass, start_size, min_size, start_mass, growth_rate, rng):
+    """One candidate pair: compatibility -> AABB overlap -> merge roll -> resolve.
+    Returns True when i was consumed."""
+    is_proto = mass[i] >= protostar_threshold or mass[j] >= protostar_threshold
+    if not (is_proto or (elem[i] - elem[j] <= 1 and elem[j] - elem[i] <= 1)):
+        return False
+    if not (x[i] < x[j] + size[j] and x[i] + size[i] > x[j]
+            and y[i] < y[j] + size[j] and y[i] + size[i] > y[j]):
+        return False
+    if rng.random() >= merge_chance:
+        return False
+    # Higher element index survives (tie -> i).
+    if elem[j] > elem[i]:
+        surv = j
+        cons = i
+    else:
+        surv = i
+        cons = j
+    merged = mass[surv] + mass[cons]
+    if merged > 0.0:
+        vx[surv] = (mass[surv] * vx[surv] + mass[cons] * vx[cons]) / merged
+        vy[surv] = (mass[surv] * vy[surv] + mass[cons] * vy[cons]) / merged
+    mass[surv] = merged if merged < max_mass else max_mass
+    s = start_size - (mass[surv] - start_mass) * growth_rate
+    size[surv] = s if s > min_size else min_size
+    removed[cons] = 1
+    return cons == i
+
+
+@njit(cache=True)
+def _build_grid(x, y, size, n, idx, indexed):
+    """CollisionGrid.build into fresh buffers: (ok, cell, cstart, order, gw, gh). Entry k is
+    row k, or row idx[k] when `indexed`."""
+    cell = np.empty(n, np.int64)
+    order = np.empty(n, np.int64)
+    i = idx[0] if indexed else 0
+    minx = x[i]; maxx = x[i]; miny = y[i]; maxy = y[i]; smax = size[i]
+    for k in range(1, n):
+        i = idx[k] if indexed else k
+        if x[i] < minx: minx = x[i]
+        if x[i] > maxx: maxx = x[i]
+        if y[i] < miny: miny = y[i]
+        if y[i] > maxy: maxy = y[i]
+        if size[i] > smax: smax = size[i]
+    cs = smax if smax > 1.0 else 1.0
+    gw = np.int64((maxx - minx) / cs) + 1
+    gh = np.int64((maxy - miny) / cs) + 1
+    ncells = gw * gh
+    if ncells > 4 * n * n or ncells > (1 << 22):
+        return False, cell, np.zeros(1, np.int64), order, gw, gh
+    cstart = np.zeros(ncells + 1, np.int64)
+    for k in range(n):
+        i = idx[k] if indexed else k
+        cell[k] = np.int64((y[i] - miny) / cs) * gw + np.int64((x[i] - minx) / cs)
+        cstart[cell[k] + 1] += 1
+    for c in range(ncells):
+        cstart[c + 1] += cstart[c]
+    for k in range(n):
+        order[cstart[cell[k]]] = k
+        cstart[cell[k]] += 1
+    for c in range(ncells, 0, -1):  # undo the in-place bump: cstart[c] = first entry of cell c
+        cstart[c] = cstart[c - 1]
+    cstart[0] = 0
+    return True, cell, cstart, order, gw, gh
+
+
+@njit(cache=True)
+def _collide(x, y, size, mass, vx, vy, elem, removed, n, merge_chance, protostar_threshold,
+             max_mass, start_size, min_size, start_mass, growth_rate, rng):
+    ok, cell, cstart, order, gw, gh = _build_grid(x, y, size, n, np.empty(0, np.int64), False)
+    if not ok:
+        for i in range(n):
+            if removed[i]:
+                continue
+            for j in range(n):
+                if j == i or removed[j]:
+                    continue
+                if _try_merge(x, y, size, mass, vx, vy, elem, removed, i, j,
+                              merge_chance, protostar_threshold, max_mass,
+                              start_size, min_size, start_mass, growth_rate, rng):
+                    break
+        return
+    for i in range(n):
+        if removed[i]:
+            continue
+        gi = cell[i] % gw
+        gj = cell[i] // gw
+        gx0 = gi - 1 if gi > 0 else 0
+        gx1 = gi + 1 if gi + 1 < gw else gw - 1
+        gy0 = gj - 1 if gj > 0 else 0
+        gy1 = gj + 1 if gj + 1 < gh else gh - 1
+        i_dead = False
+        for cj in range(gy0, gy1 + 1):
+            for ci in range(gx0, gx1 + 1):
+                c = cj * gw + ci
+                for k in range(cstart[c], cstart[c + 1]):
+                    j = order[k]
+                    if j == i or removed[j]:
+                        continue
+                    if _try_merge(x, y, size, mass, vx, vy, elem, removed, i, j,
+                                  merge_chance, protostar_threshold, max_mass,
+                                  start_size, min_size, start_mass, growth_rate, rng):
+                        i_dead = True
+                        break
+                if i_dead:
+                    break
+            if i_dead:
+                break
+
+
+@njit(cache=True)
+def _collide_shocked(idx, x, y, size, mass, vx, vy, elem, removed, m, merge_chance,
+                     protostar_threshold, max_mass, start_size, min_size, start_mass,
+                     growth_rate, rng):
+    ok, cell, cstart, order, gw, gh = _build_grid(x, y, size, m, idx, True)
+    if not ok:
+        for a in range(m):
+            i = idx[a]
+            if removed[i]:
+                continue
+            for b in range(a + 1, m):
+                j = idx[b]
+                if removed[j]:
+                    continue
+                if _try_merge(x, y, size, mass, vx, vy, elem, removed, i, j,
+                              merge_chance, protostar_threshold, max_mass,
+                              start_size, min_size, start_mass, growth_rate, rng):
+                    break
+        return
+    for a in range(m):
+        i = idx[a]
+        if removed[i]:
+            continue
+        gi = cell[a] % gw
+        gj = cell[a] // gw
+        gx0 = gi - 1 if gi > 0 else 0
+        gx1 = gi + 1 if gi + 1 < gw else gw - 1
+        gy0 = gj - 1 if gj > 0 else 0
+        gy1 = gj + 1 if gj + 1 < gh else gh - 1
+        a_dead = False
+        for cj in range(gy0, gy1 + 1):
+            for ci in range(gx0, gx1 + 1):
+                c = cj * gw + ci
+                for k in range(cstart[c], cstart[c + 1]):
+                    b = order[k]
+                    if b <= a:
+                        continue
+                    j = idx[b]
+                    if removed[j]:
+                        continue
+                    if _try_merge(x, y, size, mass, vx, vy, elem, removed, i, j,
+                                  merge_chance, protostar_threshold, max_mass,
+                                  start_size, min_size, start_mass, growth_rate, rng):
+                        a_dead = True
+                        break
+                if a_dead:
+                    break
+            if a_dead:
+                break
+
+
+def collide(x, y, size, mass, vx, vy, elem, removed, n, merge_chance, protostar_threshold,
+            max_mass, start_size, min_size, start_mass, growth_rate, grid=None, stream=None):
+    """fastphysics.collide: cloud merge detection + resolution, in place."""
+    if n < 2:
+        return
+    rng = np.random.Generator(stream if stream is not None else np.random.Philox())
+    _collide(x, y, size, mass, vx, vy, elem, removed, n, merge_chance, protostar_threshold,
+             max_mass, start_size, min_size, start_mass, growth_rate, rng)
+
+
+def collide_shocked(idx, x, y, size, mass, vx, vy, elem, removed, m, merge_chance,
+                    protostar_threshold, max_mass, start_size, min_size, start_mass, growth_rate,
+                    grid=None, stream=None):
+    """fastphysics.collide_shocked: one roll per shocked pair per pass, in place."""
+    if m < 2:
+        return
+    rng = np.random.Generator(stream if stream is not None else np.random.Philox())
+    _collide_shocked(np.asarray(idx, dtype=np.int64), x, y, size, mass, vx, vy, elem, removed,
+                     m, merge_chance, protostar_threshold, max_mass, start_size, min_size,
+                     start_mass, growth_rate, rng)
+
+
+@njit(cache=True)
+def bh_forces(x, y, gm, fx, fy, n, G, soft2, theta, max_depth):
+    """fastphysics.bh_forces: Barnes-Hut mutual gravity into fx/fy. Returns the number of
+    tree nodes built, or -1 when the node pool overflows (the caller falls back to the exact
+    sum)."""
+    if n < 2:
+        return 0
+
+    cap_nodes = 8 * n + 4 * max_depth + 64
+    child = np.full(cap_nodes * 4, -1, np.int32)
+    ncx = np.zeros(cap_nodes)
+    ncy = np.zeros(cap_nodes)
+    nm = np.zeros(cap_nodes)
+    nx0 = np.zeros(cap_nodes)
+    ny0 = np.zeros(cap_nodes)
+    nsz = np.zeros(cap_nodes)
+    ndepth = np.zeros(cap_nodes, np.int32)
+    internal = np.zeros(cap_nodes, np.int8)
+    first_body = np.full(cap_nodes, -1, np.int32)
+    next_body = np.full(n, -1, np.int32)
+    job_body = np.zeros(n + 8, np.int32)
+    job_node = np.zeros(n + 8, np.int32)
+    job_com = np.zeros(n + 8, np.int32)
+    tstack = np.zeros(cap_nodes + 8, np.int32)
+    theta2 = theta * theta
+    ok = True
+
+    # ── bounding square ──
+    minx = x[0]; maxx = x[0]; miny = y[0]; maxy = y[0]
+    for i in range(1, n):
+        if x[i] < minx: minx = x[i]
+        if x[i] > maxx: maxx = x[i]
+        if y[i] < miny: miny = y[i]
+        if y[i] > maxy: maxy = y[i]
+    size0 = maxx - minx
+    if maxy - miny > size0:
+        size0 = maxy - miny
+    if size0 < 1.0:
+        size0 = 1.0
+    size0 = size0 * 1.0001 + 1.0
+
+    # ── build ──
+    node_count = 1
+    nx0[0] = minx; ny0[0] = miny; nsz[0] = size0; ndepth[0] = 0
+    for i in range(n):
+        jsp = 0
+        job_body[jsp] = i
+        job_node[jsp] = 0
+        job_com[jsp] = 1  # re-insertions after a subdivision skip the COM fold (see the .pyx)
+        jsp += 1
+        while jsp > 0:
+            jsp -= 1
+            b = job_body[jsp]
+            node = job_node[jsp]
+            do_com = job_com[jsp]
+            while True:
+                if do_com:
+                    if nm[node] == 0.0:
+                        ncx[node] = x[b]
+                        ncy[node] = y[b]
+                    else:
+                        total = nm[node] + gm[b]
+                        ncx[node] = (ncx[node] * nm[node] + x[b] * gm[b]) / total
+                        ncy[node] = (ncy[node] * nm[node] + y[b] * gm[b]) / total
+                    nm[node] += gm[b]
+                do_com = 1
+                if internal[node] == 0:
+                    if first_body[node] == -1:
+                        first_body[node] = b
+                        next_body[b] = -1
+                        break
+                    if ndepth[node] >= max_depth:
+                        next_body[b] = first_body[node]
+                        first_body[node] = b
+                        break
+                    internal[node] = 1
+                    ob = first_body[node]
+                    first_body[node] = -1
+                    while ob != -1:
+                        job_body[jsp] = ob
+                        job_node[jsp] = node
+                        job_com[jsp] = 0
+                        jsp += 1
+                        ob = next_body[ob]
+                half = nsz[node] * 0.5
+                q = 0
+                qx = nx0[node]
+                qy = ny0[node]
+                if x[b] >= nx0[node] + half:
+                    q += 1
+                    qx = nx0[node] + half
+                if y[b] >= ny0[node] + half:
+                    q += 2
+                    qy = ny0[node] + half
+                ch = child[node * 4 + q]
+                if ch == -1:
+                    if node_count >= cap_nodes:
+                        ok = False
+                        break
+                    ch = node_count
+                    node_count += 1
+                    nx0[ch] = qx
+                    ny0[ch] = qy
+                    nsz[ch] = half
+                    ndepth[ch] = ndepth[node] + 1
+                    child[node * 4 + q] = ch
+                node = ch
+            if not ok:
+                break
+        if not ok:
+            break
+    if not ok:
+        return -1
+
+    # ── traverse ──
+    for i in range(n):
+        xi = x[i]
+        yi = y[i]
+        mi = gm[i]
+        accx = 0.0
+        accy = 0.0
+        sp = 0
+        tstack[sp] = 0
+        sp += 1
+        while sp > 0:
+            sp -= 1
+            node = tstack[sp]
+            if internal[node] == 0:
+                b = first_body[node]
+                while b != -1:
+                    if b != i:
+                        dx = x[b] - xi
+                        dy = y[b] - yi
+                        d2 = dx * dx + dy * dy + soft2
+                        inv = 1.0 / np.sqrt(d2)
+                        f = G * mi * gm[b] / d2
+                        accx += dx * inv * f
+                        accy += dy * inv * f
+                    b = next_body[b]
+                continue
+            dx = ncx[node] - xi
+            dy = ncy[node] - yi
+            dist_sq = dx * dx + dy * dy
+            # Opening criterion: treat the node as a single mass when size/dist < theta.
+            if nsz[node] * nsz[node] < theta2 * dist_sq:
+                d2 = dist_sq + soft2
+                inv = 1.0 / np.sqrt(d2)
+                f = G * mi * nm[node] / d2
+                accx += dx * inv * f
+                accy += dy * inv * f
+            else:
+                for q in range(4):
+                    ch = child[node * 4 + q]
+                    if ch != -1:
+                        tstack[sp] = ch
+                        sp += 1
+        fx[i] = accx
+        fy[i] = accy
+    return node_count
@@ -1,32 +1,48 @@
 """Per-frame simulation step and multiverse mechanics.
 
-Frame order per universe (matches the historical update_simulation_state exactly):
+Frame order per universe (the historical update_simulation_state order, except as noted):
   barrier deformation → cloud gravity → collisions/entity updates/events → barrier
-  gravity+containment → tracer spin → merger pulses → black-hole pass (attract/decay/rip/
-  evaporate) → neutron-star pass (gravity/pulses/spin-down/decay) → magnetar pass (gravity/
-  magnetism/flares/field decay→settle into NS) → white-dwarf pass (cooling/Type Ia) →
-  kilonova mergers → removals & spawns → integration.
+  gravity+compact-object containment → tracer spin → wave rings (merger pulses and pulsar
+  trains together, sim.pulses) → black-hole pass (attract/decay/rip/evaporate) → neutron-star
+  pass (gravity/spin-down+emission/decay) → magnetar pass
+  (gravity/magnetism/flares/field decay→settle into NS) → white-dwarf pass (cooling/Type Ia) →
+  kilonova mergers → removals & spawns → integration + cloud containment (one fused sweep).
+Cloud containment used to run mid-step, before the drift, so a row could end a frame (and be
+drawn) outside its ring; it now follows the drift directly.
+Timed phases (red giants, white-dwarf cooling, magnetar fields) fire from the universe's
+TimerQueue (sim.timers), whose clock advances at the top of the step.
 Captured clouds stay in the arrays until the end-of-step removal (the neutron-star pass sees
 them, as it always did); streamed clouds get their position rewritten at capture and the row
 moves to the child universe at the end of the step — visible before the child steps.
 """
+import itertools
 import math
 import random
 
 import numpy as np
 
 from sim.config import *
-from sim.fields import CloudField, pick_element, blend_abundance
-from sim.barrier import Barrier
+from sim.fields import CloudField, pick_element, pick_elements, blend_abundance, heaviest
+from sim.barrier import Barrier, BarrierBank
+from sim.pulses import PulseField
+from sim import timers as T
+from sim import events as E
 from sim.entities import BlackHole, NeutronStar, Magnetar, WhiteDwarf
 from sim.rng import EntropyPool
-from sim import gravity
+from sim import gravity, streams
+from sim import profiler as P
 
 try:
     from sim import fastphysics as _fastphysics  # compiled hot loops (build: python setup_fastphysics.py build_ext --inplace)
 except Exception:
-    _fastphysics = None
+    try:
+        from sim import jitphysics as _fastphysics  # numba twins of collide/collide_shocked/bh_forces
+    except Exception:
+        _fastphysics = None
 
+_prof = P.PROFILER  # phase timings (sim/profiler.py); near-free when disabled
+
+_universe_ids = itertools.count(1)  # Universe.uid source; never reused within a run
 
 class LocalPhysics:
     """Per-universe physical constants, as multipliers on the global dials. Root (Big-Bang)
@@ -51,8 +67,42 @@ class LocalPhysics:
         return LocalPhysics(drift(self.g), drift(self.fusion), drift(self.collapse))
 
 
+class UniverseTotals:
+    """One universe's aggregates for the multiverse-level readers — the HUD, the heat-death
+    check and dark flow each used to rescan every field (and np.unique every element column)
+    every frame. The step that changes the matter recounts them once, at its end (tally);
+    the phases that move or trim rows afterwards (wormhole streams into an already-stepped
+    universe, the global cloud cap) adjust them by the rows they touch (add_rows). Readers
+    then reduce O(U) numbers."""
+    __slots__ = ('mass', 'entities', 'elements')
+
+    def __init__(self):
+        self.mass = 0.0      # clouds + every compact object
+        self.entities = 0    # clouds + every compact object
+        self.elements = np.zeros(len(ELEMENT_SYMBOLS), dtype=np.int64)  # cloud rows per element
+
+    def tally(self, universe):
+        clouds = universe.clouds
+        compact = (*universe.black_holes, *universe.neutron_stars, *universe.magnetars,
+                   *universe.white_dwarfs)
+        self.mass = float(clouds.M.sum()) + sum(body.mass for body in compact)
+        self.entities = clouds.n + len(compact)
+        self.elements = np.bincount(clouds.ELEM, minlength=len(ELEMENT_SYMBOLS))
+
+    def add_rows(self, clouds, rows, sign=1):
+        """Rows of `clouds` arrived (sign=1) or are about to go (sign=-1)."""
+        rows = np.asarray(rows, dtype=np.int64)
+        if not len(rows):
+            return
+        self.mass += sign * float(clouds.mass[rows].sum())
+        self.entities += sign * len(rows)
+        self.elements += sign * np.bincount(clouds.elem[rows], minlength=len(ELEMENT_SYMBOLS))
+
+
 class Universe:
-    """One self-contained world: a barrier plus the matter inside it."""
+    """One self-contained world: a barrier plus the matter inside it. Positions inside (cloud
+    rows, compact objects, pulse origins) are local to the barrier's center; add the center
+    for multiverse coordinates."""
     def __init__(self, barrier):
         self.barrier = barrier
         self.clouds = CloudField()
@@ -60,11 +110,22 @@ class Universe:
         self.neutron_stars = []
         self.magnetars = []
         self.white_dwarfs = []
-        self.black_hole_pulses = []
+        self.pulses = PulseField()  # every expanding gravitational-wave ring (sim.pulses)
+        self.timers = T.TimerQueue()  # this universe's clock + timed-phase deadlines (sim.timers)
         self.pending_rip_bhs = []  # black holes in this universe that reached rip mass this step
         self.metallicity = 0.0  # Z in [0,1]: chemical age, ratcheted up by enrichment events
         self.local = LocalPhysics()  # this universe's own constants (mutated at rip, see class)
-        self.event_log = []     # astrophysical events this step, drained into the HUD ticker
+        self.uid = next(_universe_ids)  # lineage id: stamped on this universe's event records
+        self.parent_uid = 0  # uid of the universe this one was ripped from (0 = born in a Big Bang)
+        self.totals = UniverseTotals()  # mass / entity / element aggregates (see class)
+        self.event_log = E.EventLog(self.uid)  # this step's event records, drained into the HUD ticker (sim.events)
+        self.rng = streams.UniverseRNG()  # this universe's numpy + compiled-kernel streams (sim.streams)
+        self.step_alloc_bytes = 0  # scratch-arena bytes the last physics step allocated (debug)
+        # Merge-pass bucket grid, kept across frames so its buffers are rebuilt in place; it
+        # describes the rows as of its last build (see fastphysics.CollisionGrid).
+        self.collision_grid = (_fastphysics.CollisionGrid()
+                               if _fastphysics is not None and hasattr(_fastphysics, 'CollisionGrid')
+                               else None)
 
     def star_formation_efficiency(self):
         """Quenching: merge chances scale by (1-Z)^exponent, so the metallicity ratchet
@@ -78,20 +139,14 @@ class SimulationState:
     their barriers push/deform each other."""
     def __init__(self):
         self.universes = []
+        self.barriers = BarrierBank()  # every universe's ring, stacked (sim.barrier)
         self.entropy_pool = EntropyPool()
 
     def entity_count(self):
-        return sum(u.clouds.n + len(u.black_holes) + len(u.neutron_stars) + len(u.magnetars)
-                   + len(u.white_dwarfs)
-                   for u in self.universes)
+        return sum(u.totals.entities for u in self.universes)
 
     def total_mass(self):
-        return sum(float(u.clouds.M.sum())
-                   + sum(bh.mass for bh in u.black_holes)
-                   + sum(ns.mass for ns in u.neutron_stars)
-                   + sum(m.mass for m in u.magnetars)
-                   + sum(wd.mass for wd in u.white_dwarfs)
-                   for u in self.universes)
+        return sum(u.totals.mass for u in self.universes)
 
     def mean_metallicity(self):
         if not self.universes:
@@ -101,11 +156,24 @@ class SimulationState:
     def present_elements(self):
         """Sorted indices of every element currently carried by a live cloud/star, anywhere
         in the multiverse — drives the HUD's element inventory row."""
-        present = set()
-        for u in self.universes:
-            if u.clouds.n:
-                present.update(np.unique(u.clouds.ELEM).tolist())
-        return sorted(present)
+        if not self.universes:
+            return []
+        counts = sum(u.totals.elements for u in self.universes)
+        return np.flatnonzero(counts).tolist()
+
+    def memory_report(self):
+        """Cloud-storage footprint across the multiverse: live rows vs allocated capacity
+        and the bytes that capacity holds, per universe and in total. Capacity well above
+        rows for long stretches means a field isn't shrinking back after its bursts;
+        'step_alloc_bytes' is what the last physics step allocated for its temporaries."""
+        per_universe = [(u.clouds.n, u.clouds.cap, u.clouds.nbytes()) for u in self.universes]
+        return {
+            'universes': per_universe,
+            'rows': sum(r for r, _c, _b in per_universe),
+            'capacity': sum(c for _r, c, _b in per_universe),
+            'bytes': sum(b for _r, _c, b in per_universe),
+            'step_alloc_bytes': sum(u.step_alloc_bytes for u in self.universes),
+        }
 
 
 def _spawn_size(mass):
@@ -128,7 +196,8 @@ def handle_collisions(universe):
                              clouds.ELEM, removed, n,
                              merge_chance, PROTOSTAR_THRESHOLD, MOLECULAR_CLOUD_MAX_MASS,
                              MOLECULAR_CLOUD_START_SIZE, MOLECULAR_CLOUD_MIN_SIZE,
-                             MOLECULAR_CLOUD_START_MASS, MOLECULAR_CLOUD_GROWTH_RATE)
+                             MOLECULAR_CLOUD_START_MASS, MOLECULAR_CLOUD_GROWTH_RATE,
+                             universe.collision_grid, universe.rng.kernel()[0])
     else:
         _collide_python(clouds, removed, n, merge_chance)
     if removed.any():
@@ -136,7 +205,8 @@ def handle_collisions(universe):
 
 
 def _collide_python(clouds, removed, n, merge_chance):
-    """Pure-Python port of fastphysics.collide (fallback when the extension isn't built)."""
+    """Pure-Python port of fastphysics.collide (last-resort fallback: neither the extension
+    nor numba for sim.jitphysics is available)."""
     x, y, size, mass = clouds.X, clouds.Y, clouds.SIZE, clouds.M
     vx, vy, elem = clouds.VX, clouds.VY, clouds.ELEM
     for i in range(n):
@@ -172,8 +242,8 @@ def _triggered_mergers(universe):
     restricted to shocked-shocked pairs (a small set, so the scalar pair loop stays cheap)."""
     clouds = universe.clouds
     n = clouds.n
-    if n < 2:
-        return
+    if n < 2 or not universe.timers.any_shocked():
+        return  # every wavefront's compression has relaxed: no row can be shocked
     shocked = np.nonzero(clouds.SHOCK > 0.0)[0]
     if len(shocked) < 2:
         return
@@ -181,14 +251,16 @@ def _triggered_mergers(universe):
     if _fastphysics is not None and hasattr(_fastphysics, 'collide_shocked'):
         # Compiled path: same upper-triangle/one-roll-per-pair statistics as the loop below,
         # which stays as the semantic reference. Sustained pulse activity can shock hundreds
-        # of clouds at once, and the Python pair loop was the multiverse frame-time leader.
+        # of clouds at once, and the Python pair loop was the multiverse frame-time leader;
+        # the kernel grid-buckets the shocked rows, so a shock storm costs ~O(m), not O(m^2).
         removed_u8 = np.zeros(n, dtype=np.uint8)
         _fastphysics.collide_shocked(
             np.ascontiguousarray(shocked), clouds.X, clouds.Y, clouds.SIZE, clouds.M,
             clouds.VX, clouds.VY, clouds.ELEM, removed_u8, len(shocked),
             merge_chance, PROTOSTAR_THRESHOLD, MOLECULAR_CLOUD_MAX_MASS,
             MOLECULAR_CLOUD_START_SIZE, MOLECULAR_CLOUD_MIN_SIZE,
-            MOLECULAR_CLOUD_START_MASS, MOLECULAR_CLOUD_GROWTH_RATE)
+            MOLECULAR_CLOUD_START_MASS, MOLECULAR_CLOUD_GROWTH_RATE,
+            universe.collision_grid, universe.rng.kernel()[0])
         if removed_u8.any():
             clouds.keep(removed_u8 == 0)
         return
@@ -240,54 +312,66 @@ def update_entities(universe, delta_time):
     # x[j]`, so a size-0 giant is a point that still overlaps any box it sits inside; at
     # -1e9 its clause fails in both roles of the test, in both merge passes and both code
     # paths. refresh() below recomputes every row's size from mass, healing it right after.
-    giant_rows = np.nonzero(clouds.GIANT > 0.0)[0]
-    if len(giant_rows):
+    timers = universe.timers
+    t = _prof.begin()
+    if timers.active(T.GIANT):
+        giant_rows = np.nonzero(clouds.GIANT > 0.0)[0]
         clouds.size[giant_rows] = -1e9
     handle_collisions(universe)
     _triggered_mergers(universe)
     clouds.refresh()
+    _prof.end(P.COLLISIONS, t, universe)
+    t = _prof.begin()
 
     # The old scalar loop rolled `random.random()` per cloud per frame. Restructured into
-    # three candidate passes with the same per-cloud Bernoulli statistics: heavy stars stay
-    # scalar in row order (the BH cap check is sequential), while the every-star WD roll and
-    # the every-eligible-cloud emission roll become single vectorized draws whose HITS take
-    # the branchy path. Only the draw stream changes — statistics, not physics.
+    # three candidate passes with the same per-cloud Bernoulli statistics: the heavy-star fate
+    # rolls, the every-star WD roll and the every-eligible-cloud emission roll are each drawn
+    # vectorized, and only their HITS take the branchy path. Only the draw stream changes —
+    # statistics, not physics.
     to_remove = np.zeros(clouds.n, dtype=bool)
     spawns = []  # (x, y, mass, elem_index, vx, vy) — batch-applied via spawn_batch
     n = clouds.n
     mass = clouds.mass
     elem = clouds.elem
 
-    # ── Heavy stars: collapse or supernova (scalar, row order — cap fills sequentially) ──
+    # ── Heavy stars: collapse or supernova ──
+    # Every candidate's rolls are drawn up front, in row order: the collapse roll, then — for
+    # the collapses — the remnant rolls, then the supernova roll for the rest. The black-hole
+    # cap used to be checked as the scalar loop walked the rows; it only ever grew by the
+    # rows whose remnant was a hole, so "the cap still had room when this row's turn came"
+    # is an exclusive running count of earlier hole outcomes. Rows past the fill fall through
+    # to the emission pass, as the old elif chain did.
     a_entered = np.zeros(n, dtype=bool)
-    for k in np.nonzero(mass[:n] > BLACK_HOLE_THRESHOLD)[0]:
-        if len(universe.black_holes) >= BLACK_HOLE_MAX_COUNT:
-            continue  # cap full: this cloud falls through to the emission pass, as the old elif chain did
-        a_entered[k] = True
+    heavy = np.nonzero(mass[:n] > BLACK_HOLE_THRESHOLD)[0]
+    fate_idx = fate = heavy[:0]
+    if len(heavy) and len(universe.black_holes) < BLACK_HOLE_MAX_COUNT:
+        gen = universe.rng.gen
         # Fate is a steep function of mass: the heaviest stars collapse soonest.
-        mass_ratio = mass[k] / BLACK_HOLE_THRESHOLD
-        if random.random() < BLACK_HOLE_CHANCE * universe.local.collapse * mass_ratio ** COLLAPSE_MASS_EXPONENT:
-            # A civilization can ride its star up here: a medium-tier host can merge past the
-            # violent-death threshold, and its end deserves a ticker line like the quiet one.
-            if clouds.has_civ[k]:
-                universe.event_log.append("CIVILIZATION LOST — its star collapses in an instant")
-            # The star's own metallicity biases the remnant: metal-rich stars shed mass
-            # in winds and tend to leave neutron stars; metal-poor ones collapse to holes.
-            bias = COLLAPSE_NS_METALLICITY_BIAS if elem[k] >= STAR_ENRICHED_ELEMENT_MIN else -COLLAPSE_NS_METALLICITY_BIAS
-            if random.random() < NEUTRON_STAR_CHANCE + bias:
-                # A small fraction of neutron-star births come out as magnetars, so the
-                # black-hole formation rate (which drives the matter cycle) is untouched.
-                if random.random() < MAGNETAR_CHANCE:
-                    universe.magnetars.append(Magnetar(clouds.x[k], clouds.y[k], mass[k]))
-                    universe.event_log.append(f"CORE COLLAPSE — {star_class_name(mass[k], elem[k])} collapses; a magnetar is born")
-                else:
-                    universe.neutron_stars.append(NeutronStar(clouds.x[k], clouds.y[k], mass[k]))
-                    universe.event_log.append(f"CORE COLLAPSE — {star_class_name(mass[k], elem[k])} collapses; a pulsar is born")
-            else:
-                universe.black_holes.append(BlackHole(clouds.x[k], clouds.y[k], mass[k]))
-                universe.event_log.append(f"CORE COLLAPSE — {star_class_name(mass[k], elem[k])} implodes into a black hole")
-            to_remove[k] = True
-        elif random.random() < MOLECULAR_CLOUD_DEFAULT_STATE_CHANCE * mass_ratio ** SUPERNOVA_LIFETIME_MASS_EXPONENT:
+        mass_ratio = mass[heavy] / BLACK_HOLE_THRESHOLD
+        collapses = gen.random(len(heavy)) < (BLACK_HOLE_CHANCE * universe.local.collapse
+                                               * mass_ratio ** COLLAPSE_MASS_EXPONENT)
+        # The star's own metallicity biases the remnant: metal-rich stars shed mass in winds
+        # and tend to leave neutron stars; metal-poor ones collapse to holes. A small fraction
+        # of neutron-star births come out as magnetars, so the black-hole formation rate
+        # (which drives the matter cycle) is untouched.
+        bias = np.where(elem[heavy] >= STAR_ENRICHED_ELEMENT_MIN,
+                        COLLAPSE_NS_METALLICITY_BIAS, -COLLAPSE_NS_METALLICITY_BIAS)
+        to_ns = collapses & (gen.random(len(heavy)) < NEUTRON_STAR_CHANCE + bias)
+        to_magnetar = to_ns & (gen.random(len(heavy)) < MAGNETAR_CHANCE)
+        to_hole = collapses & ~to_ns
+        holes_before = np.cumsum(to_hole) - to_hole
+        entered = len(universe.black_holes) + holes_before < BLACK_HOLE_MAX_COUNT
+        a_entered[heavy[entered]] = True
+        supernova = entered & ~collapses & (gen.random(len(heavy)) < MOLECULAR_CLOUD_DEFAULT_STATE_CHANCE
+                                            * mass_ratio ** SUPERNOVA_LIFETIME_MASS_EXPONENT)
+        # One fate code per hit, walked in row order below: 0 hole, 1 pulsar, 2 magnetar,
+        # 3 supernova.
+        hit = (entered & collapses) | supernova
+        fate_idx = heavy[hit]
+        fate = np.select([supernova, to_magnetar, to_ns], [3, 2, 1], 0)[hit]
+
+    for k, kind in zip(fate_idx.tolist(), fate.tolist()):
+        if kind == 3:
             # Core-collapse supernova: the star resets to a light gas cloud and ejects
             # material whose composition reflects the universe's chemical age.
             ejecta_count = SUPERNOVA_EJECTA_COUNT_BASE + int((mass[k] - BLACK_HOLE_THRESHOLD) * SUPERNOVA_EJECTA_COUNT_PER_MASS)
@@ -308,13 +392,30 @@ def update_entities(universe, delta_time):
             # shed a phantom nebula from the newborn cloud.
             if clouds.has_civ[k]:
                 clouds.has_civ[k] = False
-                universe.event_log.append("CIVILIZATION LOST — vaporized by its star's supernova")
-            universe.event_log.append(f"SUPERNOVA (TYPE II) — {star_class_name(mass[k], elem[k])} explodes, seeding metals")
+                universe.event_log.emit(E.CIV_LOST_SUPERNOVA)
+            universe.event_log.emit(E.SUPERNOVA_II, star_class_index(mass[k], elem[k]))
             mass[k] = MOLECULAR_CLOUD_START_MASS
             clouds.is_star[k] = False
             clouds.giant[k] = 0.0
             clouds.size[k] = MOLECULAR_CLOUD_START_SIZE
             universe.metallicity = min(1.0, universe.metallicity + METALLICITY_PER_SUPERNOVA)
+            continue
+        # A civilization can ride its star up here: a medium-tier host can merge past the
+        # violent-death threshold, and its end deserves a ticker line like the quiet one.
+        if clouds.has_civ[k]:
+            universe.event_log.emit(E.CIV_LOST_COLLAPSE)
+        if kind == 2:
+            magnetar = Magnetar(clouds.x[k], clouds.y[k], mass[k])
+            magnetar.field_ends = timers.schedule(T.MAGNETAR, MAGNETAR_FIELD_LIFETIME, magnetar)
+            universe.magnetars.append(magnetar)
+            universe.event_log.emit(E.COLLAPSE_MAGNETAR, star_class_index(mass[k], elem[k]))
+        elif kind == 1:
+            universe.neutron_stars.append(NeutronStar(clouds.x[k], clouds.y[k], mass[k]))
+            universe.event_log.emit(E.COLLAPSE_PULSAR, star_class_index(mass[k], elem[k]))
+        else:
+            universe.black_holes.append(BlackHole(clouds.x[k], clouds.y[k], mass[k]))
+            universe.event_log.emit(E.COLLAPSE_HOLE, star_class_index(mass[k], elem[k]))
+        to_remove[k] = True
 
     # ── Civilizations: rare Dyson-swarm emergence on stable, non-violent, metal-enriched stars ──
     # Rocky planets and biochemistry need real metals, not just H/He/O, so a pristine
@@ -328,20 +429,23 @@ def update_entities(universe, delta_time):
                           & (clouds.GIANT <= 0.0))[0]  # nothing arises around a star already dying
     if len(civ_idx):
         civ_chance = CIVILIZATION_CHANCE * (1.0 + universe.metallicity * CIVILIZATION_Z_BOOST)
-        hits = civ_idx[np.random.random(len(civ_idx)) < civ_chance]
+        hits = civ_idx[universe.rng.gen.random(len(civ_idx)) < civ_chance]
         if len(hits):
             clouds.has_civ[hits] = True
-            universe.event_log.append("CIVILIZATION EMERGES — a world lights its star's shadow")
+            universe.event_log.emit(E.CIV_EMERGES)
 
-    # ── Red giants: tick the swell; expiry sheds the planetary nebula ──
+    # ── Red giants: expiry sheds the planetary nebula ──
     # The retirement roll below no longer removes the star in the same frame — it starts a
     # red-giant phase (a swollen, visible ending). The RATE of retirement is the roll's,
-    # unchanged; only the exit is delayed by RED_GIANT_DURATION.
-    giant_rows = np.nonzero(clouds.GIANT > 0.0)[0]
-    for k in giant_rows:
-        clouds.giant[k] -= delta_time
-        if clouds.giant[k] > 0.0:
-            continue
+    # unchanged; only the exit is delayed by RED_GIANT_DURATION. `giant` holds the phase's
+    # deadline on the universe clock; only a frame where one comes due looks at the rows —
+    # exactly the rows it names (by cloud id), handled in row order.
+    expired = ()
+    if timers.pending(T.GIANT):
+        rows = clouds.rows_of(timers.due(T.GIANT))
+        rows = rows[rows >= 0]
+        expired = np.unique(rows[(clouds.giant[rows] > 0.0) & (clouds.giant[rows] <= timers.clock)])
+    for k in expired:
         clouds.giant[k] = 0.0
         if mass[k] >= STAR_TIER_HIGH_MASS:
             continue  # merged past the violent-death line while swollen — the heavy pass owns it now
@@ -359,12 +463,13 @@ def update_entities(universe, delta_time):
             spawns.append((ex, ey, emass, child_elem,
                            math.cos(offset_angle) * offset_dist * 0.4,
                            math.sin(offset_angle) * offset_dist * 0.4))
-        wd = WhiteDwarf(clouds.x[k], clouds.y[k], mass[k] * WHITE_DWARF_MASS_FRACTION)
+        wd = WhiteDwarf(clouds.x[k], clouds.y[k], mass[k] * WHITE_DWARF_MASS_FRACTION, timers.clock)
         wd.vx, wd.vy = clouds.vx[k], clouds.vy[k]
+        timers.schedule(T.DWARF, WHITE_DWARF_COOL_TIME, wd)
         universe.white_dwarfs.append(wd)
         to_remove[k] = True
         universe.metallicity = min(1.0, universe.metallicity + METALLICITY_PER_NEBULA)
-        universe.event_log.append("PLANETARY NEBULA — the giant sheds its envelope; a white dwarf remains")
+        universe.event_log.emit(E.PLANETARY_NEBULA)
 
     # ── Sub-massive stars: retirement roll (one vectorized roll over all main-sequence stars) ──
     star_idx = np.nonzero(clouds.IS_STAR & (clouds.M < STAR_TIER_HIGH_MASS)
@@ -372,14 +477,14 @@ def update_entities(universe, delta_time):
     if len(star_idx):
         wd_chance = (WHITE_DWARF_CHANCE
                      * (clouds.M[star_idx] / STAR_TIER_HIGH_MASS) ** WHITE_DWARF_LIFETIME_MASS_EXPONENT)
-        star_idx = star_idx[np.random.random(len(star_idx)) < wd_chance]
+        star_idx = star_idx[universe.rng.gen.random(len(star_idx)) < wd_chance]
     for k in star_idx:
-        clouds.giant[k] = RED_GIANT_DURATION
+        clouds.giant[k] = timers.schedule(T.GIANT, RED_GIANT_DURATION, int(clouds.id[k]))
         if clouds.has_civ[k]:
             # Earth's actual fate: the swelling star engulfs its worlds long before the nebula.
             clouds.has_civ[k] = False
-            universe.event_log.append("CIVILIZATION LOST — engulfed by its swelling star")
-        universe.event_log.append(f"RED GIANT — {star_class_name(mass[k], elem[k])} swells off the main sequence")
+            universe.event_log.emit(E.CIV_LOST_GIANT)
+        universe.event_log.emit(E.RED_GIANT, star_class_index(mass[k], elem[k]))
 
     # ── Emission: clouds shed small daughter clouds (one vectorized roll over eligibles) ──
     eligible = ((clouds.M >= MOLECULAR_CLOUD_EMISSION_MIN_PARENT_MASS)
@@ -388,7 +493,7 @@ def update_entities(universe, delta_time):
                 & (clouds.GIANT <= 0.0))  # dying stars shed their nebula at expiry, not daughters now — the retired star emitted nothing either
     c_idx = np.nonzero(eligible)[0]
     if len(c_idx):
-        c_idx = c_idx[np.random.random(len(c_idx)) < MOLECULAR_CLOUD_EMISSION_CHANCE]
+        c_idx = c_idx[universe.rng.gen.random(len(c_idx)) < MOLECULAR_CLOUD_EMISSION_CHANCE]
     for k in c_idx:
         emit_mass = random.uniform(MOLECULAR_CLOUD_EMISSION_MASS_MIN, MOLECULAR_CLOUD_EMISSION_MASS_MAX)
         offset_angle = random.uniform(0, 2 * math.pi)
@@ -405,129 +510,55 @@ def update_entities(universe, delta_time):
     clouds.spawn_batch(spawns)
 
     # Hard cap on clouds per universe: bounds per-frame physics + rendering cost. Trim the
-    # lowest-mass clouds when over the cap (rows end up mass-sorted, as the old list.sort did).
+    # lowest-mass clouds when over the cap. At the cap this fires nearly every frame, so it
+    # only selects the mass cutoff and compacts in place: survivors keep their row order
+    # (the old mass-sorted reorder scrambled every row's neighbours for nothing).
     if clouds.n > MOLECULAR_CLOUD_MAX_PER_UNIVERSE:
-        order = np.argsort(-clouds.M, kind='stable')[:MOLECULAR_CLOUD_MAX_PER_UNIVERSE]
-        clouds.select(order)
-
-
-def _update_bh_pulses(universe, ring, delta_time):
-    """Expanding gravitational-wave pulses from BH mergers / kilonovae: push matter in the
-    wavefront band, draining a shared per-pulse energy budget in row order (prefix-sum
-    reproduces the sequential drain exactly), then ripple the barrier."""
-    clouds = universe.clouds
-    pulses_to_remove = []
-    for i, pulse in enumerate(universe.black_hole_pulses):
-        x, y, radius, consumed_mass = pulse
-        new_radius = radius + (NEUTRON_STAR_RIPPLE_SPEED * delta_time * BLACK_HOLE_PULSE_SPEED_MULTIPLIER)
-        universe.black_hole_pulses[i] = [x, y, new_radius, consumed_mass]
-
-        energy_budget = consumed_mass
-        mass_scale = consumed_mass / BLACK_HOLE_PULSE_MASS_SCALE
-        entity_mass_scale = mass_scale * BLACK_HOLE_PULSE_ENTITY_FACTOR
-        bh_ew = NEUTRON_STAR_RIPPLE_EFFECT_WIDTH * 3
-
-        if clouds.n and energy_budget > 0:
-            dx = clouds.X - x
-            dy = clouds.Y - y
-            dist_sq = dx * dx + dy * dy
-            r_inner = max(0, new_radius - bh_ew)
-            r_outer = new_radius + bh_ew
-            in_annulus = (dist_sq >= r_inner * r_inner) & (dist_sq <= r_outer * r_outer)
-            distance = np.sqrt(np.where(in_annulus, dist_sq, 1.0))
-            ripple = np.abs(distance - new_radius)
-            band = in_annulus & (ripple < bh_ew) & (distance > 0)
-            force = np.where(band,
-                             NEUTRON_STAR_PULSE_STRENGTH * 3 * (1.0 - ripple / bh_ew) * entity_mass_scale
-                             / ((ripple + 1) ** 1.5), 0.0)
-            spent = force * delta_time * 0.01
-            budget_before = energy_budget - (np.cumsum(spent) - spent)
-            apply = band & (budget_before > 0)
-            if apply.any():
-                push = np.where(apply, force * delta_time, 0.0)
-                clouds.VX += (dx / distance) * push
-                clouds.VY += (dy / distance) * push
-                energy_budget -= float(spent[apply].sum())
-                # Compression in the wavefront triggers star formation (see _triggered_mergers).
-                clouds.SHOCK = np.where(apply, SHOCK_DURATION, clouds.SHOCK)
-
-        for black_hole in universe.black_holes:
-            if energy_budget <= 0:
-                break
-            dx = black_hole.x - x
-            dy = black_hole.y - y
-            distance = math.hypot(dx, dy)
-            ripple_dist = abs(distance - new_radius)
-            if ripple_dist < NEUTRON_STAR_RIPPLE_EFFECT_WIDTH * 4:
-                effect_factor = 1.0 - (ripple_dist / (NEUTRON_STAR_RIPPLE_EFFECT_WIDTH * 4))
-                force = NEUTRON_STAR_PULSE_STRENGTH * 2 * effect_factor * entity_mass_scale / ((ripple_dist + 1) ** 2)
-                if distance > 0:
-                    black_hole.vx += (dx / distance) * force * delta_time
-                    black_hole.vy += (dy / distance) * force * delta_time
-                    energy_budget -= force * delta_time * 0.01
-
-        for neutron_star in (*universe.neutron_stars, *universe.magnetars):
-            if energy_budget <= 0:
-                break
-            dx = neutron_star.x - x
-            dy = neutron_star.y - y
-            distance = math.hypot(dx, dy)
-            ripple_dist = abs(distance - new_radius)
-            if ripple_dist < NEUTRON_STAR_RIPPLE_EFFECT_WIDTH * 3:
-                effect_factor = 1.0 - (ripple_dist / (NEUTRON_STAR_RIPPLE_EFFECT_WIDTH * 3))
-                force = NEUTRON_STAR_PULSE_STRENGTH * 2.5 * effect_factor * entity_mass_scale / ((ripple_dist + 1) ** 1.8)
-                if distance > 0:
-                    neutron_star.vx += (dx / distance) * force * delta_time
-                    neutron_star.vy += (dy / distance) * force * delta_time
-                    energy_budget -= force * delta_time * 0.01
-
-        universe.black_hole_pulses[i][3] = max(0, energy_budget)
-
-        # Barrier ripple where the wavefront crosses the ring.
-        cx, cy = ring.center
-        pulse_fade = max(0.0, 1.0 - new_radius / ring.rest_radius)
-        bx = cx + ring.radii * ring.cos_a
-        by = cy + ring.radii * ring.sin_a
-        hit = np.abs(np.hypot(bx - x, by - y) - new_radius) < NEUTRON_STAR_RIPPLE_EFFECT_WIDTH * 4
-        if hit.any():
-            ring.flash[hit] = np.maximum(ring.flash[hit], pulse_fade * 0.9)
-            ring.radii_vel[hit] += BARRIER_WAVE_PUSH * 2.0 * mass_scale * pulse_fade * delta_time
-
-        if new_radius > float(ring.radii.max()):
-            pulses_to_remove.append(i)
-
-    for i in sorted(pulses_to_remove, reverse=True):
-        if i < len(universe.black_hole_pulses):
-            universe.black_hole_pulses.pop(i)
+        clouds.keep(heaviest(clouds.M, MOLECULAR_CLOUD_MAX_PER_UNIVERSE))
+    _prof.end(P.FATES, t, universe)
 
 
 def step(universe, ring, delta_time):
     """One physics step for one universe (the old update_simulation_state)."""
     clouds = universe.clouds
+    arena_bytes = clouds.scratch.allocated
+    universe.timers.advance(delta_time)
 
     # Cloud/star mutual gravity (backend-dispatched: GPU / Barnes-Hut / brute / local).
     # Force is linear in G, so this universe's local gravity dial scales the summed output —
     # no backend needs to know about it.
+    t = _prof.begin()
     if clouds.n >= 2:
         fx, fy = gravity.cloud_forces(clouds.X, clouds.Y, clouds.M, clouds.IS_STAR)
-        clouds.VX += fx * (universe.local.g * delta_time)
-        clouds.VY += fy * (universe.local.g * delta_time)
+        fx *= universe.local.g * delta_time
+        fy *= universe.local.g * delta_time
+        clouds.VX += fx
+        clouds.VY += fy
+    _prof.end(P.GRAVITY, t, universe)
 
     update_entities(universe, delta_time)
 
+    t = _prof.begin()
     ring.apply_gravity(universe, delta_time)
     ring.enforce(universe, delta_time)
+    _prof.end(P.BARRIER, t, universe)
 
+    t = _prof.begin()
     for black_hole in universe.black_holes:
         # Tracer rotation driven by angular momentum (with base rotation)
         spin_rate = BLACK_HOLE_DISK_ROTATION + black_hole.angular_momentum / max(black_hole.mass, 1.0)
         black_hole.tracer_angle += spin_rate * delta_time
         # Gradually dissipate angular momentum
         black_hole.angular_momentum *= BLACK_HOLE_ANGULAR_MOMENTUM_DISSIPATION ** delta_time
+    _prof.end(P.BH_SPIN, t, universe)
 
-    _update_bh_pulses(universe, ring, delta_time)
+    # Every gravitational-wave ring — merger pulses and pulsar trains — in one pass.
+    t = _prof.begin()
+    universe.pulses.step(universe, ring, delta_time)
+    _prof.end(P.PULSES, t, universe)
 
     # ── Black-hole pass ──
+    t = _prof.begin()
     alive = np.ones(clouds.n, dtype=bool)
     stream_moves = []
     ns_to_remove = set()
@@ -546,7 +577,7 @@ def step(universe, ring, delta_time):
             universe.pending_rip_bhs.append(black_hole)
         if black_hole.mass <= BLACK_HOLE_DECAY_THRESHOLD:
             bh_to_remove.add(black_hole)
-            universe.event_log.append("BLACK HOLE EVAPORATED — Hawking radiation wins in the end")
+            universe.event_log.emit(E.BLACK_HOLE_EVAPORATED)
             for _ in range(BLACK_HOLE_DECAY_CLOUD_COUNT):
                 offset_angle = random.uniform(0, 2 * math.pi)
                 offset_dist = random.uniform(5, BLACK_HOLE_DECAY_EJECTA_SPREAD)
@@ -558,7 +589,10 @@ def step(universe, ring, delta_time):
                                math.cos(offset_angle) * offset_dist * 0.5,
                                math.sin(offset_angle) * offset_dist * 0.5))
 
+    _prof.end(P.BH_PASS, t, universe)
+
     # ── Neutron-star pass (sees captured clouds, as the object version did) ──
+    t = _prof.begin()
     for neutron_star in universe.neutron_stars:
         if neutron_star in ns_to_remove:
             continue
@@ -584,6 +618,7 @@ def step(universe, ring, delta_time):
                                math.sin(offset_angle) * offset_dist * 0.3))
 
     # ── Magnetar pass ──
+    field_dead = {id(m) for m in universe.timers.due(T.MAGNETAR)}  # field lifetimes that ran out
     for magnetar in universe.magnetars:
         if magnetar in ns_to_remove:
             continue
@@ -591,7 +626,7 @@ def step(universe, ring, delta_time):
         magnetar.apply_magnetism(universe, delta_time)
         magnetar.update_field(universe, delta_time)
         magnetar.decay(delta_time)
-        if magnetar.field_time <= 0 or magnetar.mass <= NEUTRON_STAR_DECAY_THRESHOLD:
+        if id(magnetar) in field_dead or magnetar.mass <= NEUTRON_STAR_DECAY_THRESHOLD:
             # The field dies: the magnetar settles into a plain neutron star. (If mass is
             # already below the NS decay threshold, the NS pass quietly dissipates it into
             # cold clouds next frame — no duplicated ejecta path here.)
@@ -604,14 +639,14 @@ def step(universe, ring, delta_time):
     # White dwarfs cool and pull on nearby gas. Once fully cooled they are black dwarfs —
     # invisible against space — and are removed. Two that collide detonate as a Type Ia
     # supernova: total thermonuclear destruction, no remnant, and a spray of iron-peak elements.
+    cooled = {id(wd) for wd in universe.timers.due(T.DWARF)}  # reached WHITE_DWARF_COOL_TIME
     for wd in universe.white_dwarfs:
         if wd in ns_to_remove:
             continue
         wd.apply_gravity(universe, delta_time)
-        wd.age += delta_time
-        if wd.age >= WHITE_DWARF_COOL_TIME:
+        if id(wd) in cooled:
             ns_to_remove.add(wd)
-            universe.event_log.append("BLACK DWARF — a white dwarf finishes cooling, fades from view")
+            universe.event_log.emit(E.BLACK_DWARF)
 
     # ── Mutual gravity: neutron stars, magnetars, and white dwarfs ──
     # Each of these previously only felt clouds and black holes — nothing pulled two of them
@@ -660,9 +695,9 @@ def step(universe, ring, delta_time):
                     spawns.append((ex, ey, emass, child_elem,
                                    math.cos(offset_angle) * offset_dist * 0.5,
                                    math.sin(offset_angle) * offset_dist * 0.5))
-                universe.black_hole_pulses.append([cx, cy, 0, wd_a.mass + wd_b.mass])
+                universe.pulses.emit_merger(cx, cy, wd_a.mass + wd_b.mass)
                 universe.metallicity = min(1.0, universe.metallicity + METALLICITY_PER_TYPE_IA)
-                universe.event_log.append("SUPERNOVA (TYPE IA) — white dwarfs detonate, forging iron")
+                universe.event_log.emit(E.SUPERNOVA_IA)
                 break
 
     # NS-NS Kilonova mergers (magnetars merge like any neutron star)
@@ -695,7 +730,7 @@ def step(universe, ring, delta_time):
                     spawns.append((ex, ey, emass, child_elem,
                                    math.cos(offset_angle) * offset_dist * 0.5,
                                    math.sin(offset_angle) * offset_dist * 0.5))
-                universe.black_hole_pulses.append([cx, cy, 0, combined_mass])
+                universe.pulses.emit_merger(cx, cy, combined_mass)
                 universe.metallicity = min(1.0, universe.metallicity + METALLICITY_PER_KILONOVA)
                 # The remnant depends on the combined mass (the GW170817 lesson): light pairs
                 # leave a hypermassive magnetar, heavy pairs collapse straight to a black hole
@@ -707,17 +742,20 @@ def step(universe, ring, delta_time):
                 if (combined_mass < KILONOVA_MAGNETAR_REMNANT_MAX
                         or len(universe.black_holes) >= BLACK_HOLE_MAX_COUNT):
                     remnant = Magnetar(cx, cy, combined_mass)
+                    remnant.field_ends = universe.timers.schedule(T.MAGNETAR, MAGNETAR_FIELD_LIFETIME, remnant)
                     remnant.vx, remnant.vy = rem_vx, rem_vy
                     universe.magnetars.append(remnant)
-                    universe.event_log.append("KILONOVA — neutron stars merge; gold forged, magnetar left")
+                    universe.event_log.emit(E.KILONOVA_MAGNETAR)
                 else:
                     new_bh = BlackHole(cx, cy, combined_mass)
                     new_bh.vx, new_bh.vy = rem_vx, rem_vy
                     universe.black_holes.append(new_bh)
-                    universe.event_log.append("KILONOVA — neutron stars merge; gold forged, black hole left")
+                    universe.event_log.emit(E.KILONOVA_HOLE)
                 break
+    _prof.end(P.NS_PASS, t, universe)
 
     # ── Removals, wormhole streams, event spawns ──
+    t = _prof.begin()
     if stream_moves:
         # Streamed rows already carry their child-universe position: copy them to their
         # destinations first (indices still valid), then one compaction drops all captured
@@ -726,26 +764,44 @@ def step(universe, ring, delta_time):
         for row, dst in stream_moves:
             by_dst.setdefault(id(dst), (dst, []))[1].append(row)
         for _, (dst, rows) in by_dst.items():
-            clouds.copy_rows(dst.clouds, rows)
+            dst_rows = clouds.copy_rows(dst.clouds, rows)
+            dst.timers.adopt_rows(dst.clouds, dst_rows, universe.timers.clock)
+            dst.totals.add_rows(dst.clouds, dst_rows)  # dst may already have stepped this frame
     if not alive.all():
         clouds.keep(alive)
     if bh_to_remove:
         universe.black_holes = [bh for bh in universe.black_holes if bh not in bh_to_remove]
     if ns_to_remove:
         universe.neutron_stars = [ns for ns in universe.neutron_stars if ns not in ns_to_remove]
+        universe.pulses.drop_orphans(universe.neutron_stars)
         universe.magnetars = [m for m in universe.magnetars if m not in ns_to_remove]
         universe.white_dwarfs = [wd for wd in universe.white_dwarfs if wd not in ns_to_remove]
     clouds.spawn_batch(spawns)
+    _prof.end(P.REMOVALS, t, universe)
 
     # ── Integration (semi-implicit Euler, kick→drift: damp velocity, then move with the new
     # velocity). Not symplectic — that's a property of Hamiltonian systems and this one is
     # dissipative by design: structure comes from damping and attractors, not conserved energy. ──
+    # Cloud rows are contained by the ring right after they move, in the same sweep when the
+    # extension is built (fastphysics.integrate_and_contain: one pass instead of ~ten). Rows
+    # live in the ring's local frame, so the ring sits at the origin.
+    t = _prof.begin()
     damping = VELOCITY_DAMPING ** delta_time
-    clouds.VX *= damping
-    clouds.VY *= damping
-    clouds.X += clouds.VX * delta_time
-    clouds.Y += clouds.VY * delta_time
-    clouds.SHOCK = np.maximum(clouds.SHOCK - delta_time, 0.0)  # shock compression relaxes
+    if _fastphysics is not None and hasattr(_fastphysics, 'integrate_and_contain'):
+        _fastphysics.integrate_and_contain(clouds.x, clouds.y, clouds.vx, clouds.vy, clouds.shock,
+                                           clouds.n, damping, delta_time,
+                                           0.0, 0.0,
+                                           np.ascontiguousarray(ring.radii, dtype=np.float64))
+    else:
+        clouds.VX *= damping
+        clouds.VY *= damping
+        drift = clouds.tmp('drift')
+        clouds.X += np.multiply(clouds.VX, delta_time, out=drift)
+        clouds.Y += np.multiply(clouds.VY, delta_time, out=drift)
+        shock = clouds.SHOCK  # shock compression relaxes
+        shock -= delta_time
+        np.maximum(shock, 0.0, out=shock)
+        ring.contain_clouds(clouds)
     # Absolute anchoring: strong velocity damping so holes act as fixed galactic centers.
     bh_damping = BLACK_HOLE_VELOCITY_DAMPING ** delta_time
     for bh in universe.black_holes:
@@ -761,93 +817,106 @@ def step(universe, ring, delta_time):
         ns.vy *= ns_damping * damping
         ns.x += ns.vx * delta_time
         ns.y += ns.vy * delta_time
+    _prof.end(P.INTEGRATE, t, universe)
+
+    # Debug counter: scratch bytes this step had to allocate. Zero in steady state; a
+    # nonzero reading outside growth/shrink steps means a pass is churning its buffers.
+    universe.step_alloc_bytes = clouds.scratch.allocated - arena_bytes
+    clouds.maybe_shrink()  # hand back capacity a burst left behind (hysteresis-gated)
+    universe.totals.tally(universe)
 
 
 # ── Multiverse mechanics ────────────────────────────────────────────────────────────────────
 
-def spawn_universe(center):
-    """Create a fresh universe: a tiny barrier at `center` seeded with a Big-Bang of clouds."""
-    cx, cy = center
-    ring = Barrier(center, (BARRIER_INITIAL_SIZE, BARRIER_INITIAL_SIZE), BARRIER_POINT_COUNT)
+def spawn_universe(center, bank=None):
+    """Create a fresh universe: a tiny barrier at `center` (a row of `bank`, the multiverse's
+    BarrierBank) seeded with a Big-Bang of clouds."""
+    ring = Barrier(center, (BARRIER_INITIAL_SIZE, BARRIER_INITIAL_SIZE), BARRIER_POINT_COUNT, bank)
     universe = Universe(ring)
 
-    # Scalar running sums on purpose: bit-identical to the historical init (np.sum's pairwise
-    # accumulation differs in the last ulp, enough to flip which weight bucket a draw lands in).
-    density_weights = [max(0.0, 1.0 - CMB_DENSITY_CONTRAST * float(p)) for p in ring.perturbation]
-    total_weight = sum(density_weights)
-    density_weights = [w / total_weight for w in density_weights]
-    cumulative = []
-    running_sum = 0.0
-    for w in density_weights:
-        running_sum += w
-        cumulative.append(running_sum)
-    cumulative = np.array(cumulative)
-
+    # Big-Bang seeding, all MOLECULAR_CLOUD_COUNT clouds at once: each cloud picks a ring
+    # sector weighted by the CMB density contrast (overdense sectors seed more clouds), a
+    # uniform angle within it and an area-uniform radius out to the ring there. Every draw —
+    # sector, angle, radius, element, block offsets — is one bulk numpy draw, and the field
+    # fills with one spawn_columns, instead of 1800 scalar spawn() calls.
+    n = MOLECULAR_CLOUD_COUNT
+    weights = np.maximum(0.0, 1.0 - CMB_DENSITY_CONTRAST * ring.perturbation)
+    cumulative = np.cumsum(weights / weights.sum())
+    idx = np.minimum(np.searchsorted(cumulative, np.random.random(n), side='left'),
+                     ring.num_points - 1)
     step_a = 2 * math.pi / ring.num_points
-    for _ in range(MOLECULAR_CLOUD_COUNT):
-        r = random.random()
-        idx = min(int(np.searchsorted(cumulative, r, side='left')), ring.num_points - 1)
-        angle = ring.angles[idx] + random.uniform(0, step_a)
-        local_radius = ring.get_radius_at_angle(angle)
-        radius = math.sqrt(random.uniform(0, 1)) * local_radius
-        universe.clouds.spawn(cx + radius * math.cos(angle), cy + radius * math.sin(angle),
-                              MOLECULAR_CLOUD_START_MASS, abundance=SEED_ELEMENTAL_ABUNDANCE)
+    angle = ring.angles[idx] + np.random.uniform(0, step_a, n)
+    radius = np.sqrt(np.random.uniform(0, 1, n)) * ring.radius_at(angle)
+    universe.clouds.spawn_columns(radius * np.cos(angle), radius * np.sin(angle),
+                                  MOLECULAR_CLOUD_START_MASS,
+                                  pick_elements(n, SEED_ELEMENTAL_ABUNDANCE))
+    universe.totals.tally(universe)
     return universe
 
 
-def _clear_of_all(state, x, y, new_radius):
-    """Clear if the new barrier keeps UNIVERSE_SPAWN_GAP to each existing barrier's LOCAL
-    edge (its radius toward the candidate point, not the global max — a bulge on the far
-    side of a deformed neighbour shouldn't push spawns away from this side), so newborn
-    universes can nestle into the contours of the cluster."""
-    for u in state.universes:
-        ucx, ucy = u.barrier.center
-        dx, dy = x - ucx, y - ucy
-        dist = math.hypot(dx, dy)
-        local_r = u.barrier.get_radius_at_angle(math.atan2(dy, dx) % (2 * math.pi))
-        if dist <= local_r + new_radius + UNIVERSE_SPAWN_GAP:
-            return False
-    return True
+def _clear_of_all(state, xs, ys, new_radius):
+    """Which candidate centers (xs[k], ys[k]) are clear: a new barrier there keeps
+    UNIVERSE_SPAWN_GAP to each existing barrier's LOCAL edge (its radius toward the candidate
+    point, not the global max — a bulge on the far side of a deformed neighbour shouldn't push
+    spawns away from this side), so newborn universes can nestle into the contours of the
+    cluster. Every candidate is tested against every barrier in one (candidates x universes)
+    broadcast over the barrier bank, instead of a Python loop of atan2/radius lookups per
+    candidate per universe."""
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    if not state.universes:
+        return np.ones(len(xs), dtype=bool)
+    bank = state.barriers
+    rows = np.fromiter((u.barrier.row for u in state.universes), np.int64, len(state.universes))
+    centers = bank.centers[rows]
+    dx = xs[:, None] - centers[None, :, 0]
+    dy = ys[:, None] - centers[None, :, 1]
+    dist = np.hypot(dx, dy)
+    local_r = bank.radius_at(rows[None, :], np.arctan2(dy, dx))
+    return ~(dist <= local_r + (new_radius + UNIVERSE_SPAWN_GAP)).any(axis=1)
 
 
 def _find_spawn_center(state, new_radius, source=None, bh=None):
     """Find a point for a new barrier that doesn't overlap any existing one. Preferred spot: just
-    outside the SOURCE barrier in the direction of the ripping black hole."""
+    outside the SOURCE barrier in the direction of the ripping black hole, stepping outward;
+    failing that, a widening random spiral around the cluster's centroid. Each phase scores
+    all its candidates at once (_clear_of_all) and takes the first clear one."""
     if source is not None and bh is not None:
         scx, scy = source.barrier.center
-        angle = math.atan2(bh.y - scy, bh.x - scx)
+        angle = math.atan2(bh.y, bh.x)  # the hole's position is local to its ring
         edge = source.barrier.get_radius_at_angle(angle % (2 * math.pi))
-        for extra in range(0, 800, 10):
-            dist = edge + new_radius + UNIVERSE_SPAWN_GAP + extra
-            x = scx + dist * math.cos(angle)
-            y = scy + dist * math.sin(angle)
-            if _clear_of_all(state, x, y, new_radius):
-                return (x, y)
+        dist = edge + new_radius + UNIVERSE_SPAWN_GAP + np.arange(0, 800, 10, dtype=np.float64)
+        xs = scx + dist * math.cos(angle)
+        ys = scy + dist * math.sin(angle)
+        clear = _clear_of_all(state, xs, ys, new_radius)
+        if clear.any():
+            k = int(np.argmax(clear))
+            return (float(xs[k]), float(ys[k]))
     if state.universes:
         cx = sum(u.barrier.center[0] for u in state.universes) / len(state.universes)
         cy = sum(u.barrier.center[1] for u in state.universes) / len(state.universes)
     else:
         cx, cy = SCREEN_WIDTH / 2.0, SCREEN_HEIGHT / 2.0
-    for attempt in range(400):
-        angle = random.uniform(0, 2 * math.pi)
-        dist = 40 + attempt * 8
-        x = cx + dist * math.cos(angle)
-        y = cy + dist * math.sin(angle)
-        if _clear_of_all(state, x, y, new_radius):
-            return (x, y)
-    return (x, y)  # fallback: accept the last candidate even if tight
+    angles = np.array([random.uniform(0, 2 * math.pi) for _ in range(400)])
+    dist = 40 + 8 * np.arange(400, dtype=np.float64)
+    xs = cx + dist * np.cos(angles)
+    ys = cy + dist * np.sin(angles)
+    clear = _clear_of_all(state, xs, ys, new_radius)
+    k = int(np.argmax(clear)) if clear.any() else len(xs) - 1  # fallback: the last candidate, even if tight
+    return (float(xs[k]), float(ys[k]))
 
 
 def _rip_universe(source, center):
     """Rip open a new universe by pulling a chunk of the SOURCE universe's clouds through into
     it, keeping the multiverse's total entity count bounded."""
-    cx, cy = center
-    ring = Barrier(center, (BARRIER_INITIAL_SIZE, BARRIER_INITIAL_SIZE), BARRIER_POINT_COUNT)
+    ring = Barrier(center, (BARRIER_INITIAL_SIZE, BARRIER_INITIAL_SIZE), BARRIER_POINT_COUNT,
+                   source.barrier.bank)
     new_u = Universe(ring)
     # The child is built from the parent's matter, so it inherits the parent's chemical age —
     # and the parent's physics, with a small mutation (see LocalPhysics: heredity + variation).
     new_u.metallicity = source.metallicity
     new_u.local = source.local.mutated()
+    new_u.parent_uid = source.uid
     clouds = source.clouds
     move_count = int(clouds.n * UNIVERSE_RIP_TRANSFER_FRACTION)
     if move_count <= 0:
@@ -858,11 +927,12 @@ def _rip_universe(source, center):
     moved_rows = list(range(move_count))
     rr = ring.rest_radius
     dst_rows = clouds.move_rows(new_u.clouds, moved_rows)
+    new_u.timers.adopt_rows(new_u.clouds, dst_rows, source.timers.clock)
     for k in dst_rows:
         ang = random.uniform(0, 2 * math.pi)
         rad = math.sqrt(random.random()) * rr
-        new_u.clouds.x[k] = cx + rad * math.cos(ang)
-        new_u.clouds.y[k] = cy + rad * math.sin(ang)
+        new_u.clouds.x[k] = rad * math.cos(ang)
+        new_u.clouds.y[k] = rad * math.sin(ang)
         new_u.clouds.vx[k] = 0.0
         new_u.clouds.vy[k] = 0.0
     return new_u
@@ -881,78 +951,90 @@ def process_universe_spawns(state):
             if len(state.universes) >= UNIVERSE_MAX_COUNT:
                 break
             child = _rip_universe(src, _find_spawn_center(state, new_radius, src, bh))
+            src.totals.tally(src)
+            child.totals.tally(child)
             bh.child_universe = child
             state.universes.append(child)
-            src.event_log.append(
-                f"SPACETIME RIP — a child universe opens; its constants drift "
-                f"(G x{child.local.g:.2f}, fusion x{child.local.fusion:.2f}, collapse x{child.local.collapse:.2f})")
+            src.event_log.emit(E.SPACETIME_RIP, E.NO_CLASS,
+                               child.local.g, child.local.fusion, child.local.collapse)
+
+
+def update_barriers(state, delta_time):
+    """This frame's wall motion for every universe: each dents its own bank row, then the
+    bank moves every wall at once (damping, membrane tension, flash decay)."""
+    for u in state.universes:
+        u.barrier.accumulate_deformation(u, delta_time)
+    state.barriers.integrate(delta_time)
 
 
 def _translate_universe(u, dx, dy):
-    """Move a whole universe rigidly — barrier center and every entity/pulse."""
+    """Move a whole universe rigidly. Everything inside it is stored relative to its barrier
+    center, so this is O(1): the clouds, compact objects and pulses ride along with the
+    center instead of being shifted one by one."""
     bx, by = u.barrier.center
     u.barrier.center = (bx + dx, by + dy)
-    u.clouds.X += dx
-    u.clouds.Y += dy
-    for e in u.black_holes:
-        e.x += dx
-        e.y += dy
-    for e in (*u.neutron_stars, *u.magnetars, *u.white_dwarfs):
-        e.x += dx
-        e.y += dy
-    for p in u.black_hole_pulses:
-        p[0] += dx
-        p[1] += dy
-
-
-def _dent_barrier_toward(barrier, tx, ty, amount):
-    """Push the barrier's vertices that face point (tx,ty) inward, flattening that side."""
-    contact_angle = math.atan2(ty - barrier.center[1], tx - barrier.center[0])
-    align = np.cos(barrier.angles - contact_angle)
-    facing = align > 0
-    barrier.radii[facing] = np.maximum(2.0, barrier.radii[facing] - amount * align[facing])
 
 
 def resolve_barrier_overlaps(state, delta_time):
     """Soft-body contact between universes: where two barriers press together they FLATTEN and
-    get pushed apart, so they touch and deform but never overlap."""
+    get pushed apart, so they touch and deform but never overlap.
+
+    Each relaxation pass works on every pair at once off the barrier bank: a broad phase
+    keeps the pairs whose bounding circles (max radius) meet, the narrow phase compares both
+    rings' radii along the line of centres, and every contact's push is accumulated per
+    universe and applied as one translation at the end of the pass — rather than moving both
+    universes (every row they hold) once per contacting pair. Dents from all of a ring's
+    contacts are summed before the floor is applied, which is what applying them one after
+    another did."""
     universes = state.universes
     if len(universes) < 2:
         return
-    means = [float(u.barrier.radii.mean()) for u in universes]
+    bank = state.barriers
+    rows = np.array([u.barrier.row for u in universes])
+    means = bank.mean_radii()[rows]
     relax = min(0.9, BARRIER_REPULSION_RATE * delta_time)
+    ia, ib = np.triu_indices(len(universes), 1)
     for _ in range(BARRIER_RESOLVE_ITERATIONS):
-        for i in range(len(universes)):
-            A = universes[i]
-            ax, ay = A.barrier.center
-            wA = means[i]
-            for j in range(i + 1, len(universes)):
-                B = universes[j]
-                bx, by = B.barrier.center
-                wB = means[j]
-                dx = bx - ax
-                dy = by - ay
-                dist = math.hypot(dx, dy)
-                if dist < 0.01:
-                    dx, dy, dist = random.uniform(-1, 1), random.uniform(-1, 1), 1.0  # unstick coincident
-                ang = math.atan2(dy, dx)
-                rA_c = A.barrier.get_radius_at_angle(ang % (2 * math.pi))
-                rB_c = B.barrier.get_radius_at_angle((ang + math.pi) % (2 * math.pi))
-                penetration = (rA_c + rB_c) - dist
-                if penetration <= 0:
-                    continue
-                ux, uy = dx / dist, dy / dist
-                total = wA + wB
-                # Push apart (smaller universe moves more) resolves part of the penetration...
-                push = penetration * BARRIER_SEPARATION_SHARE * relax
-                _translate_universe(A, -ux * push * (wB / total), -uy * push * (wB / total))
-                _translate_universe(B, ux * push * (wA / total), uy * push * (wA / total))
-                ax -= ux * push * (wB / total)
-                ay -= uy * push * (wB / total)
-                # ...the rest flattens both contact faces (smaller deforms more).
-                d = penetration * BARRIER_CONTACT_DEFORM * relax
-                _dent_barrier_toward(A.barrier, bx, by, d * (wB / total))
-                _dent_barrier_toward(B.barrier, ax, ay, d * (wA / total))
+        centers = bank.centers[rows]
+        dx = centers[ib, 0] - centers[ia, 0]
+        dy = centers[ib, 1] - centers[ia, 1]
+        dist = np.hypot(dx, dy)
+        reach = bank.max_radii()[rows]
+        near = np.flatnonzero(dist < reach[ia] + reach[ib])  # broad phase
+        if not len(near):
+            break
+        a, b, dx, dy, dist = ia[near], ib[near], dx[near], dy[near], dist[near]
+        for k in np.flatnonzero(dist < 0.01):  # unstick coincident centres
+            dx[k], dy[k], dist[k] = random.uniform(-1, 1), random.uniform(-1, 1), 1.0
+        ang = np.arctan2(dy, dx)
+        penetration = (bank.radius_at(rows[a], ang) + bank.radius_at(rows[b], ang + math.pi)) - dist
+        hit = penetration > 0
+        if not hit.any():
+            break
+        a, b, dx, dy, dist, ang, penetration = (v[hit] for v in (a, b, dx, dy, dist, ang, penetration))
+        ux, uy = dx / dist, dy / dist
+        total = means[a] + means[b]
+        share_a, share_b = means[b] / total, means[a] / total  # the smaller universe gives more
+        # Push apart resolves part of the penetration...
+        push = penetration * BARRIER_SEPARATION_SHARE * relax
+        n_u = len(universes)
+        shift_x = (np.bincount(a, -ux * push * share_a, n_u) + np.bincount(b, ux * push * share_b, n_u))
+        shift_y = (np.bincount(a, -uy * push * share_a, n_u) + np.bincount(b, uy * push * share_b, n_u))
+        # ...the rest flattens both contact faces (smaller deforms more): each ring's vertices
+        # facing the other centre move inward by the cosine of their angle off the contact.
+        d = penetration * BARRIER_CONTACT_DEFORM * relax
+        align = np.cos(bank.angles[None, :] - ang[:, None])  # contacts x points, seen from a
+        contacts = np.arange(len(a))
+        to_a = np.zeros((n_u, len(a)))
+        to_a[a, contacts] = d * share_a
+        to_b = np.zeros((n_u, len(a)))
+        to_b[b, contacts] = d * share_b
+        dent = to_a @ np.maximum(align, 0.0) + to_b @ np.maximum(-align, 0.0)
+        for i in sorted(set(a.tolist()) | set(b.tolist())):
+            radii = universes[i].barrier.radii
+            facing = dent[i] > 0
+            radii[facing] = np.maximum(2.0, radii[facing] - dent[i][facing])
+            _translate_universe(universes[i], shift_x[i], shift_y[i])
 
 
 def apply_dark_flow(state, delta_time):
@@ -965,14 +1047,7 @@ def apply_dark_flow(state, delta_time):
     universes = state.universes
     if len(universes) < 2:
         return
-    weights = []
-    for u in universes:
-        m = float(u.clouds.M.sum()) if u.clouds.n else 0.0
-        m += sum(bh.mass for bh in u.black_holes)
-        m += sum(ns.mass for ns in u.neutron_stars)
-        m += sum(mg.mass for mg in u.magnetars)
-        m += sum(wd.mass for wd in u.white_dwarfs)
-        weights.append(m)
+    weights = [u.totals.mass for u in universes]
     total = sum(weights)
     if total <= 0:
         return
@@ -1013,20 +1088,16 @@ def reap_dead_universes(state):
     if not dead:
         return
     state.universes = [u for u, f in fates if f is None]
+    for u, _f in dead:
+        u.barrier.release()
     if not state.universes:
         return  # everything ended at once; the main loop's heat-death reset takes it from here
     keeper = state.universes[0]
     for u, f in dead:
+        # The epitaph is recorded under the dead universe's id, like its last events.
+        ending = {"crunch": E.BIG_CRUNCH, "heat": E.HEAT_DEATH}.get(f, E.UNIVERSE_LOST)
+        u.event_log.emit(ending, E.NO_CLASS, u.metallicity)
         keeper.event_log.extend(u.event_log)
-        if f == "crunch":
-            keeper.event_log.append(
-                f"BIG CRUNCH — a universe contracts to a point; nothing gets out (Z {u.metallicity:.2f})")
-        elif f == "heat":
-            keeper.event_log.append(
-                f"HEAT DEATH — a universe completes its chemistry (Z {u.metallicity:.2f}) and goes dark")
-        else:
-            keeper.event_log.append(
-                f"UNIVERSE LOST — the last of its matter is gone (Z {u.metallicity:.2f})")
 
 
 def enforce_total_cloud_cap(state):
@@ -1035,14 +1106,13 @@ def enforce_total_cloud_cap(state):
     total = sum(u.clouds.n for u in state.universes)
     if total <= MULTIVERSE_MAX_CLOUDS:
         return
-    all_mass = np.concatenate([u.clouds.M for u in state.universes])
-    order = np.argsort(-all_mass, kind='stable')
-    keep_flat = np.zeros(total, dtype=bool)
-    keep_flat[order[:MULTIVERSE_MAX_CLOUDS]] = True
+    keep_flat = heaviest(np.concatenate([u.clouds.M for u in state.universes]), MULTIVERSE_MAX_CLOUDS)
     pos = 0
     for u in state.universes:
         n0 = u.clouds.n
-        u.clouds.keep(keep_flat[pos:pos + n0])
+        mask = keep_flat[pos:pos + n0]
+        u.totals.add_rows(u.clouds, np.flatnonzero(~mask), -1)
+        u.clouds.keep(mask)
         pos += n0
 
 
@@ -1057,6 +1127,7 @@ def prune_child_links(state):
 
 
 def initialize_state():
+    streams.ensure()
     state = SimulationState()
-    state.universes.append(spawn_universe((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)))
+    state.universes.append(spawn_universe((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2), state.barriers))
     return state
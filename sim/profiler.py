@@ -0,0 +1,145 @@
+"""Per-phase frame profiler: where a frame's milliseconds went, and which universe spent them.
+
+A slow frame used to mean attaching an external profiler and reverse-engineering which
+universe (and which pass inside physics.step) caused it. The sim loop and physics.step now
+bracket each phase with begin()/end(); every span is recorded with its universe's uid and
+cloud count into a ring of the last PROFILE_RING_FRAMES frames:
+
+    span = (phase, uid, t0, t1, clouds)     uid 0 = multiverse-level work (render, HUD, ...)
+
+  - write_chrome_trace() dumps the ring as Chrome trace-event JSON (chrome://tracing,
+    Perfetto): one track per universe, phases nested inside each universe's step;
+  - with PROFILE_CSV_PATH set, each frame's spans are appended to a rolling CSV as the frame
+    ends, so long runs can be plotted without keeping them in memory.
+
+Disabled (the default), begin() returns 0.0 after one flag check and end() returns on it, so
+the instrumented call sites cost a couple of no-op calls per phase.
+"""
+import collections
+import json
+import os
+import time
+
+from sim.config import PROFILE_ENABLED, PROFILE_RING_FRAMES, PROFILE_CSV_PATH
+
+# Each phase is recorded as one span per universe step (or per frame, for the multiverse-level
+# ones), so a slice in the trace is never split across unrelated work.
+(STEP, GRAVITY, COLLISIONS, FATES, BARRIER, BH_SPIN, PULSES, BH_PASS, NS_PASS, REMOVALS,
+ INTEGRATE, MULTIVERSE, EVENTS, RENDER, RNG, HUD, ENTROPY) = range(17)
+PHASE_NAMES = ('step', 'gravity', 'collisions', 'fates', 'barrier', 'bh spin', 'pulses',
+               'bh pass', 'ns pass', 'removals/spawns', 'integrate', 'multiverse', 'events',
+               'render', 'rng', 'hud', 'entropy')
+
+_CSV_HEADER = 'frame,universe,phase,start_ms,duration_ms,clouds\n'
+
+
+class Frame:
+    """One frame's record: its spans, and its start/end on the profiler clock."""
+
+    __slots__ = ('index', 't0', 't1', 'spans')
+
+    def __init__(self, index, t0):
+        self.index = index
+        self.t0 = t0
+        self.t1 = t0
+        self.spans = []
+
+    @property
+    def duration(self):
+        return self.t1 - self.t0
+
+
+class FrameProfiler:
+    """The ring of recent frames. frame_begin()/frame_end() delimit a frame; begin()/end()
+    time one phase inside it."""
+
+    def __init__(self, enabled=PROFILE_ENABLED, frames=PROFILE_RING_FRAMES, csv_path=PROFILE_CSV_PATH):
+        self.enabled = enabled
+        self.frames = collections.deque(maxlen=frames)
+        self.csv_path = csv_path
+        self._csv = None
+        self._current = None
+        self._count = 0
+
+    def enable(self, on=True):
+        self.enabled = on
+        if not on:
+            self._current = None
+
+    def frame_begin(self):
+        if not self.enabled:
+            return
+        self._current = Frame(self._count, time.perf_counter())
+        self._count += 1
+
+    def frame_end(self):
+        frame = self._current
+        if frame is None:
+            return
+        frame.t1 = time.perf_counter()
+        self.frames.append(frame)
+        self._current = None
+        if self.csv_path:
+            self._append_csv(frame)
+
+    def begin(self):
+        """Start timing a phase: the token end() needs (0.0 when disabled)."""
+        return time.perf_counter() if self.enabled else 0.0
+
+    def end(self, phase, t0, universe=None):
+        """Close a phase begun at `t0`, attributing it to `universe` (None = multiverse)."""
+        frame = self._current
+        if frame is None or not t0:
+            return
+        if universe is None:
+            frame.spans.append((phase, 0, t0, time.perf_counter(), 0))
+        else:
+            frame.spans.append((phase, universe.uid, t0, time.perf_counter(), universe.clouds.n))
+
+    def last(self):
+        """The most recent completed frame, or None."""
+        return self.frames[-1] if self.frames else None
+
+    def close(self):
+        if self._csv is not None:
+            self._csv.close()
+            self._csv = None
+
+    # ── export ──
+    def _append_csv(self, frame):
+        if self._csv is None:
+            fresh = not os.path.exists(self.csv_path) or os.path.getsize(self.csv_path) == 0
+            self._csv = open(self.csv_path, 'a')
+            if fresh:
+                self._csv.write(_CSV_HEADER)
+        base = frame.t0
+        self._csv.write(''.join(
+            f'{frame.index},{uid},{PHASE_NAMES[phase]},{(t0 - base) * 1e3:.4f},'
+            f'{(t1 - t0) * 1e3:.4f},{clouds}\n'
+            for phase, uid, t0, t1, clouds in frame.spans))
+
+    def chrome_trace(self):
+        """The ring as a Chrome trace-event dict: complete ('X') events in microseconds, one
+        thread track per universe (tid = uid; tid 0 holds the frames and multiverse work)."""
+        events = []
+        uids = set()
+        for frame in self.frames:
+            events.append({'name': f'frame {frame.index}', 'cat': 'frame', 'ph': 'X', 'pid': 1,
+                           'tid': 0, 'ts': frame.t0 * 1e6, 'dur': frame.duration * 1e6})
+            for phase, uid, t0, t1, clouds in frame.spans:
+                uids.add(uid)
+                events.append({'name': PHASE_NAMES[phase], 'cat': 'universe' if uid else 'multiverse',
+                               'ph': 'X', 'pid': 1, 'tid': uid, 'ts': t0 * 1e6,
+                               'dur': (t1 - t0) * 1e6,
+                               'args': {'frame': frame.index, 'clouds': clouds}})
+        for uid in sorted(uids | {0}):
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': uid,
+                           'args': {'name': f'universe {uid}' if uid else 'multiverse'}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.chrome_trace(), f)
+
+
+PROFILER = FrameProfiler()  # the one the sim loop and physics.step record into
@@ -0,0 +1,300 @@
+"""Gravitational-wave rings: every expanding pulse in a universe, held as one SoA table.
+
+Two kinds share the table:
+  MERGER — black-hole mergers, kilonovae, Type Ia detonations, magnetar giant flares. Fixed
+           origin, crosses the whole universe, and pushes with a finite energy budget (the
+           consumed mass) drained in cloud row order — the prefix sum reproduces the
+           sequential drain exactly.
+  PULSAR — one ring of a neutron star's pulse train. Rides its star (the origin is refreshed
+           from the owner every step), unbudgeted, dissipates at NEUTRON_STAR_PULSE_RANGE.
+
+PulseField.step evaluates every ring together. With PULSE_GRID_MIN_RINGS or more rings
+pushing, each ring's cloud band comes from an annulus query on the universe's bucket grid
+(fastphysics.CollisionGrid.annulus), built once for the pass, so a ring touches only the
+cells its wavefront crosses. A lone ring instead computes its cloud distances in one numpy
+pass (and a pulsar's train, without the extension, sorts its clouds by distance once and
+slices each band out with searchsorted). The barrier ripple is a single (rings x vertices)
+pass. Rings act independently of each other (pushes add, shock marks and flashes saturate),
+so evaluating them together leaves the per-ring physics unchanged.
+"""
+import math
+
+import numpy as np
+
+from sim.config import *
+
+KIND_MERGER = 0
+KIND_PULSAR = 1
+
+
+class PulseField:
+    """Rows [0, n) are live rings: origin (ox, oy), radius, energy budget, kind, and in
+    `owners` the emitting NeutronStar for PULSAR rows (None for MERGER rows)."""
+
+    __slots__ = ('n', 'cap', 'ox', 'oy', 'radius', 'budget', 'kind', 'owners')
+
+    def __init__(self, cap=16):
+        self.n = 0
+        self.cap = cap
+        self.ox = np.zeros(cap)
+        self.oy = np.zeros(cap)
+        self.radius = np.zeros(cap)
+        self.budget = np.zeros(cap)
+        self.kind = np.zeros(cap, dtype=np.int8)
+        self.owners = []
+
+    def __len__(self):
+        return self.n
+
+    def _append(self, x, y, budget, kind, owner):
+        if self.n == self.cap:
+            self.cap *= 2
+            for name in ('ox', 'oy', 'radius', 'budget', 'kind'):
+                old = getattr(self, name)
+                grown = np.zeros(self.cap, dtype=old.dtype)
+                grown[:self.n] = old[:self.n]
+                setattr(self, name, grown)
+        k = self.n
+        self.ox[k] = x
+        self.oy[k] = y
+        self.radius[k] = 0.0
+        self.budget[k] = budget
+        self.kind[k] = kind
+        self.owners.append(owner)
+        self.n += 1
+
+    def emit_merger(self, x, y, energy):
+        """A budgeted, universe-crossing ring from (x, y) carrying `energy` (consumed mass)."""
+        self._append(x, y, energy, KIND_MERGER, None)
+
+    def emit_pulsar(self, star):
+        """The next ring of `star`'s pulse train (star.pulse_count tracks its live rings)."""
+        self._append(star.x, star.y, 0.0, KIND_PULSAR, star)
+        star.pulse_count += 1
+
+    def keep(self, mask):
+        """Compact to the rows where mask is True, preserving order."""
+        mask = np.asarray(mask, dtype=bool)
+        for owner, kept in zip(self.owners, mask):
+            if owner is not None and not kept:
+                owner.pulse_count -= 1
+        idx = np.nonzero(mask)[0]
+        m = len(idx)
+        for name in ('ox', 'oy', 'radius', 'budget', 'kind'):
+            col = getattr(self, name)
+            col[:m] = col[idx]
+        self.owners = [self.owners[i] for i in idx]
+        self.n = m
+
+    def drop_orphans(self, stars):
+        """Drop the PULSAR rings whose star is no longer among `stars` (captured, merged,
+        dissipated) — the rings die with their source, as the old per-star lists did."""
+        if not self.n:
+            return
+        alive = {id(s) for s in stars}
+        keep = [owner is None or id(owner) in alive for owner in self.owners]
+        if not all(keep):
+            self.keep(keep)
+
+    def mergers(self):
+        """(x, y, radius, budget) for every MERGER ring, in row order (for rendering)."""
+        return [(float(self.ox[k]), float(self.oy[k]), float(self.radius[k]), float(self.budget[k]))
+                for k in range(self.n) if self.kind[k] == KIND_MERGER]
+
+    def pulsar_rings(self):
+        """{id(star): [radius, ...]} for every star with live PULSAR rings (for rendering)."""
+        rings = {}
+        for k, owner in enumerate(self.owners):
+            if owner is not None:
+                rings.setdefault(id(owner), []).append(float(self.radius[k]))
+        return rings
+
+    # ── the per-step evaluation ──
+    def step(self, universe, ring, delta_time):
+        """Expand every ring, push matter in its wavefront band (clouds, holes, neutron
+        stars), ripple the barrier, and retire rings that have left the universe."""
+        n = self.n
+        if n == 0:
+            return
+        radius = self.radius[:n]
+        merger = self.kind[:n] == KIND_MERGER
+        strength = np.zeros(n)
+        for k, owner in enumerate(self.owners):
+            if owner is not None:
+                self.ox[k] = owner.x
+                self.oy[k] = owner.y
+                strength[k] = owner.pulse_strength
+        radius += np.where(merger, NEUTRON_STAR_RIPPLE_SPEED * BLACK_HOLE_PULSE_SPEED_MULTIPLIER,
+                           NEUTRON_STAR_RIPPLE_SPEED) * delta_time
+        # Each merger ring's push scales with the budget it started this step with.
+        mass_scale = self.budget[:n] / BLACK_HOLE_PULSE_MASS_SCALE
+
+        clouds = universe.clouds
+        if clouds.n and self._push_clouds(clouds, universe.collision_grid, merger, strength,
+                                          mass_scale, delta_time):
+            universe.timers.shocked(SHOCK_DURATION)
+        self._push_compact(universe, merger, strength, mass_scale, delta_time)
+        self._ripple_barrier(ring, merger, mass_scale, delta_time)
+
+        # Pulsar ripples are local: they dissipate at PULSE_RANGE (or at the wall if the
+        # universe is smaller than that). Only merger rings cross the whole universe.
+        done = radius > float(ring.radii.max())
+        done |= ~merger & (radius > NEUTRON_STAR_PULSE_RANGE)
+        if done.any():
+            self.keep(~done)
+
+    def _push_clouds(self, clouds, grid, merger, strength, mass_scale, delta_time):
+        """Push and shock the clouds in every ring's band; True if any row was shocked."""
+        n = self.n
+        # Group rings by origin: without the grid, a pulsar's whole train shares one
+        # distance pass.
+        groups = {}
+        pushing = 0
+        for k in range(n):
+            if merger[k] and self.budget[k] <= 0:
+                continue  # spent merger rings still expand (and draw), but push nothing
+            owner = self.owners[k]
+            groups.setdefault(id(owner) if owner is not None else -1 - k, []).append(k)
+            pushing += 1
+        if not groups:
+            return False
+        X, Y = clouds.X, clouds.Y
+        # Several rings share one grid build over the current rows (the merge passes rebuild it
+        # again before they use it). A lone ring, a missing extension or a pathological spread
+        # take full-field distances instead.
+        if (grid is None or pushing < PULSE_GRID_MIN_RINGS
+                or not grid.build(X, Y, clouds.SIZE, clouds.n)):
+            grid = None
+        VX, VY, SHOCK = clouds.VX, clouds.VY, clouds.SHOCK
+        tmp = clouds.tmp
+        width = NEUTRON_STAR_RIPPLE_EFFECT_WIDTH
+        shocked = False
+        for rows in groups.values():
+            ox, oy = self.ox[rows[0]], self.oy[rows[0]]
+            if grid is None:
+                dx_all = np.subtract(X, ox, out=tmp('pulse_dx'))
+                dy_all = np.subtract(Y, oy, out=tmp('pulse_dy'))
+                d2_all = np.multiply(dx_all, dx_all, out=tmp('pulse_d2'))
+                d2_all += np.multiply(dy_all, dy_all, out=tmp('pulse_work'))
+                if len(rows) > 1:
+                    by_dist = np.argsort(d2_all, kind='stable')
+                    sorted_d2 = d2_all[by_dist]
+            for k in rows:
+                is_merger = bool(merger[k])
+                ew = width * 3 if is_merger else width
+                r = float(self.radius[k])
+                r_inner = max(0, r - ew)
+                r_outer = r + ew
+                if grid is not None:
+                    idx = grid.annulus(ox, oy, r_inner, r_outer, X, Y)
+                    if is_merger:
+                        idx.sort()  # row order for the budget drain
+                    dx = X[idx] - ox
+                    dy = Y[idx] - oy
+                    dist_sq = dx * dx + dy * dy
+                else:
+                    if len(rows) > 1:
+                        lo = np.searchsorted(sorted_d2, r_inner * r_inner, side='left')
+                        hi = np.searchsorted(sorted_d2, r_outer * r_outer, side='right')
+                        idx = by_dist[lo:hi]
+                        if is_merger:
+                            idx = np.sort(idx)  # row order for the budget drain
+                    else:
+                        idx = np.nonzero((d2_all >= r_inner * r_inner) & (d2_all <= r_outer * r_outer))[0]
+                    dx, dy, dist_sq = dx_all[idx], dy_all[idx], d2_all[idx]
+                if not len(idx):
+                    continue
+                distance = np.sqrt(dist_sq)
+                ripple = np.abs(distance - r)
+                band = (ripple < ew) & (distance > 0)
+                idx, dx, dy, distance, ripple = idx[band], dx[band], dy[band], distance[band], ripple[band]
+                if is_merger:
+                    entity_mass_scale = mass_scale[k] * BLACK_HOLE_PULSE_ENTITY_FACTOR
+                    force = (NEUTRON_STAR_PULSE_STRENGTH * 3 * (1.0 - ripple / ew) * entity_mass_scale
+                             / ((ripple + 1) ** 1.5))
+                    # Shared energy budget, drained in row order (prefix sum = sequential drain).
+                    spent = force * delta_time * 0.01
+                    budget_before = self.budget[k] - (np.cumsum(spent) - spent)
+                    paid = budget_before > 0
+                    idx, dx, dy, distance, force = idx[paid], dx[paid], dy[paid], distance[paid], force[paid]
+                    self.budget[k] -= float(spent[paid].sum())
+                else:
+                    force = strength[k] * (1.0 - ripple / ew) / ((ripple + 1) ** 0.8)
+                if not len(idx):
+                    continue
+                push = force * delta_time
+                VX[idx] += (dx / distance) * push
+                VY[idx] += (dy / distance) * push
+                # Compression in the wavefront triggers star formation (see _triggered_mergers).
+                SHOCK[idx] = SHOCK_DURATION
+                shocked = True
+        return shocked
+
+    def _push_compact(self, universe, merger, strength, mass_scale, delta_time):
+        for k in range(self.n):
+            x, y, r = float(self.ox[k]), float(self.oy[k]), float(self.radius[k])
+            if merger[k]:
+                energy_budget = float(self.budget[k])
+                entity_mass_scale = mass_scale[k] * BLACK_HOLE_PULSE_ENTITY_FACTOR
+                for black_hole in universe.black_holes:
+                    if energy_budget <= 0:
+                        break
+                    dx = black_hole.x - x
+                    dy = black_hole.y - y
+                    distance = math.hypot(dx, dy)
+                    ripple_dist = abs(distance - r)
+                    if ripple_dist < NEUTRON_STAR_RIPPLE_EFFECT_WIDTH * 4:
+                        effect_factor = 1.0 - (ripple_dist / (NEUTRON_STAR_RIPPLE_EFFECT_WIDTH * 4))
+                        force = NEUTRON_STAR_PULSE_STRENGTH * 2 * effect_factor * entity_mass_scale / ((ripple_dist + 1) ** 2)
+                        if distance > 0:
+                            black_hole.vx += (dx / distance) * force * delta_time
+                            black_hole.vy += (dy / distance) * force * delta_time
+                            energy_budget -= force * delta_time * 0.01
+                for neutron_star in (*universe.neutron_stars, *universe.magnetars):
+                    if energy_budget <= 0:
+                        break
+                    dx = neutron_star.x - x
+                    dy = neutron_star.y - y
+                    distance = math.hypot(dx, dy)
+                    ripple_dist = abs(distance - r)
+                    if ripple_dist < NEUTRON_STAR_RIPPLE_EFFECT_WIDTH * 3:
+                        effect_factor = 1.0 - (ripple_dist / (NEUTRON_STAR_RIPPLE_EFFECT_WIDTH * 3))
+                        force = NEUTRON_STAR_PULSE_STRENGTH * 2.5 * effect_factor * entity_mass_scale / ((ripple_dist + 1) ** 1.8)
+                        if distance > 0:
+                            neutron_star.vx += (dx / distance) * force * delta_time
+                            neutron_star.vy += (dy / distance) * force * delta_time
+                            energy_budget -= force * delta_time * 0.01
+                self.budget[k] = max(0, energy_budget)
+            else:
+                for black_hole in universe.black_holes:
+                    dx = black_hole.x - x
+                    dy = black_hole.y - y
+                    distance = math.hypot(dx, dy)
+                    ripple_dist = abs(distance - r)
+                    if ripple_dist < NEUTRON_STAR_RIPPLE_EFFECT_WIDTH:
+                        effect_factor = (1.0 - (ripple_dist / NEUTRON_STAR_RIPPLE_EFFECT_WIDTH)) * 0.3
+                        force = strength[k] * effect_factor / ((ripple_dist + 1) ** 1.2)
+                        if distance > 0:
+                            black_hole.vx += (dx / distance) * force * delta_time * 0.2
+                            black_hole.vy += (dy / distance) * force * delta_time * 0.2
+
+    def _ripple_barrier(self, ring, merger, mass_scale, delta_time):
+        """Flash and push the vertices each wavefront is crossing — all rings in one pass."""
+        n = self.n
+        r = self.radius[:n]
+        bx = ring.radii * ring.cos_a  # origins are in the ring's frame (centered on it)
+        by = ring.radii * ring.sin_a
+        dist = np.hypot(bx[None, :] - self.ox[:n, None], by[None, :] - self.oy[:n, None])
+        width = np.where(merger, NEUTRON_STAR_RIPPLE_EFFECT_WIDTH * 4, NEUTRON_STAR_RIPPLE_EFFECT_WIDTH * 2)
+        hit = np.abs(dist - r[:, None]) < width[:, None]
+        if not hit.any():
+            return
+        # Merger rings fade across the whole universe; pulsar rings only over the last quarter.
+        fade_start = ring.rest_radius * 0.75
+        fade = np.where(merger, np.maximum(0.0, 1.0 - r / ring.rest_radius),
+                        np.maximum(0.0, 1.0 - np.maximum(0.0, r - fade_start) / (ring.rest_radius * 0.25)))
+        flash = np.where(merger, fade * 0.9, fade * 0.4)
+        push = np.where(merger, BARRIER_WAVE_PUSH * 2.0 * mass_scale * fade,
+                        BARRIER_WAVE_PUSH * 0.3 * fade) * delta_time
+        np.maximum(ring.flash, np.where(hit, flash[:, None], 0.0).max(axis=0), out=ring.flash)
+        ring.radii_vel += np.where(hit, push[:, None], 0.0).sum(axis=0)
@@ -12,6 +12,8 @@ import pygame
 
 from sim.config import *
 from sim.rng import MAX as RNG_MAX
+from sim import events
+from sim import profiler as P
 
 RNG_DIGITS = len(str(RNG_MAX))  # HUD cell width follows the actual output range
 
@@ -34,8 +36,9 @@ def interpolate_color(start_color, end_color, factor):
 # ── Barrier ─────────────────────────────────────────────────────────────────────────────────
 
 def draw_barrier(screen, barrier, offset_x=0, offset_y=0):
-    cx = barrier.center[0] + offset_x
-    cy = barrier.center[1] + offset_y
+    # The ring is drawn in its own frame: (offset_x, offset_y) is where its center lands.
+    cx = offset_x
+    cy = offset_y
     half_w = BARRIER_SMOOTHING_WINDOW // 2
     smoothed = barrier.radii.astype(float)
     for _ in range(BARRIER_SMOOTHING_PASSES):
@@ -209,15 +212,17 @@ def draw_clouds(screen, clouds, offset_x=0, offset_y=0):
             pygame.draw.circle(screen, CIVILIZATION_DISC_COLOR, (cx, cy), disc_radius)
 
     # Wolf-Rayet shells: enriched top-band stars shedding their envelope as a continuously
-    # expanding ring — stateless (wall clock + row phase), fading as it grows, then wrapping:
+    # expanding ring — stateless (wall clock + cloud phase), fading as it grows, then wrapping:
     # perpetual shedding. Foreshadowing, not physics. Only a stable 1-in-N subset renders the
-    # shell (see config): the tag hashes the star's own sprite offsets, which are random at
-    # spawn and travel with the row through every compaction — so it's the SAME stars shelled
-    # frame to frame, unlike a row-index hash, which would reshuffle on every keep()/select().
+    # shell (see config): the tag hashes the star's cloud id, which travels with the row through
+    # every compaction — so it's the SAME stars shelled frame to frame, unlike a row-index
+    # hash, which would reshuffle on every keep()/select(). (Multiplicative hash: ids are
+    # sequential, and a plain modulus would pick every Nth cloud of each ejecta burst.)
     wr_mask = (is_star & (clouds.M >= WOLF_RAYET_MASS)
                & (clouds.ELEM >= STAR_ENRICHED_ELEMENT_MIN) & (clouds.GIANT <= 0.0))
+    cloud_id = clouds.ID
     if wr_mask.any():
-        tag = (np.abs(clouds.offsets[:n, :, 0]).sum(axis=1) * 1e4).astype(np.int64)
+        tag = (cloud_id * 2654435761) & 0xFFFFFFFF
         wr_mask &= (tag % WOLF_RAYET_FRACTION) == 0
     wr_idx = np.nonzero(wr_mask)[0]
     if len(wr_idx):
@@ -225,7 +230,7 @@ def draw_clouds(screen, clouds, offset_x=0, offset_y=0):
         for k in wr_idx:
             cx = int(px[k] + size[k] * 0.5)
             cy = int(py[k] + size[k] * 0.5)
-            frac = ((t * WOLF_RAYET_SHED_SPEED + int(k) * 1.7) % WOLF_RAYET_SHELL_RANGE) / WOLF_RAYET_SHELL_RANGE
+            frac = ((t * WOLF_RAYET_SHED_SPEED + int(cloud_id[k]) * 1.7) % WOLF_RAYET_SHELL_RANGE) / WOLF_RAYET_SHELL_RANGE
             r = int(size[k] * 0.5) + 2 + int(frac * WOLF_RAYET_SHELL_RANGE)
             alpha = int(200 * (1.0 - frac))
             if alpha <= 0:
@@ -241,9 +246,10 @@ def _clip_pulse_points(origin_x, origin_y, pulse_radius, ring, num_pts=PULSE_REN
     """Ring polygon clipped against the barrier only. Waves superpose: rings pass through
     each other unchanged (gravitational waves are linear — interference adds, it never
     deflects a wavefront), so there is no ring-vs-ring pass. That pass was also the frame
-    cost that scaled quadratically with ring count once pulse trains made storms dense."""
-    cx = ring.center[0] + offset_x
-    cy = ring.center[1] + offset_y
+    cost that scaled quadratically with ring count once pulse trains made storms dense.
+    (offset_x, offset_y) is the ring's center on screen (draw_universe's frame offset)."""
+    cx = offset_x
+    cy = offset_y
     theta = (2 * math.pi / num_pts) * np.arange(num_pts)
     px = origin_x + pulse_radius * np.cos(theta)
     py = origin_y + pulse_radius * np.sin(theta)
@@ -314,10 +320,10 @@ def draw_black_hole(screen, bh, offset_x=0, offset_y=0):
     pygame.draw.circle(screen, BLACK_HOLE_DISK_COLOR, (int(tracer_x), int(tracer_y)), BLACK_HOLE_DISK_SIZE)
 
 
-def draw_white_dwarf(screen, wd, offset_x=0, offset_y=0):
+def draw_white_dwarf(screen, wd, now, offset_x=0, offset_y=0):
     # A white dwarf only cools: white-hot → dim ember → gone (the color runs toward the
     # background so a fully cooled black dwarf literally disappears into space).
-    t = wd.cooling()
+    t = wd.cooling(now)
     if t < 0.7:
         color = interpolate_color(WHITE_DWARF_COLOR, WHITE_DWARF_COOL_COLOR, t / 0.7)
     else:
@@ -332,7 +338,7 @@ def _crowd_dim(all_pulses):
 
 
 def draw_neutron_star(screen, ns, ring, all_pulses, offset_x=0, offset_y=0,
-                      pulse_layer=None, layer_x=0, layer_y=0):
+                      pulse_layer=None, layer_x=0, layer_y=0, pulse_radii=()):
     draw_x = int(ns.x + offset_x)
     draw_y = int(ns.y + offset_y)
     pulse_ox = ns.x + offset_x
@@ -363,7 +369,7 @@ def draw_neutron_star(screen, ns, ring, all_pulses, offset_x=0, offset_y=0,
     base_alpha = NEUTRON_STAR_PULSE_COLOR[3] * _crowd_dim(all_pulses)
     if base_alpha < 1:
         return
-    for pulse_radius in ns.active_pulses:
+    for pulse_radius in pulse_radii:
         if pulse_radius <= 1:
             continue
         # Dissipation: alpha ramps to zero over the last 30% of the ripple's range, so the
@@ -396,16 +402,22 @@ def draw_magnetar(screen, mag, offset_x=0, offset_y=0):
 
 def draw_universe(screen, universe, offset_x=0, offset_y=0, show_barrier=True, show_gravity_waves=True):
     ring = universe.barrier
+    # Everything in a universe is stored relative to its ring's center (see Universe), so the
+    # universe's frame lands on screen at offset + center.
+    offset_x += ring.center[0]
+    offset_y += ring.center[1]
     if show_barrier:
         draw_barrier(screen, ring, offset_x, offset_y)
     draw_clouds(screen, universe.clouds, offset_x, offset_y)
 
+    pulsar_rings = universe.pulses.pulsar_rings()
+    merger_rings = universe.pulses.mergers()
     all_pulses = []
     for ns in universe.neutron_stars:
-        for pulse_radius in ns.active_pulses:
+        for pulse_radius in pulsar_rings.get(id(ns), ()):
             all_pulses.append((ns.x + offset_x, ns.y + offset_y, pulse_radius))
-    for pulse in universe.black_hole_pulses:
-        all_pulses.append((pulse[0] + offset_x, pulse[1] + offset_y, pulse[2]))
+    for x, y, pulse_radius, _ in merger_rings:
+        all_pulses.append((x + offset_x, y + offset_y, pulse_radius))
 
     # All wave rings paint one shared per-universe alpha layer (blitted once at the end)
     # instead of allocating a surface per ring — the per-ring churn was the top render cost
@@ -415,12 +427,11 @@ def draw_universe(screen, universe, offset_x=0, offset_y=0, show_barrier=True, s
     layer_x = layer_y = 0
     if show_gravity_waves and all_pulses:
         reach = float(ring.radii.max()) + PULSE_RENDER_MARGIN
-        layer_x = int(ring.center[0] + offset_x - reach)
-        layer_y = int(ring.center[1] + offset_y - reach)
+        layer_x = int(offset_x - reach)
+        layer_y = int(offset_y - reach)
         side = int(2 * reach) + 2
         pulse_layer = pygame.Surface((side, side), pygame.SRCALPHA)
-        for pulse in universe.black_hole_pulses:
-            x, y, pulse_radius, consumed_mass = pulse
+        for x, y, pulse_radius, consumed_mass in merger_rings:
             if pulse_radius > 1:
                 pulse_width = max(2, int(consumed_mass / 20))
                 points = _clip_pulse_points(x + offset_x, y + offset_y, pulse_radius, ring, offset_x=offset_x, offset_y=offset_y)
@@ -430,12 +441,12 @@ def draw_universe(screen, universe, offset_x=0, offset_y=0, show_barrier=True, s
                 pygame.draw.polygon(pulse_layer, merge_color, local_points, pulse_width)
 
     for white_dwarf in universe.white_dwarfs:
-        draw_white_dwarf(screen, white_dwarf, offset_x, offset_y)
+        draw_white_dwarf(screen, white_dwarf, universe.timers.clock, offset_x, offset_y)
     for black_hole in universe.black_holes:
         draw_black_hole(screen, black_hole, offset_x, offset_y)
     for neutron_star in universe.neutron_stars:
         draw_neutron_star(screen, neutron_star, ring, all_pulses, offset_x, offset_y,
-                          pulse_layer, layer_x, layer_y)
+                          pulse_layer, layer_x, layer_y, pulsar_rings.get(id(neutron_star), ()))
     for magnetar in universe.magnetars:
         draw_magnetar(screen, magnetar, offset_x, offset_y)
 
@@ -484,13 +495,17 @@ class WorldRenderer:
         # invisible noise that still costs full-size clipping and polygons on the world
         # surface. Skip them; everything else still draws.
         draw_waves = show_gravity_waves and zoom >= PULSE_LOD_MIN_ZOOM
+        # Cull universes entirely outside the view — off-screen universes cost nothing. One
+        # bounding-box test over the whole barrier bank, read per universe by its row.
+        bank = state.barriers
+        centers = bank.centers[:bank.n]
+        reach = bank.max_radii() + UNIVERSE_CULL_MARGIN
+        bcx = centers[:, 0] + wox
+        bcy = centers[:, 1] + woy
+        visible = ((bcx + reach >= view_left) & (bcx - reach <= view_left + view_w)
+                   & (bcy + reach >= view_top) & (bcy - reach <= view_top + view_h))
         for universe in state.universes:
-            # Cull universes entirely outside the view — off-screen universes cost nothing.
-            bcx = universe.barrier.center[0] + wox
-            bcy = universe.barrier.center[1] + woy
-            reach = float(universe.barrier.radii.max()) + UNIVERSE_CULL_MARGIN
-            if (bcx + reach < view_left or bcx - reach > view_left + view_w or
-                    bcy + reach < view_top or bcy - reach > view_top + view_h):
+            if not visible[universe.barrier.row]:
                 continue
             draw_universe(self.world_surface, universe, wox, woy, show_barrier, draw_waves)
 
@@ -587,31 +602,36 @@ def draw_stats(screen, fps, current_year, universe_count, entity_count, rng_numb
 
 # ── Event ticker (readout row of the stats table) ───────────────────────────────────────────
 
-def _ticker_layout(screen):
-    """Panel geometry for draw_ticker: spans from UI_TICKER_TOP_MARGIN down to the stats row,
-    so the number of lines that fit follows the window height."""
+def _ticker_layout(screen, below=0):
+    """Panel geometry for draw_ticker: spans from UI_TICKER_TOP_MARGIN under `below` down to
+    the stats row, so the number of lines that fit follows the window height."""
     font, rng_font = _get_stats_fonts()
     stats_row_h = rng_font.get_height() + 2 * UI_STATS_CELL_PAD_Y
     stats_row_top = screen.get_height() - UI_STATS_BOTTOM_MARGIN - stats_row_h
     line_h = font.get_height() + 2
-    panel_top = UI_TICKER_TOP_MARGIN
+    panel_top = below + UI_TICKER_TOP_MARGIN
     panel_h = max(line_h, stats_row_top - panel_top)
     max_lines = max(1, (panel_h - 2 * UI_STATS_CELL_PAD_Y) // line_h)
     return line_h, stats_row_top, max_lines, UI_LABEL_X
 
 
-def draw_ticker(screen, ticker):
+def draw_ticker(screen, ticker, below=0):
     """Event readout panel: a live feed of the most recent events, newest at the bottom,
     fading out with age — once an entry fades it's gone for good, no scrollback. Each entry is
-    a [text, age, count] triple maintained by the sim loop; repeats within a beat are coalesced
-    there, so a line appears once no matter how many identical events fired (the count is
-    tracked but not displayed)."""
+    a [record, age, count, text] list maintained by the sim loop; repeats within a beat are
+    coalesced there, so a line appears once no matter how many identical events fired (the
+    count is tracked but not displayed). The text slot is filled here, the first time the
+    entry is actually drawn (sim.events.text). `below` is the y the panel starts under — the
+    perf overlay's bottom edge while [P] is up, so the two never overlap."""
     font, rng_font = _get_stats_fonts()
-    line_h, stats_row_top, max_lines, table_left = _ticker_layout(screen)
+    line_h, stats_row_top, max_lines, table_left = _ticker_layout(screen, below)
     lines = [e for e in ticker if e[1] < UI_TICKER_LIFETIME][-max_lines:]
 
     y = stats_row_top - UI_STATS_CELL_PAD_Y - line_h * len(lines)  # stack anchored to the bottom
-    for text, age, count in lines:
+    for entry in lines:
+        if entry[3] is None:
+            entry[3] = events.text(entry[0])
+        _record, age, count, text = entry
         fade = max(0.0, 1.0 - age / UI_TICKER_LIFETIME)
         color = interpolate_color(BACKGROUND_COLOR, UI_STATS_COLOR, fade)
         screen.blit(font.render(text, True, color), (table_left + UI_STATS_CELL_PAD_X, y))
@@ -681,6 +701,7 @@ _HOTKEY_ROWS = [
     ("L", "Toggle event log"),
     ("B", "Toggle universe barriers"),
     ("G", "Toggle gravitational waves"),
+    ("P", "Toggle performance overlay"),
     ("SCROLL", "Zoom in and out"),
     ("CLICK", "Copy RNG output"),
 ]
@@ -856,3 +877,147 @@ def draw_hotkeys(screen, alpha):
         y += entity_row_h
 
     screen.blit(panel, (screen.get_width() - panel_w - UI_HOTKEYS_MARGIN, UI_HOTKEYS_MARGIN))
+
+
+# ── Performance overlay (top-left corner, toggled with [P]) ─────────────────────────────────
+
+# Stacked-bar segments after the per-universe physics steps: (label, multiverse-level profiler
+# phases summed into it, color). Phases a universe's step records inside itself (gravity,
+# collisions, ...) are already part of that step's span and are not counted again.
+_PERF_SEGMENTS = [
+    ("multiverse", (P.BARRIER, P.MULTIVERSE), UI_PERF_MULTIVERSE_COLOR),
+    ("render", (P.RENDER,), UI_PERF_RENDER_COLOR),
+    ("hud", (P.EVENTS, P.HUD), UI_PERF_HUD_COLOR),
+    ("entropy", (P.ENTROPY, P.RNG), UI_PERF_ENTROPY_COLOR),
+]
+
+
+def _perf_segments(frame):
+    """One profiled frame as stacked-bar segments, [(label, ms, color)], in two lists: each
+    universe's physics step (heaviest first), and the multiverse-level phases followed by
+    whatever the frame spent outside every span."""
+    steps = {}
+    top = {}
+    for phase, uid, t0, t1, _clouds in frame.spans:
+        if uid == 0:
+            top[phase] = top.get(phase, 0.0) + (t1 - t0)
+        elif phase == P.STEP:
+            steps[uid] = steps.get(uid, 0.0) + (t1 - t0)
+    universes = [(f"U{uid}", dt * 1e3, UI_PERF_UNIVERSE_COLORS[uid % len(UI_PERF_UNIVERSE_COLORS)])
+                 for uid, dt in sorted(steps.items(), key=lambda kv: -kv[1])]
+    phases = [(label, sum(top.get(p, 0.0) for p in group) * 1e3, color)
+              for label, group, color in _PERF_SEGMENTS]
+    spent = sum(ms for _label, ms, _color in universes + phases)
+    phases.append(("other", max(0.0, frame.duration * 1e3 - spent), UI_PERF_OTHER_COLOR))
+    return universes, phases
+
+
+def _gauge_rows(clouds, tree_usage, alloc_rate):
+    """(label, fill fraction or None, value text) for each gauge; None draws an empty track
+    (e.g. the tree gauge while gravity runs on the GPU, which builds no tree)."""
+    nodes, pool = tree_usage
+    return [
+        ("clouds", clouds / MULTIVERSE_MAX_CLOUDS, f"{clouds:,} / {MULTIVERSE_MAX_CLOUDS:,}"),
+        ("tree nodes", nodes / pool if pool else None,
+         f"{nodes:,} / {pool:,}" if pool else "no tree this frame"),
+        ("scratch alloc", alloc_rate / UI_PERF_ALLOC_FULL_SCALE,
+         f"{alloc_rate / (1024 * 1024):.1f} MB/s"),
+    ]
+
+
+def draw_perf(screen, frames, clouds, tree_usage, alloc_rate):
+    """Performance overlay, one translucent panel in the top-left corner, read from the frame
+    profiler's ring (`frames`, oldest first):
+      - a sparkline of the last UI_PERF_SPARK_FRAMES frame times against the 1/TARGET_FPS
+        budget line;
+      - the last frame as a stacked bar — each universe's physics step, then the multiverse
+        passes, render, HUD and entropy — scaled so the budget spans the bar (an over-budget
+        frame fills it and pushes the budget tick left);
+      - gauges for total clouds vs MULTIVERSE_MAX_CLOUDS, Barnes-Hut tree nodes built vs the
+        node pool allocated for them (`tree_usage`, summed over this frame's trees), and the
+        physics scratch arena's allocation rate (`alloc_rate`, bytes/second).
+    Returns the panel's bottom edge, which draw_ticker starts under."""
+    font = _get_hotkeys_font()
+    line_h = font.get_height()
+    row_h = line_h + UI_HOTKEYS_ROW_SPACING
+    budget_ms = 1000.0 / TARGET_FPS
+    recent = list(frames)[-UI_PERF_SPARK_FRAMES:]
+    times = [f.duration * 1e3 for f in recent]
+
+    if times:
+        header = f"FRAME {times[-1]:5.1f} ms   avg {sum(times) / len(times):.1f}   max {max(times):.1f}"
+        universes, phases = _perf_segments(recent[-1])
+        segments = universes + phases
+        physics = (f"physics {sum(ms for _l, ms, _c in universes):.1f} ms over {len(universes)} "
+                   f"universe{'' if len(universes) == 1 else 's'}")
+        if universes:
+            physics += f"   (heaviest {universes[0][0]} {universes[0][1]:.1f})"
+        legend = [physics, "   ".join(f"{label} {ms:.1f}" for label, ms, _c in phases)]
+    else:
+        header = "FRAME -- ms   (collecting)"
+        segments = []
+        legend = []
+    text_rows = [font.render(header, True, UI_HOTKEYS_KEY_COLOR)]
+    legend_surfs = [font.render(text, True, UI_HOTKEYS_TEXT_COLOR) for text in legend]
+    gauges = [(font.render(label, True, UI_HOTKEYS_TEXT_COLOR), frac,
+               font.render(value, True, UI_HOTKEYS_KEY_COLOR))
+              for label, frac, value in _gauge_rows(clouds, tree_usage, alloc_rate)]
+
+    inner_w = max([UI_PERF_WIDTH] + [s.get_width() for s in text_rows + legend_surfs]
+                  + [l.get_width() + UI_HOTKEYS_KEY_GAP + v.get_width() for l, _f, v in gauges])
+    gauge_h = line_h + 2 + UI_PERF_GAUGE_HEIGHT + UI_HOTKEYS_ROW_SPACING
+    panel_h = (2 * UI_HOTKEYS_PAD + row_h + UI_PERF_SPARK_HEIGHT + UI_HOTKEYS_ROW_SPACING
+               + UI_PERF_BAR_HEIGHT + UI_HOTKEYS_ROW_SPACING + len(legend_surfs) * row_h
+               + row_h // 2 + len(gauges) * gauge_h)
+    panel = pygame.Surface((inner_w + 2 * UI_HOTKEYS_PAD, panel_h), pygame.SRCALPHA)
+    panel.fill(UI_HOTKEYS_BG)
+    left = UI_HOTKEYS_PAD
+    y = UI_HOTKEYS_PAD
+    panel.blit(text_rows[0], (left, y))
+    y += row_h
+
+    # Sparkline: newest frame at the right edge, the budget drawn as a flat line.
+    top_ms = max(2.0 * budget_ms, max(times, default=0.0))
+    spark_bottom = y + UI_PERF_SPARK_HEIGHT - 1
+    budget_y = spark_bottom - int(budget_ms / top_ms * (UI_PERF_SPARK_HEIGHT - 1))
+    pygame.draw.line(panel, UI_PERF_BUDGET_COLOR, (left, budget_y), (left + inner_w - 1, budget_y))
+    if len(times) >= 2:
+        step = (inner_w - 1) / (UI_PERF_SPARK_FRAMES - 1)
+        x0 = left + inner_w - 1 - step * (len(times) - 1)
+        points = [(x0 + i * step, spark_bottom - ms / top_ms * (UI_PERF_SPARK_HEIGHT - 1))
+                  for i, ms in enumerate(times)]
+        pygame.draw.lines(panel, UI_PERF_SPARK_COLOR, False, points)
+    y += UI_PERF_SPARK_HEIGHT + UI_HOTKEYS_ROW_SPACING
+
+    # Stacked bar of the last frame's phases.
+    pygame.draw.rect(panel, UI_PERF_OTHER_COLOR, (left, y, inner_w, UI_PERF_BAR_HEIGHT), 1)
+    if segments:
+        scale = inner_w / max(budget_ms, times[-1])
+        x = float(left)
+        for _label, ms, color in segments:
+            w = ms * scale
+            if w >= 1.0:
+                pygame.draw.rect(panel, color, (round(x), y, max(1, round(x + w) - round(x)), UI_PERF_BAR_HEIGHT))
+            x += w
+        tick_x = left + min(inner_w - 1, int(budget_ms * scale))
+        pygame.draw.line(panel, UI_PERF_BUDGET_COLOR, (tick_x, y - 2), (tick_x, y + UI_PERF_BAR_HEIGHT + 1))
+    y += UI_PERF_BAR_HEIGHT + UI_HOTKEYS_ROW_SPACING
+    for surf in legend_surfs:
+        panel.blit(surf, (left, y))
+        y += row_h
+
+    y += row_h // 2
+    for label_surf, frac, value_surf in gauges:
+        panel.blit(label_surf, (left, y))
+        panel.blit(value_surf, (left + inner_w - value_surf.get_width(), y))
+        bar_y = y + line_h + 2
+        pygame.draw.rect(panel, UI_PERF_OTHER_COLOR, (left, bar_y, inner_w, UI_PERF_GAUGE_HEIGHT))
+        if frac is not None and frac > 0:
+            frac = min(1.0, frac)
+            color = interpolate_color(UI_PERF_GAUGE_COLOR, UI_PERF_GAUGE_HOT_COLOR,
+                                      max(0.0, (frac - 0.7) / 0.3))
+            pygame.draw.rect(panel, color, (left, bar_y, max(1, int(inner_w * frac)), UI_PERF_GAUGE_HEIGHT))
+        y += gauge_h
+
+    screen.blit(panel, (UI_LABEL_X, UI_TICKER_TOP_MARGIN))
+    return UI_TICKER_TOP_MARGIN + panel_h
@@ -43,7 +43,7 @@ import numpy as np
 MIN = 10 ** 41              # Lower bound of RNG output range (42-digit minimum)
 MAX = 10 ** 42 - 1          # Upper bound of RNG output range (42-digit maximum)
 
-SERIALIZE_VERSION = 5
+SERIALIZE_VERSION = 6
 _HKDF_INFO = b'simcraft-rng-v1'       # domain separation for output derivation
 _POOL_PERSON = b'simcraft-pool-v1'    # blake2b personalization (16-byte max)
 _HEADER = struct.Struct('<B7I')       # version, n_universes, mc, bh, ns, mag, wd, barrier_pts
@@ -66,10 +66,12 @@ def serialize_state(state_obj):
       clouds    — (n, 5) float64 [x, y, vx, vy, mass] + (n,) int64 element indices
       holes     — per hole '<7d' x, y, vx, vy, mass, angular_momentum, accretion_mass
       stars     — per star '<6d' x, y, vx, vy, mass, time_since_last_pulse
-      magnetars — per magnetar '<7d' x, y, vx, vy, mass, field_time, color_phase
+      magnetars — per magnetar '<7d' x, y, vx, vy, mass, field time left, color_phase
       dwarfs    — per white dwarf '<6d' x, y, vx, vy, mass, age (v5 — WDs gravitate,
                   detonate, and get eaten like any compact object, so they belong here)
       barrier   — '<2d' center + (num_points,) float64 radii + radii velocities
+    Every x, y above is local to its universe's barrier center (v6), which is the only
+    multiverse position in the record.
 
     The cloud field serializes straight from the SoA arrays (no per-row packing), and the
     barrier membrane state is included: its deformation integrates every gravitational event
@@ -110,9 +112,9 @@ def serialize_state(state_obj):
                                      e.time_since_last_pulse))
         for e in u.magnetars:
             parts.append(struct.pack('<7d', e.x, e.y, e.vx, e.vy, e.mass,
-                                     e.field_time, e.color_phase))
+                                     e.field_ends - u.timers.clock, e.color_phase))
         for e in u.white_dwarfs:
-            parts.append(struct.pack('<6d', e.x, e.y, e.vx, e.vy, e.mass, e.age))
+            parts.append(struct.pack('<6d', e.x, e.y, e.vx, e.vy, e.mass, u.timers.clock - e.born))
         b = u.barrier
         parts.append(struct.pack('<2d', b.center[0], b.center[1]))
         parts.append(b.radii.astype('<f8', copy=False).tobytes())
@@ -171,7 +173,7 @@ class EntropyPool:
             parts.append(struct.pack('<6I3d',
                                      c.n, len(u.black_holes), len(u.neutron_stars),
                                      len(u.magnetars), len(u.white_dwarfs),
-                                     len(u.black_hole_pulses),
+                                     u.pulses.n,
                                      float(u.barrier.radii.sum()),
                                      float(u.barrier.radii_vel.sum()),
                                      float(c.M.sum()) if c.n else 0.0))
@@ -8,8 +8,12 @@ import pygame
 
 from sim.config import *
 from sim import physics
+from sim import gravity
 from sim import render
-from sim.render import WorldRenderer, draw_stats, draw_ticker, draw_elements, draw_hotkeys, hotkeys_alpha
+from sim import events
+from sim import profiler as P
+from sim.eventstream import EventStream
+from sim.render import WorldRenderer, draw_stats, draw_ticker, draw_elements, draw_hotkeys, hotkeys_alpha, draw_perf
 from sim.rng import generate, MIN as RNG_MIN, MAX as RNG_MAX
 
 
@@ -53,6 +57,7 @@ def handle_input(zoom, view_center_x, view_center_y, target_zoom, target_center_
     toggle_barrier = False
     toggle_hotkeys = False
     toggle_gravity_waves = False
+    toggle_perf = False
     reset_requested = False
     copy_rng = False
 
@@ -67,6 +72,8 @@ def handle_input(zoom, view_center_x, view_center_y, target_zoom, target_center_
             toggle_hotkeys = True
         if event.type == pygame.KEYDOWN and event.key == pygame.K_g:
             toggle_gravity_waves = True
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_p:
+            toggle_perf = True
         if event.type == pygame.KEYDOWN and event.key == pygame.K_r:
             reset_requested = True
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -85,11 +92,12 @@ def handle_input(zoom, view_center_x, view_center_y, target_zoom, target_center_
                 target_center_y = world_y
 
     return (running, target_zoom, target_center_x, target_center_y,
-            toggle_ticker, toggle_barrier, toggle_hotkeys, toggle_gravity_waves,
+            toggle_ticker, toggle_barrier, toggle_hotkeys, toggle_gravity_waves, toggle_perf,
             reset_requested, copy_rng)
 
 
 def run_simulation(screen, state):
+    stream = None
     try:
         running = True
         clock = pygame.time.Clock()
@@ -108,18 +116,23 @@ def run_simulation(screen, state):
         show_gravity_waves = True
         show_hotkeys = True
         hotkeys_age = 0.0  # seconds since last shown; drives the fade in hotkeys_alpha()
-        ticker = []  # [text, age, count] event lines, newest last; dropped once faded (no scrollback)
+        show_perf = False  # [P] performance overlay; profiles frames while it is up
+        alloc_rate = 0.0  # smoothed physics scratch allocation, bytes/second, for the overlay
+        ticker = []  # [record, age, count, text] event lines, newest last; dropped once faded (no scrollback)
+        stream = EventStream(EVENT_STREAM_PATH) if EVENT_STREAM_PATH else None
         rng_number = None
         rng_flash = 0.0  # copied-to-clipboard flash on the RNG cell, 1 → 0
 
+        prof = P.PROFILER
         while running:
+            prof.frame_begin()
             current_time = pygame.time.get_ticks()
             delta_time = (current_time - last_frame_time) / 1000.0
             delta_time = min(delta_time, MAX_DELTA_TIME)
             last_frame_time = current_time
 
             (running, target_zoom, target_center_x, target_center_y,
-             toggle_ticker, toggle_barrier, toggle_hotkeys, toggle_gravity_waves,
+             toggle_ticker, toggle_barrier, toggle_hotkeys, toggle_gravity_waves, toggle_perf,
              reset_requested, copy_rng) = handle_input(
                 zoom, view_center_x, view_center_y, target_zoom, target_center_x, target_center_y)
             if not running:
@@ -145,15 +158,23 @@ def run_simulation(screen, state):
                 show_hotkeys = not show_hotkeys
                 if show_hotkeys:
                     hotkeys_age = 0.0
+            if toggle_perf:
+                show_perf = not show_perf
+                prof.enable(show_perf or PROFILE_ENABLED)
             if copy_rng and rng_number is not None:
                 if copy_to_clipboard(str(rng_number)):
                     rng_flash = 1.0
 
+            t = prof.begin()
+            physics.update_barriers(state, delta_time)
+            prof.end(P.BARRIER, t)
             for universe in state.universes:
-                universe.barrier.update_deformation(universe, delta_time)
+                t = prof.begin()
                 physics.step(universe, universe.barrier, delta_time)
+                prof.end(P.STEP, t, universe)
 
             # Each black-hole birth this step opens a new universe (capped) outside the existing ones.
+            t = prof.begin()
             physics.process_universe_spawns(state)
             physics.enforce_total_cloud_cap(state)
 
@@ -167,25 +188,36 @@ def run_simulation(screen, state):
             # universe is never reaped, so multiverse heat death can linger/reset as before.
             physics.reap_dead_universes(state)
             physics.prune_child_links(state)
+            prof.end(P.MULTIVERSE, t)
 
             # Drain each universe's astrophysical events into the HUD ticker; identical
             # events landing within a beat coalesce into one line (shown without a count).
             # Entries are dropped once they've fully faded — no scrollback to preserve them for.
+            # Entries hold the raw record; draw_ticker formats a line the first time it is
+            # drawn, so a hidden ticker never builds a string.
+            t = prof.begin()
             for universe in state.universes:
-                for text in universe.event_log:
-                    if ticker and ticker[-1][0] == text and ticker[-1][1] < 1.0:
+                records = universe.event_log.drain()
+                if stream is not None:
+                    stream.consume(universe, records, current_year)
+                for record in records:
+                    if ticker and ticker[-1][1] < 1.0 and events.key(ticker[-1][0]) == events.key(record):
                         ticker[-1][2] += 1
                     else:
-                        ticker.append([text, 0.0, 1])
-                universe.event_log.clear()
+                        ticker.append([record, 0.0, 1, None])
+            if stream is not None:
+                stream.end_frame()
             for entry in ticker:
                 entry[1] += delta_time
             ticker = [e for e in ticker if e[1] < UI_TICKER_LIFETIME]
             rng_flash = max(0.0, rng_flash - 2.0 * delta_time)
+            prof.end(P.EVENTS, t)
 
             # Fold this frame's trajectory into the entropy pool: OS timing jitter plus
             # chaotic observables (full state every FULL_FOLD_INTERVAL frames).
+            t = prof.begin()
             state.entropy_pool.fold_frame(state, current_time, clock.get_rawtime())
+            prof.end(P.ENTROPY, t)
 
             # Heat death of the whole multiverse (every universe gone) lingers for
             # HEAT_DEATH_LINGER_DURATION before resetting, so the empty scene isn't a
@@ -202,23 +234,41 @@ def run_simulation(screen, state):
                 state = physics.initialize_state()
                 state.entropy_pool = entropy_pool  # the pool remembers past universes
                 current_year = 0.0
+                if stream is not None:
+                    stream.mark_run()
                 zoom = target_zoom = 1.0
                 view_center_x = target_center_x = SCREEN_WIDTH / 2.0
                 view_center_y = target_center_y = SCREEN_HEIGHT / 2.0
                 heat_death_timer = 0.0
 
+            t = prof.begin()
             renderer.render(screen, state, zoom, view_center_x, view_center_y, show_barrier, show_gravity_waves)
+            prof.end(P.RENDER, t)
 
             # Fresh RNG output every frame, drawn from the running entropy pool
             # (which folds the live state continuously — no full re-serialize here).
+            t = prof.begin()
             try:
                 rng_number = generate(state.entropy_pool, RNG_MIN, RNG_MAX)['random_number']
             except Exception as rng_err:
                 print(f"HUD RNG failed: {rng_err}")
                 rng_number = None
-
+            prof.end(P.RNG, t)
+
+            t = prof.begin()
+            # Performance overlay (top left): the profiler's recent frames plus live gauges.
+            # Tree usage is taken every frame so it only ever covers this frame's trees. Drawn
+            # first so the ticker can start below it instead of underneath it.
+            tree_usage = gravity.take_tree_usage()
+            perf_bottom = 0
+            if show_perf:
+                frame_alloc = sum(u.step_alloc_bytes for u in state.universes)
+                wall = max(clock.get_time(), 1) / 1000.0  # last frame's real length, sleep included
+                alloc_rate += (frame_alloc / wall - alloc_rate) * (1.0 - math.exp(-wall / UI_PERF_ALLOC_SMOOTH_SECONDS))
+                perf_bottom = draw_perf(screen, prof.frames, sum(u.clouds.n for u in state.universes),
+                                        tree_usage, alloc_rate)
             if show_ticker:
-                draw_ticker(screen, ticker)
+                draw_ticker(screen, ticker, perf_bottom)
             draw_stats(screen, clock.get_fps(), current_year, len(state.universes),
                        state.entity_count(), rng_number,
                        state.mean_metallicity(), rng_flash)
@@ -233,6 +283,7 @@ def run_simulation(screen, state):
                 else:
                     draw_hotkeys(screen, alpha)
                     draw_elements(screen, state.present_elements(), alpha)
+            prof.end(P.HUD, t)
 
             # Log-time cosmic clock: dy = ln10/decade * (y + 1000) dt integrates to a fixed
             # wall-time per factor-of-10 of years (see COSMIC_DECADE_SECONDS in config). That
@@ -244,6 +295,7 @@ def run_simulation(screen, state):
             current_year += delta_time * year_rate
 
             pygame.display.flip()
+            prof.frame_end()  # work time: the frame-cap sleep below is not the sim's cost
             clock.tick(TARGET_FPS)
 
         print("Exited simulation")
@@ -260,10 +312,22 @@ def run_simulation(screen, state):
         print(f"Error occurred in simulation loop: {e}")
         traceback.print_exc()
     finally:
+        prof = P.PROFILER
+        prof.close()
+        if PROFILE_ENABLED and prof.frames and PROFILE_TRACE_PATH:
+            prof.write_chrome_trace(PROFILE_TRACE_PATH)
+            print(f"Frame profile written to {PROFILE_TRACE_PATH}")
+        if stream is not None:
+            stream.close()
+            if stream.dropped_batches:
+                print(f"Event stream dropped {stream.dropped_batches} frame(s) of records")
+            if stream.write_errors:
+                print(f"Event stream: {stream.write_errors} write(s) failed, last: {stream.last_error}")
         pygame.quit()
 
 
 def main():
+    gravity.start_gpu_init()  # Taichi init here, kernel compile in the background (sim.gravity)
     pygame.init()
     pygame.display.set_caption("A long time ago in a universe far, far away...")
     # RESIZABLE puts the maximize button in the title bar. Rendering happens at the window's
@@ -0,0 +1,69 @@
+"""Physics randomness: one seedable service behind the Python, numpy and compiled rolls.
+
+Runs are unrepeatable by design (see gravity.py): by default the root of every stream is OS
+entropy. Everything derives from ONE root SeedSequence, though, so setting PHYSICS_SEED (or
+calling seed() before the state is built) turns a run bit-comparable on the same machine and
+build — the mode for performance A/B benchmarks, not a promise of reproducibility across
+backends or platforms.
+
+  - each Universe owns a UniverseRNG: a Philox Generator for its vectorized per-row rolls,
+    plus per-thread Philox bit generators the Cython kernels draw from directly through
+    numpy's C bit-generator API (bitgen_t) — stream 0 serves the serial passes;
+  - the scalar event rolls (ejecta, offsets) stay on the stdlib `random` module and
+    numpy's legacy global generator, which seeded mode reseeds from the root — the helpers
+    that use them (pick_element, CloudField.spawn, ...) have no universe to hand.
+
+Philox is counter-based: streams with distinct keys are independent by construction, cheap
+to create, and safe to hand out one per thread. Universes spawn their seeds from the root in
+creation order, which seeded mode keeps deterministic.
+"""
+import random
+
+import numpy as np
+
+from sim.config import PHYSICS_SEED
+
+_root = None
+
+
+def seed(value=None):
+    """(Re)start the root stream. None = OS entropy (the normal, unrepeatable mode); an int
+    = seeded mode, which also reseeds `random` and numpy's legacy global generator."""
+    global _root
+    _root = np.random.SeedSequence(value)
+    if value is not None:
+        py_seq, np_seq = _root.spawn(2)
+        random.seed(int.from_bytes(py_seq.generate_state(4, np.uint64).tobytes(), 'little'))
+        np.random.seed(np_seq.generate_state(4, np.uint32))
+    return _root
+
+
+def ensure():
+    """Seed the root from PHYSICS_SEED unless it already is (physics.initialize_state calls
+    this before the first Big Bang draws anything; a heat-death restart keeps the stream)."""
+    if _root is None:
+        seed(PHYSICS_SEED)
+    return _root
+
+
+def spawn():
+    """A fresh child SeedSequence of the root."""
+    return ensure().spawn(1)[0]
+
+
+class UniverseRNG:
+    """One universe's streams: `gen` for numpy-side rolls, kernel(k) for the compiled passes."""
+
+    __slots__ = ('seq', 'gen', '_kernel')
+
+    def __init__(self, seq=None):
+        self.seq = seq if seq is not None else spawn()
+        self.gen = np.random.Generator(np.random.Philox(self.seq))
+        self._kernel = []
+
+    def kernel(self, k=1):
+        """The first k per-thread kernel streams (Philox bit generators), created on first use
+        and kept, so a thread's stream carries on across frames instead of being re-keyed."""
+        while len(self._kernel) < k:
+            self._kernel.append(np.random.Philox(self.seq.spawn(1)[0]))
+        return self._kernel[:k]
@@ -0,0 +1,91 @@
+"""Per-universe timed-phase scheduler.
+
+Timed stellar phases used to be advanced by countdown: every frame, every red-giant row had
+its timer decremented in a Python loop, every white dwarf aged, every magnetar's field ticked
+down. Now each universe carries a simulated clock and a TimerQueue of deadline heaps keyed by
+that clock: a phase registers its expiry once, and the per-frame cost is a heap peek per kind
+— work scales with the timers that fire, not with the population.
+
+  GIANT    — red-giant phases. The cloud field's `giant` column holds the row's absolute
+             expiry on this universe's clock (0 = main sequence), so it rides along with the
+             row through keep/select compaction and the `GIANT > 0` tests read as before.
+             Heap entries carry the cloud's stable id (rows move): a firing frame maps its
+             ids to rows with CloudField.rows_of, and a stale entry (the giant was merged
+             away, went supernova, or streamed out) no longer matches a live expiry.
+  DWARF    — white-dwarf cooling: fires when a dwarf has gone fully dark (a black dwarf).
+  MAGNETAR — magnetar field lifetime: fires when the field dies and the star settles.
+
+Object entries are validated when they fire (the object may have been eaten or merged since).
+Shock compression is not a deadline event — wavefronts re-arm it constantly and the countdown
+column decays inside the end-of-step sweep — so the queue only tracks `shock_until`, the
+latest moment any row can still be shocked, letting the triggered-merger pass skip its scan
+once every wavefront's compression has relaxed.
+"""
+import heapq
+import itertools
+
+GIANT = 'giant'
+DWARF = 'dwarf'
+MAGNETAR = 'magnetar'
+
+_SHOCK_SLACK = 1e-6
+
+
+class TimerQueue:
+    """Deadline heaps for one universe: schedule() registers, due() pops what has expired."""
+
+    __slots__ = ('clock', 'shock_until', '_heaps', '_seq')
+
+    def __init__(self):
+        self.clock = 0.0        # simulated seconds this universe has run (advanced by physics.step)
+        self.shock_until = 0.0  # no row is shocked past this clock time
+        self._heaps = {GIANT: [], DWARF: [], MAGNETAR: []}
+        self._seq = itertools.count()  # FIFO tie-break, and keeps objects out of comparisons
+
+    def advance(self, delta_time):
+        self.clock += delta_time
+
+    def schedule(self, kind, delay, obj=None):
+        """Register `obj`'s `kind` phase to expire `delay` seconds from now; returns the
+        absolute deadline."""
+        deadline = self.clock + delay
+        heapq.heappush(self._heaps[kind], (deadline, next(self._seq), obj))
+        return deadline
+
+    def schedule_at(self, kind, deadline, obj=None):
+        heapq.heappush(self._heaps[kind], (deadline, next(self._seq), obj))
+
+    def pending(self, kind):
+        """True when some `kind` deadline has passed (O(1))."""
+        heap = self._heaps[kind]
+        return bool(heap) and heap[0][0] <= self.clock
+
+    def due(self, kind):
+        """Pop every expired `kind` entry; returns their objects in deadline order."""
+        heap = self._heaps[kind]
+        fired = []
+        while heap and heap[0][0] <= self.clock:
+            fired.append(heapq.heappop(heap)[2])
+        return fired
+
+    def active(self, kind):
+        """True while any `kind` entry is queued (stale ones included — a cheap upper bound)."""
+        return bool(self._heaps[kind])
+
+    def shocked(self, duration):
+        """Wavefronts just (re)armed shock timers of `duration` seconds. The slack covers the
+        countdown column and the clock accumulating delta_time in different orders."""
+        self.shock_until = max(self.shock_until, self.clock + duration + _SHOCK_SLACK)
+
+    def any_shocked(self):
+        return self.clock <= self.shock_until
+
+    def adopt_rows(self, clouds, rows, src_clock):
+        """Rows moved in from another universe: rebase their giant deadlines from the source
+        clock onto this one and register them, and extend the shock horizon to cover them."""
+        for k in rows:
+            if clouds.giant[k] > 0.0:
+                clouds.giant[k] += self.clock - src_clock
+                self.schedule_at(GIANT, float(clouds.giant[k]), int(clouds.id[k]))
+            if clouds.shock[k] > 0.0:
+                self.shocked(float(clouds.shock[k]))